@@ -14,8 +14,10 @@ DATABASE_NAME = os.getenv("DATABASE_NAME", "arogo_multiling")
 # Redis Configuration
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
 
-# MongoDB Connection
-mongodb_client = AsyncIOMotorClient(MONGODB_URL)
+# MongoDB Connection. connect=False defers the connection and pymongo's
+# monitor threads to the first operation, so a gunicorn master can import
+# this module before forking workers (pymongo clients are not fork-safe)
+mongodb_client = AsyncIOMotorClient(MONGODB_URL, connect=False)
 database = mongodb_client[DATABASE_NAME]
 
 # Collections
@@ -23,24 +25,24 @@ consultations_collection = database.consultations
 translations_cache = database.translations_cache
 
 # Create indexes
-def setup_indexes():
-    """Setup database indexes"""
+async def setup_indexes():
+    """Setup database indexes; each process calls this after it has started (or forked)."""
     try:
         # Consultations collection indexes
-        consultations_collection.create_index([("consultation_id", ASCENDING)], unique=True)
-        consultations_collection.create_index([("user_details.email", ASCENDING)])
-        consultations_collection.create_index([("created_at", ASCENDING)])
-        consultations_collection.create_index([("status", ASCENDING)])
-        consultations_collection.create_index([("user_details.preferred_language", ASCENDING)])
-        consultations_collection.create_index([("user_details.interface_language", ASCENDING)])
+        await consultations_collection.create_index([("consultation_id", ASCENDING)], unique=True)
+        await consultations_collection.create_index([("user_details.email", ASCENDING)])
+        await consultations_collection.create_index([("created_at", ASCENDING)])
+        await consultations_collection.create_index([("status", ASCENDING)])
+        await consultations_collection.create_index([("user_details.preferred_language", ASCENDING)])
+        await consultations_collection.create_index([("user_details.interface_language", ASCENDING)])
         
          # Translation cache indexes
-        translations_cache.create_index([
+        await translations_cache.create_index([
             ("source_text", ASCENDING),
             ("source_language", ASCENDING),
             ("target_language", ASCENDING)
         ], unique=True)
-        translations_cache.create_index([("created_at", ASCENDING)])
+        await translations_cache.create_index([("created_at", ASCENDING)])
 
         print("Database indexes created successfully")
     except Exception as e:
@@ -48,6 +50,5 @@ def setup_indexes():
 
 # Redis Connection
 redis_client = Redis.from_url(REDIS_URL, decode_responses=True)
-
-# Initialize indexes when the application starts
-setup_indexes()
\ No newline at end of file
+# Binary-safe Redis connection for audio payloads
+redis_binary_client = Redis.from_url(REDIS_URL)
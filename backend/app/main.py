@@ -2,19 +2,32 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
-from app.config.database import mongodb_client, redis_client
+from app.config.database import mongodb_client, redis_client, setup_indexes
 from app.routes import (
     consultation,
     summary,
     report,
     speech,
+    audio,
+    jobs,
     websocket  # New separate file for WebSocket handling
 )
 from app.services.chat_service import ChatService
+from app.utils.model_registry import startup_state, warm_up_models
+from app.utils.tts_cache import TTSCache
+from app.utils.stt_cache import STTCache
+from app.utils.language_registry import language_registry
+from app.utils.resilience import resilience_status
+from app.utils.hedging import hedging_status
+from app.utils.job_queue import JobQueue
+from app.utils.report_renderer import render_pool
+from app.utils.label_bundle import load_bundles, system_messages
 from contextlib import asynccontextmanager
 from datetime import datetime
+import asyncio
 import logging
 import json
+import time
 
 # Configure logging
 logging.basicConfig(
@@ -23,6 +36,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+async def run_model_warmup():
+    """Load and warm local models off the event loop, then mark the app ready."""
+    await asyncio.to_thread(warm_up_models)
+    startup_state.completed_at = datetime.utcnow()
+    startup_state.ready = not startup_state.errors
+    logger.info(f"Model warm-up finished: {json.dumps(startup_state.to_dict())}")
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
@@ -30,12 +50,28 @@ async def lifespan(app: FastAPI):
         logger.info("Starting up the application...")
         
         # Test database connections
-        mongodb_client.admin.command('ping')
+        started = time.perf_counter()
+        await mongodb_client.admin.command('ping')
         redis_client.ping()
+        startup_state.record("database_ping", time.perf_counter() - started)
+        await setup_indexes()
         logger.info("Successfully connected to databases")
         
+        # Load and warm models in the background; /ready reports when done
+        app.state.warmup_task = asyncio.create_task(run_model_warmup())
+        
+        # Load the language capability matrix and keep it fresh
+        language_registry.start()
+        
+        # Precomputed report labels and system messages; lookups stay in memory
+        started = time.perf_counter()
+        logger.info(f"Label bundles loaded: {json.dumps(load_bundles())}")
+        startup_state.record("label_bundles", time.perf_counter() - started)
+        
         # Initialize WebSocket manager
+        started = time.perf_counter()
         websocket.initialize_manager()
+        startup_state.record("websocket_manager", time.perf_counter() - started)
         
     except Exception as e:
         logger.error(f"Startup Error: {str(e)}")
@@ -47,6 +83,12 @@ async def lifespan(app: FastAPI):
     try:
         logger.info("Shutting down the application...")
         
+        # Stop waiting on an unfinished warm-up
+        if not app.state.warmup_task.done():
+            app.state.warmup_task.cancel()
+        await language_registry.stop()
+        render_pool.shutdown()
+        
         # Close database connections
         mongodb_client.close()
         logger.info("Database connections closed")
@@ -108,6 +150,18 @@ app.include_router(
     tags=["speech"]
 )
 
+app.include_router(
+    audio.router,
+    prefix="/api/audio",
+    tags=["audio"]
+)
+
+app.include_router(
+    jobs.router,
+    prefix="/api/jobs",
+    tags=["jobs"]
+)
+
 # Include WebSocket routes
 app.include_router(websocket.router)
 
@@ -126,7 +180,8 @@ async def health_check():
             "language_services": {
                 "bhashini": "unknown",
                 "translation_cache": "unknown"
-            }
+            },
+            "caches": {}
         }
 
         # Check MongoDB
@@ -145,13 +200,30 @@ async def health_check():
             logger.error(f"Redis health check failed: {str(e)}")
             health_status["services"]["redis"] = f"error: {str(e)}"
 
-        # Check Bhashini Service
+        # Bhashini status from the capability registry (no network call)
+        language_status = language_registry.status()
+        health_status["language_services"]["bhashini"] = (
+            "connected" if language_status["source"] == "bhashini" and not language_status["last_error"]
+            else "degraded"
+        )
+        health_status["language_capabilities"] = language_status
+
+        # Breaker state and adaptive limits per upstream. An open breaker means
+        # turns are answered in degraded mode, which is not a reason to 503
+        health_status["dependencies"] = resilience_status()
+        health_status["hedging"] = hedging_status()
+        if health_status["dependencies"]["bhashini"]["breaker"]["state"] != "closed":
+            health_status["language_services"]["bhashini"] = "degraded"
+
+        # Cache metrics (informational, do not affect overall status)
+        health_status["caches"]["tts"] = TTSCache().get_stats()
+        health_status["caches"]["stt"] = STTCache().get_stats()
+
+        # Background job backlog per queue
         try:
-            bhashini_status = await speech.router.check_bhashini_status()
-            health_status["language_services"]["bhashini"] = bhashini_status
+            health_status["jobs"] = JobQueue().queue_lengths()
         except Exception as e:
-            logger.error(f"Bhashini service check failed: {str(e)}")
-            health_status["language_services"]["bhashini"] = f"error: {str(e)}"
+            logger.error(f"Job queue health check failed: {str(e)}")
 
         # Overall status check
         services_healthy = all(
@@ -182,6 +254,15 @@ async def health_check():
             }
         )
 
+# Readiness endpoint
+@app.get("/ready")
+async def readiness_check():
+    """Report whether local models are loaded and warmed."""
+    status = startup_state.to_dict()
+    if startup_state.ready:
+        return status
+    return JSONResponse(status_code=503, content=status)
+
 # Global error handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -193,24 +274,19 @@ async def global_exception_handler(request: Request, exc: Exception):
         "timestamp": datetime.utcnow().isoformat()
     }
     
-    # Add language-specific error messages if available
-    if hasattr(request.state, "language"):
-        try:
-            speech_processor = speech.router.speech_processor
-            translated_error = await speech_processor.bhashini_service.translate_text(
-                text=str(exc),
-                source_language="en",
-                target_language=request.state.language
-            )
-            error_response["translated_detail"] = translated_error["text"]
-        except:
-            pass
-            
+    # The detail is free text; send the catalog's generic message in the
+    # client's language instead of translating it on the error path
+    language = getattr(request.state, "language", None) or \
+        request.headers.get("Accept-Language", "en").split(",")[0].split("-")[0]
+    if language != "en":
+        error_response["translated_detail"] = system_messages.get("internal_error", language)
+
     return JSONResponse(
         status_code=500,
         content=error_response
     )
 
+# Development server; production runs gunicorn -c gunicorn.conf.py app.main:app
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
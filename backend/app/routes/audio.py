@@ -0,0 +1,103 @@
+# backend/app/routes/audio.py
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from app.utils.audio_blob_store import AudioBlobStore
+from typing import Iterator, Optional, Tuple
+import os
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+blob_store = AudioBlobStore()
+
+CHUNK_SIZE = 64 * 1024
+# Blobs are content-addressed, so a URL always refers to the same bytes
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single-range Range header into inclusive (start, end).
+
+    Returns None for headers we do not honour (multiple ranges, other
+    units), in which case the full blob is served. Raises ValueError for an
+    unsatisfiable range.
+    """
+    match = RANGE_PATTERN.match(header.strip())
+    if not match:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(0, size - length), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+
+def iter_file(path: str, start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes start..end (inclusive) of a file in fixed-size chunks."""
+    with open(path, "rb") as blob_file:
+        blob_file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = blob_file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+@router.get("/{blob_id}")
+async def get_audio(blob_id: str, request: Request):
+    """Stream a synthesized audio blob with range and cache support."""
+    path = blob_store.path_for(blob_id)
+    if not path or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="Audio not found")
+
+    size = os.path.getsize(path)
+    etag = f'"{blob_id.split(".")[0]}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": CACHE_CONTROL,
+        "Accept-Ranges": "bytes"
+    }
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    media_type = blob_store.content_type_for(blob_id)
+    range_header = request.headers.get("Range")
+    byte_range = None
+    if range_header and request.headers.get("If-Range", etag) == etag:
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{size}"}
+            )
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(iter_file(path, 0, size - 1), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        iter_file(path, start, end),
+        status_code=206,
+        media_type=media_type,
+        headers=headers
+    )
@@ -4,13 +4,21 @@ from app.models.consultation import ConsultationCreate
 from app.config.database import consultations_collection
 from app.services.chat_service import ChatService
 from datetime import datetime
+from typing import Optional
 import logging
 import uuid
 import json
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
-chat_service = ChatService()
+chat_service: Optional[ChatService] = None
+
+def get_chat_service() -> ChatService:
+    """Return the shared chat service, creating it on first message."""
+    global chat_service
+    if chat_service is None:
+        chat_service = ChatService()
+    return chat_service
 
 @router.post("/start")
 async def start_consultation(user_data: ConsultationCreate):
@@ -99,10 +107,10 @@ async def handle_message(consultation_id: str, message: dict):
         preferred_language = consultation["language_preferences"]["preferred"]
         
         # Process message through chat service
-        processed_response = await chat_service.process_message(
+        processed_response = await get_chat_service().process_message(
             consultation_id=consultation_id,
             message=message.get("content", ""),
-            source_language=message.get("language", "en"),
+            source_language=message.get("language"),
             target_language=preferred_language
         )
 
@@ -0,0 +1,17 @@
+# backend/app/routes/jobs.py
+from fastapi import APIRouter, HTTPException
+from app.utils.job_queue import JobQueue
+import app.services.jobs  # noqa: F401 (registers the tasks)
+import logging
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+@router.get("/{job_id}")
+async def get_job_status(job_id: str):
+    """Poll a background job; result is set once status is succeeded."""
+    job = JobQueue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return job
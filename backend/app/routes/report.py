@@ -1,58 +1,142 @@
 # backend/app/routes/report.py
-from fastapi import APIRouter, HTTPException
-from fastapi.responses import StreamingResponse
-from app.config.database import consultations_collection
-from app.utils.report_generator import MultilingualReportGenerator
-from app.routes.summary import get_consultation_summary
-import io
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse, JSONResponse, Response
+from app.services.report_service import (
+    report_store,
+    load_report_inputs,
+    find_cached_report,
+    render_consultation_report,
+    report_digest,
+    UnsupportedReportLanguage
+)
+from app.services.summary_service import ConsultationNotFound
+from app.utils.job_queue import JobQueue, SUCCEEDED, FAILED
+from app.utils.report_store import ReportStore
+from typing import Optional
+import app.services.jobs  # noqa: F401 (registers the tasks)
 import logging
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-# Initialize the report generator
-report_generator = MultilingualReportGenerator()
+# Stored files never change; the consultation URL can point at a newer summary
+FILE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+LATEST_CACHE_CONTROL = "private, no-cache"
+
+
+def serve_report(request: Request, report: dict, cache_control: str) -> Response:
+    """Send a stored report, answering 304 when the client's copy is current."""
+    headers = {"ETag": report["etag"], "Cache-Control": cache_control}
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and (if_none_match.strip() == "*"
+                          or report["etag"] in [tag.strip() for tag in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    path = report_store.path_for(report["consultation_id"], report["report_key"], report["language"])
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        headers={
+            **headers,
+            "Content-Disposition": f"attachment; filename=consultation-report-{report['consultation_id']}.pdf"
+        }
+    )
+
+
+def enqueue_report(consultation_id: str, summary: Optional[dict], language: str) -> JSONResponse:
+    """Queue report rendering and answer 202 with the job to poll."""
+    # Until the summary exists, concurrent requests share one pending job
+    version = report_digest(summary, language) if summary is not None else "pending"
+    job = JobQueue().enqueue(
+        "render_report",
+        {"consultation_id": consultation_id, "language": language},
+        key=f"{consultation_id}:{language}:{version}"
+    )
+    return JSONResponse(
+        status_code=202,
+        content={"job": job, "status_url": f"/api/report/jobs/{job['id']}"}
+    )
+
+
+@router.post("/{consultation_id}")
+async def start_report(consultation_id: str, language: Optional[str] = None):
+    """Start generating a PDF report in the background.
+
+    Returns 202 with a job to poll at /api/report/jobs/{job_id}, or 200
+    with the download URL if this summary's report is already stored.
+    """
+    try:
+        _, summary, language = await load_report_inputs(consultation_id, language)
+        cached = find_cached_report(consultation_id, summary, language)
+        if cached:
+            return {"status": SUCCEEDED, "report": cached}
+        return enqueue_report(consultation_id, summary, language)
+
+    except ConsultationNotFound:
+        raise HTTPException(status_code=404, detail="Consultation not found")
+    except UnsupportedReportLanguage as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Error starting report job: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/jobs/{job_id}")
+async def get_report_job(job_id: str, request: Request):
+    """Poll a report job; once it has succeeded this downloads the PDF."""
+    job = JobQueue().get(job_id)
+    if job is None or job["name"] != "render_report":
+        raise HTTPException(status_code=404, detail="Report job not found or expired")
+    if job["status"] == SUCCEEDED:
+        return serve_report(request, job["result"], FILE_CACHE_CONTROL)
+    if job["status"] == FAILED:
+        return JSONResponse(status_code=500, content={"job": job})
+    return JSONResponse(status_code=202, content={"job": job})
+
+
+@router.get("/{consultation_id}/files/{filename}")
+async def get_report_file(consultation_id: str, filename: str, request: Request):
+    """Download a stored report by its immutable key: <report_key>.<language>.pdf."""
+    parts = filename.split(".")
+    if len(parts) != 3 or parts[2] != "pdf":
+        raise HTTPException(status_code=404, detail="Report not found")
+    digest, language = parts[0], parts[1]
+    if not report_store.exists(consultation_id, digest, language):
+        raise HTTPException(status_code=404, detail="Report not found")
+    return serve_report(request, {
+        "consultation_id": consultation_id,
+        "report_key": digest,
+        "language": language,
+        "etag": ReportStore.etag_for(digest, language)
+    }, FILE_CACHE_CONTROL)
+
 
 @router.get("/{consultation_id}")
-async def get_consultation_report(consultation_id: str):
-    """Generate and download PDF report."""
+async def get_consultation_report(
+    consultation_id: str,
+    request: Request,
+    language: Optional[str] = None,
+    background: bool = False
+):
+    """Download the PDF report for the consultation's current summary.
+
+    A stored report is served immediately (with ETag / If-None-Match).
+    Otherwise it is rendered inline, or with background=true queued for a
+    worker and answered with 202 and the job to poll.
+    """
     try:
-        consultation = consultations_collection.find_one(
-            {"consultation_id": consultation_id}
-        )
-        
-        if not consultation:
-            raise HTTPException(status_code=404, detail="Consultation not found")
-        
-        try:
-            # Get or generate summary
-            if "diagnosis_summary" not in consultation:
-                summary = await get_consultation_summary(consultation_id)
-            else:
-                summary = consultation["diagnosis_summary"]
-            
-            # Ensure symptoms data is available
-            if "symptoms" not in summary and "diagnosis" in summary:
-                summary["symptoms"] = summary["diagnosis"].get("symptoms", [])
-            
-            # Get user's preferred language for the report
-            preferred_language = consultation["language_preferences"]["preferred"]
-            
-            # Generate PDF in preferred language
-            pdf_buffer = await report_generator.create_pdf_report(summary, preferred_language)
-            
-            return StreamingResponse(
-                io.BytesIO(pdf_buffer.getvalue()),
-                media_type="application/pdf",
-                headers={
-                    "Content-Disposition": f"attachment; filename=consultation-report-{consultation_id}.pdf"
-                }
-            )
-            
-        except Exception as report_error:
-            logger.error(f"Error generating PDF report: {str(report_error)}")
-            raise HTTPException(status_code=500, detail=str(report_error))
-            
+        _, summary, language = await load_report_inputs(consultation_id, language)
+        report = find_cached_report(consultation_id, summary, language)
+        if report is None:
+            if background:
+                return enqueue_report(consultation_id, summary, language)
+            report = await render_consultation_report(consultation_id, language)
+        return serve_report(request, report, LATEST_CACHE_CONTROL)
+
+    except ConsultationNotFound:
+        raise HTTPException(status_code=404, detail="Consultation not found")
+    except UnsupportedReportLanguage as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Error handling report request: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
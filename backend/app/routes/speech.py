@@ -1,17 +1,44 @@
 # backend/app/routes/speech.py
-from fastapi import APIRouter, UploadFile, File, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 from typing import Optional
 from app.utils.speech_processor import MultilingualSpeechProcessor
+from app.utils.audio_upload import UploadRejected
 import logging
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-@router.post("/speech-to-text")
+# Uploads are parsed from the raw request stream, so document the form here
+AUDIO_UPLOAD_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["audio"],
+                    "properties": {"audio": {"type": "string", "format": "binary"}}
+                }
+            }
+        }
+    }
+}
+
+def upload_rejected(error: UploadRejected) -> HTTPException:
+    logger.warning(f"Audio upload rejected ({error.status_code}): {str(error)}")
+    return HTTPException(
+        status_code=error.status_code,
+        detail={
+            "error": str(error),
+            "type": "upload_rejected"
+        }
+    )
+
+@router.post("/speech-to-text", openapi_extra=AUDIO_UPLOAD_BODY)
 async def speech_to_text(
-    audio: UploadFile = File(...),
+    request: Request,
     source_language: Optional[str] = None,
     enable_auto_detect: bool = True
 ):
@@ -20,22 +47,21 @@ async def speech_to_text(
         logger.info("Receiving audio file for speech-to-text conversion")
         logger.info(f"Source language: {source_language}, Auto-detect: {enable_auto_detect}")
         
-        contents = await audio.read()
-        
-        if not contents:
-            raise ValueError("Empty audio file received")
-            
-        logger.info(f"Received audio file of size: {len(contents)} bytes")
-        logger.info(f"Audio content type: {audio.content_type}")
-        
         # Initialize multilingual speech processor
         speech_processor = MultilingualSpeechProcessor()
+
+        # Fingerprint the upload as it arrives; it is decoded only on a cache miss
+        upload = await speech_processor.ingest_upload(request)
+            
+        logger.info(f"Received audio file of size: {upload.size} bytes")
+        logger.info(f"Audio content type: {upload.content_type}")
         
         # Process speech to text with language handling
         result = await speech_processor.process_speech_to_text(
-            audio_data=contents,
+            audio_data=upload,
             preferred_language=source_language,
-            enable_auto_detect=enable_auto_detect
+            enable_auto_detect=enable_auto_detect,
+            fingerprint=upload.fingerprint
         )
         
         if not result.get("text"):
@@ -55,10 +81,14 @@ async def speech_to_text(
                     "confidence": result.get("language", {}).get("confidence", 1.0),
                 },
                 "confidence": result.get("confidence", 1.0),
+                "audio": result.get("audio"),
+                "cached": result.get("cached", False),
                 "timestamp": result.get("timestamp"),
                 "was_auto_detected": result.get("language", {}).get("was_auto_detected", False)
             }
         )
+    except UploadRejected as ur:
+        raise upload_rejected(ur)
     except ValueError as ve:
         logger.error(f"Validation error in speech-to-text: {str(ve)}")
         raise HTTPException(
@@ -92,9 +122,14 @@ async def text_to_speech(
     text: str,
     target_language: str,
     voice_gender: Optional[str] = "female",
-    voice_style: Optional[str] = None
+    voice_style: Optional[str] = None,
+    include_audio_data: bool = False
 ):
-    """Convert text to speech in specified language."""
+    """Convert text to speech in specified language.
+
+    The audio is returned as a URL under /api/audio; set include_audio_data
+    to also receive it inline as base64.
+    """
     try:
         logger.info("Receiving text-to-speech request")
         logger.info(f"Target language: {target_language}, Voice gender: {voice_gender}")
@@ -110,10 +145,11 @@ async def text_to_speech(
             text=text,
             target_language=target_language,
             voice_gender=voice_gender,
-            voice_style=voice_style
+            voice_style=voice_style,
+            include_audio_data=include_audio_data
         )
         
-        if not result.get("audio_data"):
+        if not result.get("audio_url"):
             raise ValueError("No audio was generated from the text")
             
         logger.info("Successfully generated speech audio")
@@ -122,6 +158,7 @@ async def text_to_speech(
         return JSONResponse(
             content={
                 "status": "success",
+                "audio_url": result["audio_url"],
                 "audio_data": result["audio_data"],
                 "language": {
                     "code": result["language"],
@@ -165,9 +202,9 @@ async def text_to_speech(
             }
         )
 
-@router.post("/translate-speech")
+@router.post("/translate-speech", openapi_extra=AUDIO_UPLOAD_BODY)
 async def translate_speech(
-    audio: UploadFile = File(...),
+    request: Request,
     target_language: str = Query(..., description="Target language for translation"),
     source_language: Optional[str] = None,
     auto_detect: bool = True,
@@ -180,24 +217,23 @@ async def translate_speech(
         logger.info("Receiving speech translation request")
         logger.info(f"Source language: {source_language}, Target language: {target_language}")
         
-        contents = await audio.read()
-        
-        if not contents:
-            raise ValueError("Empty audio file received")
-            
-        logger.info(f"Received audio file of size: {len(contents)} bytes")
-        logger.info(f"Audio content type: {audio.content_type}")
-        
         # Initialize speech processor
         speech_processor = MultilingualSpeechProcessor()
+
+        # Fingerprint the upload as it arrives; it is decoded only on a cache miss
+        upload = await speech_processor.ingest_upload(request)
+            
+        logger.info(f"Received audio file of size: {upload.size} bytes")
+        logger.info(f"Audio content type: {upload.content_type}")
         
         # Process speech translation
         result = await speech_processor.translate_speech(
-            audio_data=contents,
+            audio_data=upload,
             source_language=source_language,
             target_language=target_language,
             auto_detect=auto_detect,
-            voice_gender=voice_gender
+            voice_gender=voice_gender,
+            fingerprint=upload.fingerprint
         )
         
         if not result.get("translation", {}).get("text"):
@@ -220,7 +256,7 @@ async def translate_speech(
                 },
                 "translation": {
                     "text": result["translation"]["text"],
-                    "audio": result["translation"]["audio"],
+                    "audio_url": result["translation"]["audio_url"],
                     "language": {
                         "code": result["translation"]["language"],
                         "name": result["translation"]["language_name"]
@@ -230,10 +266,12 @@ async def translate_speech(
                     "was_auto_detected": auto_detect and source_language is None,
                     "voice_gender": voice_gender,
                     "timestamp": datetime.utcnow().isoformat(),
-                    "audio_format": audio.content_type
+                    "audio_format": upload.content_type
                 }
             }
         )
+    except UploadRejected as ur:
+        raise upload_rejected(ur)
     except ValueError as ve:
         logger.error(f"Validation error in speech translation: {str(ve)}")
         raise HTTPException(
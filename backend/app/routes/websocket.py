@@ -5,9 +5,12 @@ from app.utils.symptom_analyzer import SymptomAnalyzer
 from app.config.database import redis_client, consultations_collection
 from app.services.chat_service import ChatService
 from app.utils.speech_processor import MultilingualSpeechProcessor
+from app.services.speech_stream_service import StreamingTranscriptionSession
+from app.utils.ws_protocol import FrameCodec, accept_with_codec, wants_audio_segments
+from app.utils.label_bundle import system_messages
 import json
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 import logging
 import asyncio
 from fastapi import APIRouter
@@ -20,6 +23,9 @@ logger = logging.getLogger(__name__)
 class MultilingualConnectionManager:
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
+        self.codecs: Dict[str, FrameCodec] = {}
+        # Connections whose client plays audio_segment frames
+        self.audio_segment_clients: Set[str] = set()
         self.chat_service = ChatService()
         self.speech_processor = MultilingualSpeechProcessor()
         self.response_validator = AIResponseValidator()
@@ -30,9 +36,12 @@ class MultilingualConnectionManager:
     async def connect(self, websocket: WebSocket, consultation_id: str):
         """Establish WebSocket connection with language support."""
         try:
-            await websocket.accept()
+            codec = await accept_with_codec(websocket)
             self.active_connections[consultation_id] = websocket
-            logger.info(f"WebSocket connected: {consultation_id}")
+            self.codecs[consultation_id] = codec
+            if wants_audio_segments(websocket):
+                self.audio_segment_clients.add(consultation_id)
+            logger.info(f"WebSocket connected: {consultation_id} ({codec.name})")
 
             # Get user's language preference
             consultation = await consultations_collection.find_one(
@@ -80,7 +89,7 @@ class MultilingualConnectionManager:
                 """
 
             # Generate welcome message
-            response =  self.chat_service.ai_config.model.generate_content(prompt)
+            response = await self.chat_service.ai_config.generate(prompt)
             welcome_text = response.text if hasattr(response, 'text') else str(response)
             welcome_text = welcome_text.strip()
 
@@ -94,23 +103,23 @@ class MultilingualConnectionManager:
                 welcome_text = translated["text"]
 
             # Generate audio if needed
-            audio_data = None
+            audio_url = None
             if consultation.get("user_details", {}).get("enable_audio", True):
                 audio_result = await self.speech_processor.process_text_to_speech(
                     text=welcome_text,
                     target_language=language
                 )
-                audio_data = audio_result.get("audio_data")
+                audio_url = audio_result.get("audio_url")
 
             welcome_message = {
                 "type": "welcome",
                 "content": welcome_text,
                 "language": language,
-                "audio": audio_data,
+                "audio_url": audio_url,
                 "timestamp": datetime.utcnow().isoformat()
             }
 
-            await self.active_connections[consultation_id].send_json(welcome_message)
+            await self.send(consultation_id, welcome_message)
             logger.info(f"Welcome message sent for {consultation_id} in {language}")
 
         except Exception as e:
@@ -123,18 +132,26 @@ class MultilingualConnectionManager:
         source_language: Optional[str] = None
     ) -> dict:
         """Process message with multilingual support."""
+        target_language = "en"
         try:
             consultation = await consultations_collection.find_one(
                 {"consultation_id": consultation_id}
             )
             target_language = consultation.get("language_preferences", {}).get("preferred", "en")
+
+            # Clients that play audio_segment frames get the reply streamed
+            # sentence by sentence after the text; others get one audio_url
+            enable_audio = consultation.get("user_details", {}).get("enable_audio", True)
+            audio_streaming = enable_audio and consultation_id in self.audio_segment_clients
             
             # Process through chat service
             response = await self.chat_service.process_message(
                 consultation_id=consultation_id,
                 message=message,
-                source_language=source_language or target_language,
-                target_language=target_language
+                source_language=source_language,
+                target_language=target_language,
+                synthesize_audio=enable_audio and not audio_streaming,
+                on_deferred=lambda frame: self.push_follow_up(consultation_id, frame)
             )
             
             # Validate response
@@ -144,30 +161,13 @@ class MultilingualConnectionManager:
             )
             
             if not is_valid:
-                error_message = "I need to rephrase. Please repeat your message."
-                if target_language != "en":
-                    translated_error = await self.speech_processor.bhashini_service.translate_text(
-                        text=error_message,
-                        source_language="en",
-                        target_language=target_language
-                    )
-                    error_message = translated_error["text"]
                 return {
                     "status": "error",
-                    "message": error_message,
+                    "message": system_messages.get("rephrase", target_language),
                     "error": error_msg,
                     "language": target_language
                 }
 
-            # Generate audio for response
-            audio_data = None
-            if consultation.get("user_details", {}).get("enable_audio", True):
-                audio_result = await self.speech_processor.process_text_to_speech(
-                    text=response["response"],
-                    target_language=target_language
-                )
-                audio_data = audio_result.get("audio_data")
-
             return {
                 "status": "success",
                 "message": response["response"],
@@ -175,13 +175,17 @@ class MultilingualConnectionManager:
                 "confidence_scores": processed_response['confidence_scores'],
                 "requires_emergency": processed_response['requires_emergency'],
                 "language": {
-                    "source": source_language or target_language,
+                    "source": response["detected_language"]["language"],
                     "target": target_language,
                     "detected": response.get("detected_language")
                 },
-                "audio": audio_data,
+                "audio_url": response.get("audio_url"),
+                "audio_streaming": audio_streaming,
                 "symptoms": response.get("symptoms", []),
                 "recommendations": response.get("recommendations", {}),
+                "turn_id": response.get("turn_id"),
+                "degraded": response.get("degraded", []),
+                "deferred": response.get("deferred", []),
                 "timestamp": datetime.utcnow().isoformat()
             }
 
@@ -189,13 +193,68 @@ class MultilingualConnectionManager:
             logger.error(f"Error processing message: {str(e)}")
             return {
                 "status": "error",
-                "message": "Processing error. Please try again.",
+                "message": system_messages.get("processing_error", target_language),
                 "error": str(e),
                 "language": target_language
             }
 
+    def codec_for(self, consultation_id: str) -> FrameCodec:
+        return self.codecs.get(consultation_id) or FrameCodec()
+
+    async def send(self, consultation_id: str, message: dict):
+        """Send a frame using the protocol negotiated for the connection."""
+        await self.codec_for(consultation_id).send(self.active_connections[consultation_id], message)
+
+    async def receive(self, consultation_id: str) -> dict:
+        """Receive and decode the next client frame."""
+        return await self.codec_for(consultation_id).receive(self.active_connections[consultation_id])
+
+    async def push_follow_up(self, consultation_id: str, frame: dict):
+        """Deliver the result of a deferred stage if the client is still connected."""
+        if consultation_id in self.active_connections:
+            await self.send(consultation_id, frame)
+
+    async def stream_audio(self, consultation_id: str, text: str, language: str, turn_id: Optional[str] = None):
+        """Send synthesized reply audio as ordered per-sentence frames.
+
+        Each frame carries the turn_id of the reply it belongs to. Binary
+        connections get the audio bytes inline; JSON connections fetch it
+        from the audio URL.
+        """
+        binary = self.codec_for(consultation_id).binary
+        try:
+            async for segment in self.speech_processor.stream_text_to_speech(
+                text=text,
+                target_language=language
+            ):
+                frame = {
+                    "type": "audio_segment",
+                    "turn_id": turn_id,
+                    "index": segment["index"],
+                    "total": segment["total"],
+                    "text": segment["text"],
+                    "audio_url": segment["audio_url"],
+                    "language": language,
+                    "final": segment["index"] == segment["total"] - 1,
+                    "error": segment["error"]
+                }
+                if binary:
+                    frame["audio"] = segment["audio_content"]
+                await self.send(consultation_id, frame)
+        except Exception as e:
+            logger.error(f"Error streaming audio: {str(e)}")
+            await self.send(consultation_id, {
+                "type": "audio_segment",
+                "turn_id": turn_id,
+                "audio_url": None,
+                "final": True,
+                "error": str(e)
+            })
+
     async def disconnect(self, consultation_id: str):
         """Handle disconnection cleanup."""
+        self.codecs.pop(consultation_id, None)
+        self.audio_segment_clients.discard(consultation_id)
         if consultation_id in self.active_connections:
             del self.active_connections[consultation_id]
             if consultation_id in self.reconnect_attempts:
@@ -236,8 +295,8 @@ class MultilingualConnectionManager:
         except Exception as e:
             logger.error(f"Error saving disconnection state: {str(e)}")
 
-# Global manager instance
-manager = MultilingualConnectionManager()
+# Global manager instance, created by initialize_manager() during startup
+manager: Optional[MultilingualConnectionManager] = None
 
 def initialize_manager():
     """Initialize the WebSocket connection manager."""
@@ -248,15 +307,28 @@ def initialize_manager():
 # Create WebSocket endpoint
 @router.websocket("/ws/{consultation_id}")
 async def websocket_endpoint(websocket: WebSocket, consultation_id: str):
-    """WebSocket endpoint for multilingual chat."""
+    """WebSocket endpoint for multilingual chat.
+
+    Frames are JSON by default. A client offering the arogo.msgpack.v1
+    subprotocol (or connecting with ?protocol=msgpack) gets MessagePack
+    frames, with reply audio sent as raw bytes in audio_segment frames.
+    """
     manager = MultilingualConnectionManager()
     try:
         await manager.connect(websocket, consultation_id)
         
         while True:
-            data = await websocket.receive_text()
             try:
-                message_data = json.loads(data)
+                message_data = await manager.receive(consultation_id)
+            except ValueError as e:
+                logger.error(f"Invalid message frame: {str(e)}")
+                await manager.send(consultation_id, {
+                    "type": "error",
+                    "message": "Invalid message format"
+                })
+                continue
+
+            try:
                 source_language = message_data.get('language')
                 
                 # Process message
@@ -266,41 +338,21 @@ async def websocket_endpoint(websocket: WebSocket, consultation_id: str):
                     source_language=source_language
                 )
                 
-                # Update consultation analysis
-                await manager.chat_service.update_chat_history(
-                    consultation_id=consultation_id,
-                    messages=[{
-                        "type": "user",
-                        "content": message_data.get('content', ''),
-                        "language": source_language,
-                        "timestamp": datetime.utcnow().isoformat()
-                    }, {
-                        "type": "bot",
-                        "content": response["message"],
-                        "language": response["language"]["target"],
-                        "timestamp": datetime.utcnow().isoformat(),
-                        "analysis": {
-                            "symptoms": response.get("symptoms", []),
-                            "recommendations": response.get("recommendations", {}),
-                            "confidence": response.get("confidence_scores", {}),
-                            "requires_emergency": response.get("requires_emergency", False)
-                        }
-                    }]
-                )
-                
-                await websocket.send_json(response)
+                await manager.send(consultation_id, response)
+
+                if response.get("audio_streaming"):
+                    await manager.stream_audio(
+                        consultation_id,
+                        response["message"],
+                        response["language"]["target"],
+                        response.get("turn_id")
+                    )
                 
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON: {str(e)}")
-                await websocket.send_json({
-                    "type": "error",
-                    "message": "Invalid message format"
-                })
             except Exception as e:
                 logger.error(f"Message processing error: {str(e)}")
-                await websocket.send_json({
+                await manager.send(consultation_id, {
                     "type": "error",
-                    "message": "Error processing message",
+                    "message": system_messages.get("message_error", message_data.get('language') or "en"),
                     "error": str(e)
                 })
                 
@@ -312,4 +364,83 @@ async def websocket_endpoint(websocket: WebSocket, consultation_id: str):
         try:
             await websocket.close()
         except:
-            pass
\ No newline at end of file
+            pass
+
+
+@router.websocket("/ws/{consultation_id}/audio")
+async def audio_stream_endpoint(websocket: WebSocket, consultation_id: str):
+    """WebSocket endpoint for streaming speech-to-text.
+
+    Protocol: an optional text frame {"type": "start", "language": "hi",
+    "format": "webm"}, then binary frames with encoded audio chunks, then
+    {"type": "end"}. Partial transcripts are pushed as segments finish and a
+    final {"type": "transcript"} frame follows "end". The socket can carry
+    several utterances in sequence.
+    """
+    await websocket.accept()
+    speech_processor = MultilingualSpeechProcessor()
+    session: Optional[StreamingTranscriptionSession] = None
+
+    consultation = await consultations_collection.find_one(
+        {"consultation_id": consultation_id}
+    )
+    default_language = (consultation or {}).get("language_preferences", {}).get("preferred", "en")
+
+    async def open_session(language: str, input_format: str) -> StreamingTranscriptionSession:
+        new_session = StreamingTranscriptionSession(
+            speech_processor=speech_processor,
+            send_json=websocket.send_json,
+            language=language,
+            input_format=input_format
+        )
+        await new_session.start()
+        return new_session
+
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            if message.get("bytes") is not None:
+                if session is None:
+                    session = await open_session(default_language, "webm")
+                await session.feed(message["bytes"])
+                continue
+
+            try:
+                control = json.loads(message.get("text") or "{}")
+            except json.JSONDecodeError:
+                await websocket.send_json({"type": "error", "message": "Invalid message format"})
+                continue
+
+            if control.get("type") == "start":
+                if session is not None:
+                    await session.aclose()
+                session = await open_session(
+                    control.get("language") or default_language,
+                    control.get("format", "webm")
+                )
+                await websocket.send_json({"type": "ready", "language": session.language})
+            elif control.get("type") == "end" and session is not None:
+                result = await session.finish()
+                session = None
+                await websocket.send_json(result)
+
+    except WebSocketDisconnect:
+        pass
+    except Exception as e:
+        logger.error(f"Audio stream error: {str(e)}")
+        try:
+            language = session.language if session is not None else default_language
+            await websocket.send_json({
+                "type": "error",
+                "message": system_messages.get("audio_stream_error", language),
+                "error": str(e)
+            })
+        except:
+            pass
+    finally:
+        if session is not None:
+            await session.aclose()
+        logger.info(f"Audio stream closed: {consultation_id}")
@@ -1,12 +1,20 @@
 # backend/app/utils/bhashini_service.py
 from typing import Dict, Optional
 import aiohttp
+import base64
 import json
 import os
 from dotenv import load_dotenv
+from app.utils.resilience import resilient
+from app.utils.hedging import translation_hedge
 
 load_dotenv()
 
+# Per-operation upstream timeouts; speech payloads take longer than text
+STT_TIMEOUT_SECONDS = float(os.getenv("BHASHINI_STT_TIMEOUT_SECONDS", "15"))
+TTS_TIMEOUT_SECONDS = float(os.getenv("BHASHINI_TTS_TIMEOUT_SECONDS", "10"))
+TRANSLATE_TIMEOUT_SECONDS = float(os.getenv("BHASHINI_TRANSLATE_TIMEOUT_SECONDS", "5"))
+
 class BhashiniService:
     def __init__(self):
         self.api_key = os.getenv("BHASHINI_API_KEY")
@@ -49,6 +57,7 @@ class BhashiniService:
                 raise Exception(f"Auth failed with status {response.status}")
 
 
+    @resilient("bhashini", retry=False)
     async def get_supported_languages(self) -> Dict:
         """Get supported languages from Bhashini API."""
         token = await self.get_auth_token()
@@ -67,8 +76,9 @@ class BhashiniService:
                 return {"stt": [], "tts": [], "translation": []}
     
     
-    async def speech_to_text(self, audio_data: bytes, source_language: str) -> str:
-        """Convert speech to text using Bhashini API."""
+    @resilient("bhashini", timeout=STT_TIMEOUT_SECONDS)
+    async def speech_to_text(self, audio_data: bytes, source_language: str, sample_rate: int = 16000) -> str:
+        """Convert 16-bit PCM WAV speech to text using Bhashini API."""
         token = await self.get_auth_token()
         
         async with aiohttp.ClientSession() as session:
@@ -76,10 +86,11 @@ class BhashiniService:
             
             # Prepare request payload
             payload = {
-                "audioContent": audio_data.decode('utf-8'),
+                "audioContent": base64.b64encode(audio_data).decode('utf-8'),
                 "config": {
                     "languageCode": source_language,
-                    "audioEncoding": "WEBM_OPUS"
+                    "audioEncoding": "LINEAR16",
+                    "sampleRateHertz": sample_rate
                 }
             }
             
@@ -94,6 +105,7 @@ class BhashiniService:
                     return data["transcript"]
                 raise Exception(f"Speech to text failed: {response.status}")
 
+    @resilient("bhashini", timeout=TTS_TIMEOUT_SECONDS)
     async def text_to_speech(self, text: str, target_language: str, gender: str = "FEMALE", style: Optional[str] = None) -> bytes:
         """Convert text to speech using Bhashini API."""
         token = await self.get_auth_token()
@@ -127,8 +139,14 @@ class BhashiniService:
         text: str, 
         source_language: str, 
         target_language: str
-    ) -> str:
-        """Translate text between languages."""
+    ) -> Dict:
+        """Translate text between languages, hedging slow calls when enabled."""
+        return await translation_hedge.run(
+            lambda: self._translate_once(text, source_language, target_language)
+        )
+
+    @resilient("bhashini", timeout=TRANSLATE_TIMEOUT_SECONDS)
+    async def _translate_once(self, text: str, source_language: str, target_language: str) -> Dict:
         token = await self.get_auth_token()
         
         async with aiohttp.ClientSession() as session:
@@ -148,5 +166,5 @@ class BhashiniService:
             async with session.post(url, json=payload, headers=headers) as response:
                 if response.status == 200:
                     data = await response.json()
-                    return data["translation"]
+                    return {"text": data["translation"], "confidence": data.get("confidence", 1.0)}
                 raise Exception(f"Translation failed: {response.status}")
\ No newline at end of file
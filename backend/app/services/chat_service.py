@@ -3,12 +3,35 @@ from app.utils.ai_config import GeminiConfig
 from app.utils.symptom_analyzer import SymptomAnalyzer
 from app.config.database import redis_client, consultations_collection
 from app.utils.speech_processor import MultilingualSpeechProcessor
+from app.utils.symptom_state import SymptomState
+from app.utils.language_identifier import get_language_identifier
+from app.utils.resilience import DependencyUnavailable
+from app.utils.turn_deadline import TurnDeadline, DEFERRED_STAGE_TIMEOUT_SECONDS
+from app.utils.label_bundle import SYSTEM_MESSAGES, system_messages
+from app.utils.context_compactor import needs_compaction
+from app.utils.job_queue import JobQueue
+import app.services.jobs  # noqa: F401 (registers the tasks)
+from typing import Awaitable, Callable, Dict, Optional
+import asyncio
 import json
 import logging
+import uuid
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Recorded in English when Gemini is unavailable; the user gets the
+# catalog translation, so the fallback needs no translation call
+LLM_FALLBACK_RESPONSE = SYSTEM_MESSAGES["llm_unavailable"]
+TREATMENT_FALLBACK = {
+    "medications": ["Consult doctor for appropriate medication"],
+    "homeRemedies": ["Rest and hydration recommended"]
+}
+EMERGENCY_PREFIX = "⚠️ {warning}\n\n"
+
+# Deferred stages run after the turn returns; keep references so they are not collected
+_background_tasks = set()
+
 class ChatService:
     def __init__(self):
         self.ai_config = GeminiConfig()
@@ -26,34 +49,92 @@ class ChatService:
             logger.error(f"Error retrieving context: {e}")
             return []
 
-    async def store_conversation_context(self, consultation_id: str, context: list):
-        """Store conversation context in Redis."""
+    async def get_symptom_state(self, consultation_id: str, context: list) -> SymptomState:
+        """Retrieve the incremental symptom state, rebuilding it for older sessions."""
         try:
-            redis_client.setex(
+            state = redis_client.get(f"symptom_state_{consultation_id}")
+            if state:
+                return SymptomState.from_dict(json.loads(state))
+        except Exception as e:
+            logger.error(f"Error retrieving symptom state: {e}")
+        return SymptomState.from_context(context, self.symptom_analyzer.extract_message_symptoms)
+
+    async def store_conversation_context(self, consultation_id: str, context: list, state: SymptomState = None):
+        """Store conversation context (and its symptom state) in Redis."""
+        try:
+            pipe = redis_client.pipeline()
+            pipe.setex(
                 f"chat_context_{consultation_id}",
                 self.conversation_expiry,
                 json.dumps(context)
             )
+            if state is not None:
+                pipe.setex(
+                    f"symptom_state_{consultation_id}",
+                    self.conversation_expiry,
+                    json.dumps(state.to_dict())
+                )
+            pipe.execute()
         except Exception as e:
             logger.error(f"Error storing context: {e}")
 
-    async def process_message(self, consultation_id: str, message: str, source_language: str = "en") -> dict:
+    async def process_message(
+        self,
+        consultation_id: str,
+        message: str,
+        source_language: Optional[str] = None,
+        target_language: Optional[str] = None,
+        synthesize_audio: bool = True,
+        deadline: Optional[TurnDeadline] = None,
+        on_deferred: Optional[Callable[[dict], Awaitable[None]]] = None
+    ) -> dict:
+        """Run one chat turn within a latency budget.
+
+        Safety validation is required and runs alongside translation and
+        TTS. Optional stages (TTS, then treatment recommendations with
+        whatever budget is left) that do not fit are deferred when
+        on_deferred is given: they finish in the background and their
+        results are pushed through it as follow_up frames. Without a sink
+        they are skipped.
+        """
+        deadline = deadline or TurnDeadline()
+        turn_id = uuid.uuid4().hex
         try:
-            # Get current context
+            # Get current context and its running symptom state
             context = await self.get_conversation_context(consultation_id)
+            state = await self.get_symptom_state(consultation_id, context)
+
+            # Identify the input language locally; the client's language is
+            # only a hint (English typed on a Hindi consultation is English)
+            detected_language = get_language_identifier().resolve(
+                message,
+                hint=source_language,
+                default=target_language or "en"
+            )
+            source_language = detected_language.language
+
+            # Stages skipped because an upstream failed or its breaker is open;
+            # the turn still completes with a degraded answer
+            degraded = []
+            # Optional stages postponed to stay within the turn deadline
+            deferred: Dict[str, Callable[[], Awaitable]] = {}
+            skipped = []
             
             # Translate message to English if needed
             english_message = message
             original_message = message
             if source_language != "en":
                 logger.info(f"Translating input from {source_language} to English")
-                translation_result = await self.bhashini_service.translate_text(
-                    text=message,
-                    source_language=source_language,
-                    target_language="en"
-                )
-                english_message = translation_result["text"]
-                logger.info(f"Translated text: {english_message}")
+                try:
+                    translation_result = await deadline.run("input_translation", self.bhashini_service.translate_text(
+                        text=message,
+                        source_language=source_language,
+                        target_language="en"
+                    ))
+                    english_message = translation_result["text"]
+                    logger.info(f"Translated text: {english_message}")
+                except Exception as e:
+                    self._degrade(degraded, "input_translation", e)
             
             # Add user message to context with language info
             user_message = {
@@ -61,88 +142,297 @@ class ChatService:
                 "content": english_message,
                 "original_content": original_message,
                 "language": source_language,
+                "detected_language": detected_language.to_dict(),
                 "timestamp": datetime.utcnow().isoformat()
             }
             context.append(user_message)
+            self.symptom_analyzer.update_symptom_state(state, user_message)
 
             # Get consultation details
-            consultation = consultations_collection.find_one({"consultation_id": consultation_id})
+            consultation = await consultations_collection.find_one({"consultation_id": consultation_id})
             user_details = consultation.get("user_details", {})
-            target_language = user_details.get("preferred_language", source_language)
+            target_language = target_language or user_details.get("preferred_language", source_language)
 
             # Generate AI response with context (in English)
-            response = await self._generate_ai_response(english_message, context, user_details)
+            llm_failed = False
+            try:
+                response = await deadline.run(
+                    "llm",
+                    self._generate_ai_response(english_message, context, user_details, state)
+                )
+            except Exception as e:
+                self._degrade(degraded, "llm", e)
+                response = LLM_FALLBACK_RESPONSE
+                llm_failed = True
 
             # Analyze symptoms from conversation
-            symptom_analysis = await self.symptom_analyzer.analyze_conversation(context)
-            
-            # Get treatment recommendations
-            treatment_recommendations = await self.symptom_analyzer.get_treatment_recommendations(
-                symptom_analysis.get("symptoms", [])
-            )
-            
-            # Validate response
-            validation_result = await self.symptom_analyzer.validate_medical_response(
-                response,
-                context
-            )
+            try:
+                symptom_analysis = await deadline.run(
+                    "symptom_analysis",
+                    self.symptom_analyzer.analyze_conversation(context)
+                )
+            except Exception as e:
+                self._degrade(degraded, "symptom_analysis", e)
+                symptom_analysis = {"symptoms": [], "risk_level": "unknown", "urgency": "unknown"}
+
+            # Validation is the safety check: a required stage, started first
+            # and run alongside translation and audio, which do not need it
+            context_snapshot = list(context)
+            validation_task = asyncio.ensure_future(deadline.run(
+                "validation",
+                self.symptom_analyzer.validate_medical_response(response, context_snapshot)
+            ))
 
-            # Translate response if needed
+            # Translate response if needed; the fallback is already in the catalog
             final_response = response
-            if target_language != "en":
+            if llm_failed:
+                final_response = system_messages.get("llm_unavailable", target_language)
+            elif target_language != "en":
                 logger.info(f"Translating response to {target_language}")
-                translation_result = await self.bhashini_service.translate_text(
-                    text=response,
-                    source_language="en",
+                try:
+                    translation_result = await deadline.run("output_translation", self.bhashini_service.translate_text(
+                        text=response,
+                        source_language="en",
+                        target_language=target_language
+                    ))
+                    final_response = translation_result["text"]
+                except Exception as e:
+                    self._degrade(degraded, "output_translation", e)
+
+            # Generate audio in target language (streaming callers synthesize it themselves)
+            audio_result = {}
+            if synthesize_audio:
+                synthesize = lambda: self.speech_processor.process_text_to_speech(
+                    text=final_response,
                     target_language=target_language
                 )
-                final_response = translation_result["text"]
+                if deadline.fits("audio"):
+                    try:
+                        audio_result = await deadline.run("audio", synthesize())
+                    except Exception as e:
+                        self._degrade(degraded, "audio", e)
+                else:
+                    self._postpone("audio", synthesize, deferred, skipped, on_deferred)
 
-            # Generate audio in target language
-            audio_result = await self.speech_processor.process_text_to_speech(
-                text=final_response,
-                target_language=target_language
+            try:
+                validation_result = await validation_task
+            except Exception as e:
+                self._degrade(degraded, "validation", e)
+                validation_result = self._fallback_validation(state)
+
+            # Treatment recommendations only get what is left of the budget
+            treatment_recommendations = TREATMENT_FALLBACK
+            get_treatment = lambda: self.symptom_analyzer.get_treatment_recommendations(
+                symptom_analysis.get("symptoms", [])
             )
+            if deadline.fits("treatment_recommendations"):
+                try:
+                    treatment_recommendations = await deadline.run("treatment_recommendations", get_treatment())
+                except Exception as e:
+                    self._degrade(degraded, "treatment_recommendations", e)
+            else:
+                self._postpone("treatment_recommendations", get_treatment, deferred, skipped, on_deferred)
 
             # Process final response with treatment recommendations
-            processed_response = await self._process_response(
+            processed_response = self._process_response(
                 final_response,
                 symptom_analysis,
                 validation_result,
                 treatment_recommendations,
                 target_language,
-                audio_result.get("audio_data")
+                audio_result.get("audio_url")
             )
 
             # Add bot message to context with language info
             bot_message = {
                 "type": "bot",
+                "turn_id": turn_id,
                 "content": processed_response["response"],
                 "original_content": response,  # English version
                 "language": target_language,
+                "audio_url": processed_response["audio_url"],
                 "timestamp": datetime.utcnow().isoformat(),
                 "symptom_analysis": symptom_analysis,
-                "validation": validation_result
+                "validation": validation_result,
+                "recommendations": processed_response["recommendations"]
             }
             context.append(bot_message)
+            self.symptom_analyzer.update_symptom_state(state, bot_message)
 
             # Store updated context
-            await self.store_conversation_context(consultation_id, context)
+            await self.store_conversation_context(consultation_id, context, state)
+            if needs_compaction(context):
+                self._queue_compaction(consultation_id, state)
             
             # Update MongoDB
             await self.update_chat_history(consultation_id, [user_message, bot_message])
 
+            processed_response["detected_language"] = detected_language.to_dict()
+            processed_response["turn_id"] = turn_id
+            processed_response["degraded"] = degraded
+            processed_response["deferred"] = list(deferred)
+            processed_response["skipped"] = skipped
+            processed_response["deadline"] = deadline.to_dict()
+
+            if deferred:
+                self._run_deferred(
+                    consultation_id,
+                    turn_id,
+                    deferred,
+                    on_deferred
+                )
             return processed_response
 
         except Exception as e:
             logger.error(f"Error processing message: {e}")
             raise
 
-    async def _generate_ai_response(self, message: str, context: list, user_details: dict) -> str:
+    @staticmethod
+    def _queue_compaction(consultation_id: str, state: SymptomState):
+        """Shrink a long context in the worker; the turn never waits for it."""
+        try:
+            # message_count only grows, so each long turn queues at most one job
+            JobQueue().enqueue(
+                "compact_context",
+                {"consultation_id": consultation_id},
+                key=f"{consultation_id}:{state.message_count}"
+            )
+        except Exception as e:
+            logger.error(f"Error queueing context compaction: {e}")
+
+    @staticmethod
+    def _degrade(degraded: list, stage: str, error: Exception):
+        """Record a stage that fell back instead of failing the whole turn."""
+        if isinstance(error, DependencyUnavailable):
+            logger.warning(f"Skipping {stage}: {error}")
+        else:
+            logger.error(f"{stage} failed, degrading: {type(error).__name__}: {error}")
+        degraded.append(stage)
+
+    @staticmethod
+    def _postpone(
+        stage: str,
+        run: Callable[[], Awaitable],
+        deferred: Dict[str, Callable[[], Awaitable]],
+        skipped: list,
+        on_deferred: Optional[Callable[[dict], Awaitable[None]]]
+    ):
+        """Defer a stage that does not fit the turn budget, or skip it if nothing can receive its result."""
+        if on_deferred is not None:
+            logger.info(f"Deferring {stage} past the turn deadline")
+            deferred[stage] = run
+        else:
+            logger.info(f"Skipping {stage}: not enough turn budget left")
+            skipped.append(stage)
+
+    def _run_deferred(
+        self,
+        consultation_id: str,
+        turn_id: str,
+        deferred: Dict[str, Callable[[], Awaitable]],
+        on_deferred: Callable[[dict], Awaitable[None]]
+    ):
+        """Finish deferred stages in the background and push one follow_up frame per stage."""
+        async def finish(stage: str, run: Callable[[], Awaitable]):
+            frame = {
+                "type": "follow_up",
+                "turn_id": turn_id,
+                "consultation_id": consultation_id,
+                "stage": stage,
+                "result": None,
+                "error": None
+            }
+            try:
+                # Timed like an inline stage, so the estimate recovers once the stage is fast again
+                result = await TurnDeadline(DEFERRED_STAGE_TIMEOUT_SECONDS).run(stage, run())
+                frame["result"] = self._follow_up_result(stage, result)
+            except Exception as e:
+                logger.error(f"Deferred {stage} failed for turn {turn_id}: {e}")
+                frame["error"] = str(e) or type(e).__name__
+            else:
+                await self._store_follow_up(consultation_id, turn_id, frame["result"])
+            frame["timestamp"] = datetime.utcnow().isoformat()
+            try:
+                await on_deferred(frame)
+            except Exception as e:
+                logger.error(f"Could not deliver {stage} follow-up for turn {turn_id}: {e}")
+
+        for stage, run in deferred.items():
+            task = asyncio.create_task(finish(stage, run))
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
+
+    async def _store_follow_up(self, consultation_id: str, turn_id: str, result: dict):
+        """Write a deferred stage's result into the turn's stored bot message.
+
+        Summaries and reports are built from chat_history, so it must not
+        keep the fallback values the turn went out with.
+        """
+        fields = {}
+        for key, value in result.items():
+            if isinstance(value, dict):
+                fields.update({f"{key}.{sub_key}": sub_value for sub_key, sub_value in value.items()})
+            else:
+                fields[key] = value
+
+        try:
+            await consultations_collection.update_one(
+                {"consultation_id": consultation_id},
+                {"$set": {f"chat_history.$[turn].{path}": value for path, value in fields.items()}},
+                array_filters=[{"turn.turn_id": turn_id, "turn.type": "bot"}]
+            )
+        except Exception as e:
+            logger.error(f"Error storing follow-up for turn {turn_id}: {e}")
+
+        # No await between read and write, so other turns in this process cannot interleave
+        context = await self.get_conversation_context(consultation_id)
+        for message in context:
+            if message.get("turn_id") == turn_id and message.get("type") == "bot":
+                for path, value in fields.items():
+                    target = message
+                    *parents, leaf = path.split(".")
+                    for parent in parents:
+                        target = target.setdefault(parent, {})
+                    target[leaf] = value
+                await self.store_conversation_context(consultation_id, context)
+                break
+
+    @staticmethod
+    def _follow_up_result(stage: str, result: dict) -> dict:
+        """Shape a deferred stage's result like the fields it would have filled in the response."""
+        if stage == "treatment_recommendations":
+            return {
+                "recommendations": {
+                    "medications": result.get("medications", []),
+                    "homeRemedies": result.get("homeRemedies", [])
+                }
+            }
+        if stage == "audio":
+            return {"audio_url": result.get("audio_url")}
+        return result
+
+    @staticmethod
+    def _fallback_validation(state: SymptomState) -> dict:
+        """Validation result used when the validator is unavailable; errs towards urgent."""
+        return {
+            "is_valid": True,
+            "safety_concerns": [],
+            "missing_elements": [],
+            "emergency_level": "high" if state.has_emergency else "none",
+            "improvement_needed": False,
+            "suggested_improvements": []
+        }
+
+    async def _generate_ai_response(self, message: str, context: list, user_details: dict, state: SymptomState) -> str:
         """Generate AI response using Gemini (keeping original functionality)."""
-        question_count = sum(1 for msg in context if msg['type'] == 'bot' and '?' in msg['content'])
-        symptoms = self.symptom_analyzer.analyze_symptoms(context)
-        severity_score = self.symptom_analyzer.calculate_severity_score(symptoms)
+        question_count = state.question_count
+        severity_score = state.severity_score
+        if state.should_assess():
+            response_format = "[ASSESSMENT]\nSymptom Summary:\nLikely Condition:\nNext Steps:\nUrgency Level:"
+            instruction = "Provide final assessment now."
+        else:
+            response_format = "[QUESTION]\nAsk exactly ONE specific question about: (most concerning symptom or important missing information)"
+            instruction = "Provide single most important question."
         
         prompt = f"""
         You are a medical AI assistant. Your task is to either:
@@ -160,12 +450,11 @@ class ChatService:
 
         Current Message: {message}
         Questions Asked: {question_count}/5
-        Symptoms Identified: {json.dumps(symptoms)}
+        Symptoms Identified: {json.dumps(state.symptom_list)}
         Current Severity: {severity_score}
 
         STRICT RESPONSE FORMAT:
-        {"[ASSESSMENT]\nSymptom Summary:\nLikely Condition:\nNext Steps:\nUrgency Level:" if question_count >= 4 or severity_score >= 7 
-        else "[QUESTION]\nAsk exactly ONE specific question about: (most concerning symptom or important missing information)"}
+        {response_format}
 
         RULES:
         - ONE question only, no follow-ups in same response
@@ -175,22 +464,21 @@ class ChatService:
         - Maximum 6 questions total
         - Keep medical terms in English even after translation
 
-        {f"Provide final assessment now." if question_count >= 4 or severity_score >= 7 
-        else "Provide single most important question."}
+        {instruction}
         """
 
-        response = self.ai_config.model.generate_content(prompt)
+        response = await self.ai_config.generate(prompt)
         cleaned_response = response.text.replace('[QUESTION]', '').replace('[ASSESSMENT]', '').strip()
         return cleaned_response
 
-    async def _process_response(
+    def _process_response(
         self, 
         response: str, 
         symptom_analysis: dict, 
         validation: dict, 
         treatment_recommendations: dict,
         language: str = "en",
-        audio_data: str = None
+        audio_url: str = None
     ) -> dict:
         """Process and enhance the AI response with language support."""
         processed = {
@@ -210,24 +498,20 @@ class ChatService:
                 "code": language,
                 "name": self.speech_processor.language_metadata.get(language, {}).get("name", "Unknown")
             },
-            "audio": audio_data,
+            "audio_url": audio_url,
             "timestamp": datetime.utcnow().isoformat()
         }
 
         # Add emergency warning if needed (with translation if necessary)
         if processed["requires_emergency"]:
-            emergency_prefix = "⚠️ URGENT: This requires immediate medical attention!\n\n"
-            if language != "en":
-                translated_prefix = await self.bhashini_service.translate_text(
-                    text=emergency_prefix,
-                    source_language="en",
-                    target_language=language
-                )
-                emergency_prefix = translated_prefix["text"]
-            processed["response"] = emergency_prefix + processed["response"]
+            processed["response"] = self._emergency_prefix(language) + processed["response"]
 
         return processed
 
+    def _emergency_prefix(self, language: str) -> str:
+        """The urgent-care warning in the reply language, from the message catalog."""
+        return EMERGENCY_PREFIX.format(warning=system_messages.get("emergency_warning", language))
+
     def _format_context(self, context: list) -> str:
         """Format conversation context for AI prompt."""
         return "\n".join([
@@ -239,7 +523,7 @@ class ChatService:
         """Update chat history in MongoDB."""
         try:
             for message in messages:
-                consultations_collection.update_one(
+                await consultations_collection.update_one(
                     {"consultation_id": consultation_id},
                     {
                         "$push": {
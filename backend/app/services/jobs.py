@@ -0,0 +1,75 @@
+# backend/app/services/jobs.py
+"""Background job definitions; imported by the API (to enqueue) and by app.worker (to run)."""
+from app.utils.job_queue import task, PeriodicJob
+from app.services.summary_service import build_consultation_summary
+from app.services.report_service import render_consultation_report, report_store
+from app.utils.translation_cache import TranslationCache
+from app.utils.label_bundle import build_bundles
+from app.utils.context_compactor import compact_stored_context
+from app.utils.job_queue import JOB_RESULT_TTL_SECONDS
+from app.utils.report_store import REPORT_RETENTION_SECONDS
+from app.utils.audio_blob_store import AudioBlobStore, AUDIO_BLOB_MAX_AGE_SECONDS, AUDIO_BLOB_MAX_BYTES
+import asyncio
+import os
+
+TRANSLATION_CACHE_CLEANUP_SECONDS = int(os.getenv("TRANSLATION_CACHE_CLEANUP_SECONDS", str(6 * 3600)))
+# Bundles only need translating after a label changes or a build partly failed
+LABEL_BUNDLE_BUILD_SECONDS = int(os.getenv("LABEL_BUNDLE_BUILD_SECONDS", str(24 * 3600)))
+REPORT_CLEANUP_SECONDS = int(os.getenv("REPORT_CLEANUP_SECONDS", str(24 * 3600)))
+AUDIO_CLEANUP_SECONDS = int(os.getenv("AUDIO_CLEANUP_SECONDS", str(6 * 3600)))
+
+# Per-queue job slots in each worker process
+QUEUE_CONCURRENCY = {
+    "summaries": int(os.getenv("SUMMARY_JOB_CONCURRENCY", "4")),
+    "context": int(os.getenv("CONTEXT_JOB_CONCURRENCY", "2")),
+    "reports": int(os.getenv("REPORT_JOB_CONCURRENCY", "2")),
+    "maintenance": 1
+}
+
+
+@task("generate_summary", queue="summaries", max_attempts=3, timeout=300)
+async def generate_summary(consultation_id: str) -> dict:
+    summary = await build_consultation_summary(consultation_id)
+    return {
+        "consultation_id": consultation_id,
+        "completed_at": summary["completed_at"].isoformat()
+    }
+
+
+@task("render_report", queue="reports", max_attempts=3, timeout=600)
+async def render_report(consultation_id: str, language: str) -> dict:
+    return await render_consultation_report(consultation_id, language)
+
+
+@task("compact_context", queue="context", max_attempts=2, timeout=30)
+async def compact_context(consultation_id: str) -> dict:
+    return await asyncio.to_thread(compact_stored_context, consultation_id)
+
+
+@task("clear_expired_translations", queue="maintenance", max_attempts=1, timeout=600)
+async def clear_expired_translations() -> dict:
+    return {"deleted": await TranslationCache().clear_expired_cache()}
+
+
+@task("clear_expired_reports", queue="maintenance", max_attempts=1, timeout=600)
+async def clear_expired_reports() -> dict:
+    # Superseded files outlive the job results that can still link to them
+    return await asyncio.to_thread(report_store.sweep, REPORT_RETENTION_SECONDS, JOB_RESULT_TTL_SECONDS)
+
+
+@task("clear_expired_audio", queue="maintenance", max_attempts=1, timeout=600)
+async def clear_expired_audio() -> dict:
+    return await asyncio.to_thread(AudioBlobStore().sweep, AUDIO_BLOB_MAX_AGE_SECONDS, AUDIO_BLOB_MAX_BYTES)
+
+
+@task("build_label_bundles", queue="maintenance", max_attempts=1, timeout=1800)
+async def build_label_bundles() -> dict:
+    return {"bundles": await build_bundles()}
+
+
+PERIODIC_JOBS = [
+    PeriodicJob("clear_expired_translations", TRANSLATION_CACHE_CLEANUP_SECONDS),
+    PeriodicJob("build_label_bundles", LABEL_BUNDLE_BUILD_SECONDS),
+    PeriodicJob("clear_expired_reports", REPORT_CLEANUP_SECONDS),
+    PeriodicJob("clear_expired_audio", AUDIO_CLEANUP_SECONDS)
+]
@@ -0,0 +1,94 @@
+# backend/app/services/report_service.py
+from app.config.database import consultations_collection
+from app.services.summary_service import build_consultation_summary, ConsultationNotFound
+from app.utils.label_bundle import report_labels, bundle_languages
+from app.utils.report_store import ReportStore, report_key, LANGUAGE_PATTERN
+from typing import Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+report_store = ReportStore()
+
+
+class UnsupportedReportLanguage(ValueError):
+    """Raised when a report is requested in a language the app does not offer."""
+
+    def __init__(self, language: str):
+        super().__init__(f"Unsupported report language: {language}")
+        self.language = language
+
+# Report generator is created on first use to keep reportlab out of startup
+_report_generator = None
+
+
+def get_report_generator():
+    """Return the shared report generator, creating it on first use."""
+    global _report_generator
+    if _report_generator is None:
+        from app.utils.report_generator import MultilingualReportGenerator
+        _report_generator = MultilingualReportGenerator()
+    return _report_generator
+
+
+def artifact_info(consultation_id: str, digest: str, language: str) -> dict:
+    return {
+        "consultation_id": consultation_id,
+        "report_key": digest,
+        "language": language,
+        "etag": ReportStore.etag_for(digest, language),
+        "download_url": ReportStore.url_for(consultation_id, digest, language)
+    }
+
+
+async def load_report_inputs(consultation_id: str, language: Optional[str] = None):
+    """Return (consultation, summary or None, language) for a report request."""
+    consultation = await consultations_collection.find_one({"consultation_id": consultation_id})
+    if not consultation:
+        raise ConsultationNotFound(consultation_id)
+    language = language or consultation["language_preferences"]["preferred"]
+    # Checked before any rendering or queueing, so a bad language costs nothing
+    if not (LANGUAGE_PATTERN.match(language) and language in bundle_languages()):
+        raise UnsupportedReportLanguage(language)
+    return consultation, consultation.get("diagnosis_summary"), language
+
+
+def report_digest(summary: dict, language: str) -> str:
+    """Report key for summary rendered with the currently stored labels."""
+    return report_key(summary, report_labels.fingerprint(language))
+
+
+def find_cached_report(consultation_id: str, summary: Optional[dict], language: str) -> Optional[dict]:
+    """Artifact info if this summary's report is already rendered in this language."""
+    if summary is None:
+        return None
+    digest = report_digest(summary, language)
+    if report_store.exists(consultation_id, digest, language):
+        return artifact_info(consultation_id, digest, language)
+    return None
+
+
+async def render_consultation_report(consultation_id: str, language: Optional[str] = None) -> dict:
+    """Render and store a consultation's PDF report unless it is already stored.
+
+    Generates the diagnosis summary first if the consultation has none.
+    """
+    _, summary, language = await load_report_inputs(consultation_id, language)
+    if summary is None:
+        summary = await build_consultation_summary(consultation_id)
+
+    digest = report_digest(summary, language)
+    info = artifact_info(consultation_id, digest, language)
+    if report_store.exists(consultation_id, digest, language):
+        return info
+
+    # Ensure symptoms data is available
+    summary = dict(summary)
+    if "symptoms" not in summary and "diagnosis" in summary:
+        summary["symptoms"] = summary["diagnosis"].get("symptoms", [])
+
+    pdf_buffer = await get_report_generator().create_pdf_report(summary, language)
+    pdf = pdf_buffer.getvalue()
+    report_store.put(consultation_id, digest, language, pdf)
+    info["size"] = len(pdf)
+    return info
@@ -0,0 +1,145 @@
+# backend/app/services/speech_stream_service.py
+from typing import Awaitable, Callable, Dict, List, Optional
+from app.utils.audio_transcoder import DecodedAudio, StreamingDecoder
+from app.utils.audio_preprocessor import StreamingSegmenter, STT_SAMPLE_RATE, STT_CHANNELS
+from app.utils.speech_processor import MultilingualSpeechProcessor
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+# Client container name -> ffmpeg demuxer
+STREAM_FORMATS = {
+    "webm": "matroska",
+    "ogg": "ogg"
+}
+
+
+class StreamingTranscriptionSession:
+    """Transcribes one live utterance stream while the patient is speaking.
+
+    Encoded chunks are piped into a long-lived ffmpeg decoder; a reader task
+    runs the decoded PCM through an incremental VAD, and every finished
+    segment is sent to STT concurrently (bounded per session). An emitter
+    task awaits the STT results in segment order and pushes a partial
+    transcript to the client after each one.
+    """
+
+    def __init__(
+        self,
+        speech_processor: MultilingualSpeechProcessor,
+        send_json: Callable[[Dict], Awaitable[None]],
+        language: str,
+        input_format: str = "webm",
+        max_concurrent_segments: int = 3
+    ):
+        self.speech_processor = speech_processor
+        self.send_json = send_json
+        self.language = language
+        self.input_format = STREAM_FORMATS.get(input_format, input_format)
+        self.segmenter = StreamingSegmenter(sample_rate=STT_SAMPLE_RATE)
+        self.stt_slots = asyncio.Semaphore(max_concurrent_segments)
+        self.segment_queue: asyncio.Queue = asyncio.Queue()
+        self.texts: List[str] = []
+        self.decoder: Optional[StreamingDecoder] = None
+        self.reader_task: Optional[asyncio.Task] = None
+        self.emitter_task: Optional[asyncio.Task] = None
+        self.segment_count = 0
+        self.bytes_received = 0
+        self.input_closed_at: Optional[float] = None
+
+    async def start(self):
+        self.decoder = await self.speech_processor.transcoder.open_stream(
+            input_format=self.input_format,
+            sample_rate=STT_SAMPLE_RATE,
+            channels=STT_CHANNELS
+        )
+        self.reader_task = asyncio.create_task(self._read_decoded_audio())
+        self.emitter_task = asyncio.create_task(self._emit_transcripts())
+
+    async def feed(self, chunk: bytes):
+        """Accept one encoded audio chunk from the client."""
+        self.bytes_received += len(chunk)
+        await self.decoder.write(chunk)
+
+    async def _transcribe(self, index: int, pcm: bytes) -> Dict:
+        async with self.stt_slots:
+            try:
+                audio = DecodedAudio(pcm, STT_SAMPLE_RATE, STT_CHANNELS)
+                result = await self.speech_processor.process_speech_to_text(
+                    audio_data=audio,
+                    preferred_language=self.language,
+                    enable_auto_detect=False
+                )
+                return {"index": index, "text": result.get("text", ""), "duration": audio.duration_seconds}
+            except Exception as e:
+                logger.error(f"Error transcribing stream segment {index}: {str(e)}")
+                return {"index": index, "text": "", "error": str(e)}
+
+    def _schedule(self, pcm: bytes):
+        task = asyncio.create_task(self._transcribe(self.segment_count, pcm))
+        self.segment_count += 1
+        self.segment_queue.put_nowait(task)
+
+    async def _read_decoded_audio(self):
+        """Pull PCM from the decoder and cut it into segments as it arrives."""
+        try:
+            while True:
+                pcm = await self.decoder.read(self.segmenter.frame_bytes * 10)
+                if not pcm:
+                    break
+                for segment in self.segmenter.feed(pcm):
+                    self._schedule(segment)
+            tail = self.segmenter.flush()
+            if tail:
+                self._schedule(tail)
+        finally:
+            self.segment_queue.put_nowait(None)
+
+    async def _emit_transcripts(self):
+        """Push partial transcripts in segment order as STT results complete."""
+        while True:
+            task = await self.segment_queue.get()
+            if task is None:
+                break
+            result = await task
+            if result["text"]:
+                self.texts.append(result["text"])
+            await self.send_json({
+                "type": "partial_transcript",
+                "segment": result["index"],
+                "text": result["text"],
+                "transcript": " ".join(self.texts),
+                "language": self.language,
+                "error": result.get("error")
+            })
+
+    async def finish(self) -> Dict:
+        """End of utterance: flush the decoder and wait for outstanding segments."""
+        self.input_closed_at = time.perf_counter()
+        await self.decoder.close_input()
+        await self.reader_task
+        await self.emitter_task
+        await self.decoder.aclose()
+
+        return {
+            "type": "transcript",
+            "text": " ".join(self.texts),
+            "language": self.language,
+            "segments": self.segment_count,
+            "bytes_received": self.bytes_received,
+            "finalize_ms": round((time.perf_counter() - self.input_closed_at) * 1000, 1)
+        }
+
+    async def aclose(self):
+        """Abort the session (client went away)."""
+        for task in (self.reader_task, self.emitter_task):
+            if task and not task.done():
+                task.cancel()
+        while not self.segment_queue.empty():
+            task = self.segment_queue.get_nowait()
+            if task:
+                task.cancel()
+        if self.decoder:
+            await self.decoder.aclose()
@@ -1,9 +1,9 @@
 # backend/app/utils/ai_config.py
-import google.generativeai as genai
 from typing import Dict, List
 import os
 from dotenv import load_dotenv
 import logging
+from app.utils.resilience import dependencies
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,8 @@ class GeminiConfig:
     def initialize_model(self):
         """Initialize and configure the Gemini model"""
         try:
+            # Imported here so loading the app does not pull in the gRPC stack
+            import google.generativeai as genai
             genai.configure(api_key=self.api_key)
             self.model = genai.GenerativeModel(
                 model_name='gemini-pro',
@@ -36,6 +38,10 @@ class GeminiConfig:
             logger.error(f"Failed to initialize Gemini model: {str(e)}")
             raise
 
+    async def generate(self, prompt: str):
+        """Generate content off the event loop, guarded by the Gemini breaker and limit."""
+        return await dependencies["gemini"].call(lambda: self.model.generate_content(prompt), in_thread=True)
+
     def validate(self) -> bool:
         """Validate the model configuration"""
         try:
@@ -0,0 +1,126 @@
+# backend/app/utils/audio_blob_store.py
+from typing import Dict, List, Optional, Tuple
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# API processes and the worker share the store, so it cannot depend on their cwd
+AUDIO_BLOB_DIR = os.getenv("AUDIO_BLOB_DIR", os.path.join(BACKEND_DIR, "data", "audio"))
+if not os.path.isabs(AUDIO_BLOB_DIR):
+    raise RuntimeError(f"AUDIO_BLOB_DIR must be an absolute path, got {AUDIO_BLOB_DIR!r}")
+AUDIO_BLOB_MAX_AGE_SECONDS = int(os.getenv("AUDIO_BLOB_MAX_AGE_SECONDS", str(30 * 24 * 3600)))
+AUDIO_BLOB_MAX_BYTES = int(os.getenv("AUDIO_BLOB_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
+AUDIO_URL_PREFIX = "/api/audio"
+
+CONTENT_TYPES = {
+    "mp3": "audio/mpeg",
+    "wav": "audio/wav",
+    "ogg": "audio/ogg",
+    "webm": "audio/webm"
+}
+
+BLOB_ID_PATTERN = re.compile(r"^[0-9a-f]{64}\.(" + "|".join(CONTENT_TYPES) + r")$")
+
+
+class AudioBlobStore:
+    """Content-addressed local disk store for synthesized audio.
+
+    A blob id is the SHA-256 of the audio plus its extension, so identical
+    audio is stored once and a blob never changes after it is written.
+    Files are sharded two levels deep and written atomically. A blob's
+    mtime is its last store, which sweep() uses to evict by age and size.
+    """
+
+    def __init__(self, root: str = AUDIO_BLOB_DIR):
+        self.root = root
+
+    def path_for(self, blob_id: str) -> Optional[str]:
+        """Return the file path of a blob, or None for a malformed id."""
+        if not BLOB_ID_PATTERN.match(blob_id):
+            return None
+        return os.path.join(self.root, blob_id[:2], blob_id[2:4], blob_id)
+
+    def url_for(self, blob_id: str) -> str:
+        return f"{AUDIO_URL_PREFIX}/{blob_id}"
+
+    @staticmethod
+    def content_type_for(blob_id: str) -> str:
+        return CONTENT_TYPES.get(blob_id.rsplit(".", 1)[-1], "application/octet-stream")
+
+    def put(self, audio: bytes, extension: str = "mp3") -> str:
+        """Store audio if not already present and return its blob id."""
+        blob_id = f"{hashlib.sha256(audio).hexdigest()}.{extension}"
+        path = self.path_for(blob_id)
+        if os.path.exists(path):
+            try:
+                os.utime(path)
+                return blob_id
+            except FileNotFoundError:
+                pass  # Swept meanwhile; store it again
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as blob_file:
+                blob_file.write(audio)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.debug(f"Stored audio blob {blob_id} ({len(audio)} bytes)")
+        return blob_id
+
+    def store_url(self, audio: bytes, extension: str = "mp3") -> str:
+        """Store audio and return the URL it is served from."""
+        return self.url_for(self.put(audio, extension))
+
+    def sweep(self, max_age_seconds: float, max_bytes: int) -> Dict[str, int]:
+        """Delete blobs older than max_age_seconds, then the least recently
+        stored ones until the store fits in max_bytes.
+
+        Synthesis goes through the TTS cache and re-stores a swept blob,
+        so only links in old chat history stop resolving.
+        """
+        now = time.time()
+        blobs: List[Tuple[float, int, str]] = []
+        for directory, _, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(directory, filename)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                blobs.append((stat.st_mtime, stat.st_size, path))
+
+        blobs.sort()
+        total = sum(size for _, size, _ in blobs)
+        deleted = {"expired": 0, "evicted": 0, "bytes": 0}
+        for mtime, size, path in blobs:
+            if now - mtime > max_age_seconds:
+                reason = "expired"
+            elif total > max_bytes:
+                reason = "evicted"
+            else:
+                break
+            try:
+                os.remove(path)
+            except OSError as e:
+                logger.warning(f"Error deleting audio blob {path}: {e}")
+                continue
+            total -= size
+            deleted[reason] += 1
+            deleted["bytes"] += size
+
+        logger.info(
+            f"Audio sweep deleted {deleted['expired']} expired and {deleted['evicted']} evicted blobs "
+            f"({deleted['bytes']} bytes); {total} bytes remain"
+        )
+        return deleted
@@ -0,0 +1,217 @@
+# backend/app/utils/audio_preprocessor.py
+from typing import Dict, Tuple
+import logging
+import math
+from app.utils.audio_transcoder import DecodedAudio, SAMPLE_WIDTH, DEFAULT_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+# Native input rate of the speech recognizer
+STT_SAMPLE_RATE = 16000
+STT_CHANNELS = 1
+
+
+class AudioPreprocessor:
+    """Trims leading and trailing silence with an energy-based VAD.
+
+    Frames are scored by RMS level in dBFS. The threshold adapts to the
+    recording: a fixed margin above the quietest frames (the noise floor),
+    but never below an absolute floor so near-silent uploads are not kept.
+    """
+
+    def __init__(
+        self,
+        frame_ms: int = 30,
+        padding_ms: int = 200,
+        margin_db: float = 12.0,
+        absolute_floor_db: float = -50.0,
+        min_speech_ms: int = 90
+    ):
+        self.frame_ms = frame_ms
+        self.padding_ms = padding_ms
+        self.margin_db = margin_db
+        self.absolute_floor_db = absolute_floor_db
+        self.min_speech_ms = min_speech_ms
+
+    def frame_levels(self, audio: DecodedAudio):
+        """Return the RMS level in dBFS of each frame."""
+        import numpy as np
+
+        samples = np.frombuffer(audio.pcm_data, dtype=np.int16)
+        if audio.channels > 1:
+            samples = samples[: len(samples) - len(samples) % audio.channels]
+            samples = samples.reshape(-1, audio.channels).mean(axis=1)
+
+        frame_size = max(1, int(audio.sample_rate * self.frame_ms / 1000))
+        frame_count = len(samples) // frame_size
+        if frame_count == 0:
+            return np.array([])
+        frames = samples[: frame_count * frame_size].astype(np.float32).reshape(frame_count, frame_size)
+        rms = np.sqrt(np.mean(frames ** 2, axis=1)) / 32768.0
+        return 20 * np.log10(np.maximum(rms, 1e-10))
+
+    def speech_bounds(self, audio: DecodedAudio) -> Tuple[int, int]:
+        """Return the first and last frame index (exclusive) that contain speech."""
+        import numpy as np
+
+        levels = self.frame_levels(audio)
+        if len(levels) == 0:
+            return 0, 0
+
+        noise_floor = float(np.percentile(levels, 10))
+        threshold = max(self.absolute_floor_db, noise_floor + self.margin_db)
+        voiced = np.flatnonzero(levels > threshold)
+
+        min_frames = max(1, self.min_speech_ms // self.frame_ms)
+        if len(voiced) < min_frames:
+            return 0, 0
+        return int(voiced[0]), int(voiced[-1]) + 1
+
+    def trim_silence(self, audio: DecodedAudio) -> Tuple[DecodedAudio, Dict]:
+        """Cut leading/trailing silence, keeping padding around the speech."""
+        start_frame, end_frame = self.speech_bounds(audio)
+        frame_size = int(audio.sample_rate * self.frame_ms / 1000)
+        padding_frames = math.ceil(self.padding_ms / self.frame_ms)
+        bytes_per_frame = frame_size * SAMPLE_WIDTH * audio.channels
+
+        if end_frame == 0:
+            # No speech detected; keep the audio untouched and let STT decide
+            trimmed_pcm = audio.pcm_data
+        else:
+            start = max(0, start_frame - padding_frames) * bytes_per_frame
+            end = min(len(audio.pcm_data), (end_frame + padding_frames) * bytes_per_frame)
+            trimmed_pcm = audio.pcm_data[start:end]
+
+        trimmed = DecodedAudio(trimmed_pcm, audio.sample_rate, audio.channels, source_size=audio.source_size)
+        return trimmed, {
+            "speech_detected": end_frame > 0,
+            "trimmed_seconds": round(audio.duration_seconds - trimmed.duration_seconds, 3)
+        }
+
+    def preprocess(self, audio: DecodedAudio) -> DecodedAudio:
+        """Trim silence and attach a report of bytes saved versus the old payload."""
+        trimmed, stats = self.trim_silence(audio)
+
+        # What the previous pipeline sent: full-length WAV at the decode rate
+        legacy_wav_bytes = int(audio.duration_seconds * DEFAULT_SAMPLE_RATE) * SAMPLE_WIDTH * audio.channels + 44
+        stats.update({
+            "legacy_wav_bytes": legacy_wav_bytes,
+            "wav_bytes": len(trimmed.wav),
+            "bytes_saved": legacy_wav_bytes - len(trimmed.wav)
+        })
+        trimmed.preprocessing = stats
+        logger.info(
+            f"Audio preprocessed: {audio.duration_seconds:.2f}s -> {trimmed.duration_seconds:.2f}s, "
+            f"{stats['legacy_wav_bytes']} -> {stats['wav_bytes']} bytes"
+        )
+        return trimmed
+
+
+class StreamingSegmenter:
+    """Incremental energy VAD that cuts a live PCM stream into utterances.
+
+    Feed 16-bit mono PCM as it is decoded; a segment is returned as soon as
+    end_silence_ms of silence follows at least min_speech_ms of speech. The
+    noise floor is tracked from frames classified as silence.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = STT_SAMPLE_RATE,
+        frame_ms: int = 30,
+        end_silence_ms: int = 600,
+        padding_ms: int = 200,
+        min_speech_ms: int = 150,
+        max_segment_ms: int = 15000,
+        margin_db: float = 12.0,
+        absolute_floor_db: float = -50.0
+    ):
+        self.sample_rate = sample_rate
+        self.frame_ms = frame_ms
+        self.frame_bytes = int(sample_rate * frame_ms / 1000) * SAMPLE_WIDTH
+        self.end_silence_frames = max(1, end_silence_ms // frame_ms)
+        self.padding_frames = max(1, padding_ms // frame_ms)
+        self.min_speech_frames = max(1, min_speech_ms // frame_ms)
+        self.max_segment_frames = max(1, max_segment_ms // frame_ms)
+        self.margin_db = margin_db
+        self.absolute_floor_db = absolute_floor_db
+
+        self.noise_floor_db = absolute_floor_db - margin_db
+        self._pending = b""
+        self._pre_roll = []
+        self._segment = []
+        self._speech_frames = 0
+        self._silence_run = 0
+        self._in_speech = False
+
+    @property
+    def threshold_db(self) -> float:
+        return max(self.absolute_floor_db, self.noise_floor_db + self.margin_db)
+
+    @staticmethod
+    def _level_db(frame: bytes) -> float:
+        import numpy as np
+
+        samples = np.frombuffer(frame, dtype=np.int16).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples ** 2))) / 32768.0
+        return 20 * math.log10(max(rms, 1e-10))
+
+    def _finish_segment(self):
+        """Close the current utterance; drop it if it was only a short blip."""
+        # Keep only padding_frames of the trailing silence
+        trailing = max(0, self._silence_run - self.padding_frames)
+        frames = self._segment[:len(self._segment) - trailing] if trailing else self._segment
+        keep = self._speech_frames >= self.min_speech_frames
+
+        self._segment = []
+        self._speech_frames = 0
+        self._silence_run = 0
+        self._in_speech = False
+        return b"".join(frames) if keep else None
+
+    def _process_frame(self, frame: bytes):
+        level = self._level_db(frame)
+        is_speech = level > self.threshold_db
+
+        if not self._in_speech:
+            if is_speech:
+                self._in_speech = True
+                self._segment = self._pre_roll + [frame]
+                self._pre_roll = []
+                self._speech_frames = 1
+                self._silence_run = 0
+            else:
+                # Follow the noise floor down quickly and up slowly
+                self.noise_floor_db = min(level, 0.95 * self.noise_floor_db + 0.05 * level)
+                self._pre_roll = (self._pre_roll + [frame])[-self.padding_frames:]
+            return None
+
+        self._segment.append(frame)
+        if is_speech:
+            self._speech_frames += 1
+            self._silence_run = 0
+        else:
+            self._silence_run += 1
+
+        if self._silence_run >= self.end_silence_frames or len(self._segment) >= self.max_segment_frames:
+            return self._finish_segment()
+        return None
+
+    def feed(self, pcm: bytes) -> list:
+        """Consume PCM and return any utterances that finished."""
+        data = self._pending + pcm
+        segments = []
+        usable = len(data) - len(data) % self.frame_bytes
+        for offset in range(0, usable, self.frame_bytes):
+            segment = self._process_frame(data[offset:offset + self.frame_bytes])
+            if segment:
+                segments.append(segment)
+        self._pending = data[usable:]
+        return segments
+
+    def flush(self):
+        """Return the utterance in progress at end of stream, if any."""
+        if not self._in_speech:
+            return None
+        self._silence_run = 0
+        return self._finish_segment()
@@ -0,0 +1,209 @@
+# backend/app/utils/audio_transcoder.py
+from typing import Optional
+from io import BytesIO
+import asyncio
+import logging
+import os
+import wave
+
+logger = logging.getLogger(__name__)
+
+FFMPEG_BINARY = os.getenv("FFMPEG_BINARY", "ffmpeg")
+
+# Browsers record Opus, which always decodes at 48 kHz
+DEFAULT_SAMPLE_RATE = 48000
+DEFAULT_CHANNELS = 1
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+
+class TranscodingError(RuntimeError):
+    """Raised when ffmpeg cannot decode the uploaded audio."""
+
+
+class DecodedAudio:
+    """Audio decoded once per request and shared by every later stage.
+
+    Holds 16-bit PCM samples plus format metadata; the WAV encoding is built
+    lazily and memoised so detection and recognition reuse the same bytes.
+    """
+
+    def __init__(self, pcm_data: bytes, sample_rate: int, channels: int, source_size: int = 0):
+        self.pcm_data = pcm_data
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.source_size = source_size
+        self.preprocessing: Optional[dict] = None
+        self._wav: Optional[bytes] = None
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.pcm_data) // (SAMPLE_WIDTH * self.channels)
+
+    @property
+    def duration_seconds(self) -> float:
+        return self.frame_count / self.sample_rate if self.sample_rate else 0.0
+
+    @property
+    def wav(self) -> bytes:
+        if self._wav is None:
+            self._wav = AudioTranscoder.pcm_to_wav(self.pcm_data, self.sample_rate, self.channels)
+        return self._wav
+
+    def metadata(self) -> dict:
+        return {
+            "sample_rate": self.sample_rate,
+            "channels": self.channels,
+            "duration_seconds": round(self.duration_seconds, 3),
+            "source_bytes": self.source_size,
+            "pcm_bytes": len(self.pcm_data),
+            "preprocessing": self.preprocessing
+        }
+
+
+class StreamingDecoder:
+    """A long-lived ffmpeg process that decodes audio chunks as they arrive."""
+
+    def __init__(self, process: asyncio.subprocess.Process, sample_rate: int, channels: int):
+        self.process = process
+        self.sample_rate = sample_rate
+        self.channels = channels
+
+    async def write(self, chunk: bytes):
+        """Feed encoded bytes to the decoder."""
+        self.process.stdin.write(chunk)
+        await self.process.stdin.drain()
+
+    async def read(self, size: int) -> bytes:
+        """Read up to size bytes of PCM; returns b"" once the stream is finished."""
+        return await self.process.stdout.read(size)
+
+    async def close_input(self):
+        """Signal end of input so ffmpeg flushes the remaining samples."""
+        if not self.process.stdin.is_closing():
+            self.process.stdin.close()
+            try:
+                await self.process.stdin.wait_closed()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    async def aclose(self):
+        """Stop the decoder process."""
+        await self.close_input()
+        if self.process.returncode is None:
+            self.process.kill()
+        await self.process.wait()
+
+
+class AudioTranscoder:
+    """Transcodes audio by piping bytes through ffmpeg stdin/stdout.
+
+    Nothing touches the disk: the upload is written to ffmpeg's stdin, raw
+    PCM is read back from stdout and the WAV container is built in memory.
+    """
+
+    def __init__(self, ffmpeg_binary: str = FFMPEG_BINARY):
+        self.ffmpeg_binary = ffmpeg_binary
+
+    async def _run_ffmpeg(self, args: list, input_data: bytes) -> bytes:
+        """Run ffmpeg with the given arguments, feeding input_data on stdin."""
+        process = await asyncio.create_subprocess_exec(
+            self.ffmpeg_binary, "-hide_banner", "-loglevel", "error", "-nostdin",
+            *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate(input=input_data)
+        if process.returncode != 0:
+            raise TranscodingError(stderr.decode(errors="replace").strip() or "ffmpeg failed")
+        return stdout
+
+    async def open_stream(
+        self,
+        input_format: Optional[str] = "matroska",
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        channels: int = DEFAULT_CHANNELS,
+        low_latency: bool = True
+    ) -> StreamingDecoder:
+        """Start an incremental decoder for a stream of encoded chunks.
+
+        For live streams (low_latency) probing is kept minimal and output
+        packets are flushed immediately so PCM comes back while the client
+        is still sending; uploads use ffmpeg's normal probing.
+        """
+        args = ["-probesize", "4096", "-analyzeduration", "0", "-fflags", "nobuffer"] if low_latency else []
+        if input_format:
+            args += ["-f", input_format]
+        args += [
+            "-i", "pipe:0",
+            "-vn",
+            "-acodec", "pcm_s16le",
+            "-ar", str(sample_rate),
+            "-ac", str(channels),
+            *(["-flush_packets", "1"] if low_latency else []),
+            "-f", "s16le",
+            "pipe:1"
+        ]
+        process = await asyncio.create_subprocess_exec(
+            self.ffmpeg_binary, "-hide_banner", "-loglevel", "error", "-nostdin",
+            *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        return StreamingDecoder(process, sample_rate, channels)
+
+    async def decode_to_pcm(
+        self,
+        audio_data: bytes,
+        input_format: Optional[str] = None,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        channels: int = DEFAULT_CHANNELS
+    ) -> bytes:
+        """Decode any ffmpeg-readable audio to signed 16-bit little-endian PCM."""
+        args = []
+        if input_format:
+            args += ["-f", input_format]
+        args += [
+            "-i", "pipe:0",
+            "-vn",
+            "-acodec", "pcm_s16le",
+            "-ar", str(sample_rate),
+            "-ac", str(channels),
+            "-f", "s16le",
+            "pipe:1"
+        ]
+        return await self._run_ffmpeg(args, audio_data)
+
+    @staticmethod
+    def pcm_to_wav(pcm_data: bytes, sample_rate: int = DEFAULT_SAMPLE_RATE, channels: int = DEFAULT_CHANNELS) -> bytes:
+        """Wrap raw 16-bit PCM in a WAV container without touching disk."""
+        buffer = BytesIO()
+        with wave.open(buffer, "wb") as wav_file:
+            wav_file.setnchannels(channels)
+            wav_file.setsampwidth(SAMPLE_WIDTH)
+            wav_file.setframerate(sample_rate)
+            wav_file.writeframes(pcm_data)
+        return buffer.getvalue()
+
+    async def decode(
+        self,
+        audio_data: bytes,
+        input_format: Optional[str] = None,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        channels: int = DEFAULT_CHANNELS
+    ) -> DecodedAudio:
+        """Decode an upload once into a shareable DecodedAudio."""
+        pcm_data = await self.decode_to_pcm(audio_data, input_format, sample_rate, channels)
+        return DecodedAudio(pcm_data, sample_rate, channels, source_size=len(audio_data))
+
+    async def to_wav(
+        self,
+        audio_data: bytes,
+        input_format: Optional[str] = None,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        channels: int = DEFAULT_CHANNELS
+    ) -> bytes:
+        """Transcode audio to an in-memory WAV file."""
+        pcm_data = await self.decode_to_pcm(audio_data, input_format, sample_rate, channels)
+        return self.pcm_to_wav(pcm_data, sample_rate, channels)
@@ -0,0 +1,251 @@
+# backend/app/utils/audio_upload.py
+from typing import Optional
+from fastapi import Request
+from app.utils.audio_transcoder import AudioTranscoder, DecodedAudio, SAMPLE_WIDTH
+from app.utils.audio_preprocessor import STT_SAMPLE_RATE, STT_CHANNELS
+import asyncio
+import hashlib
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_AUDIO_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+MAX_AUDIO_SECONDS = float(os.getenv("MAX_AUDIO_SECONDS", "120"))
+# Allowance for multipart boundaries, part headers and small form fields
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+PCM_READ_SIZE = 64 * 1024
+
+# Upload content type -> ffmpeg demuxer; anything else is probed by ffmpeg
+CONTENT_TYPE_FORMATS = {
+    "audio/webm": "matroska",
+    "video/webm": "matroska",
+    "audio/ogg": "ogg",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/wave": "wav",
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/flac": "flac"
+}
+
+
+class UploadRejected(Exception):
+    """Raised when an upload is malformed or over a limit; carries the HTTP status."""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class StreamedUpload:
+    """A received audio upload, fingerprinted but not yet decoded.
+
+    Decoding is deferred to decode(), so callers can serve a cached or
+    in-flight transcription of the same bytes without running ffmpeg.
+    """
+
+    def __init__(
+        self,
+        audio: bytes,
+        fingerprint: str,
+        size: int,
+        filename: Optional[str],
+        content_type: Optional[str],
+        transcoder: AudioTranscoder,
+        max_seconds: float = MAX_AUDIO_SECONDS,
+        sample_rate: int = STT_SAMPLE_RATE,
+        channels: int = STT_CHANNELS
+    ):
+        self.audio = audio
+        self.fingerprint = fingerprint
+        self.size = size
+        self.filename = filename
+        self.content_type = content_type
+        self.transcoder = transcoder
+        self.max_seconds = max_seconds
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.max_pcm_bytes = int(max_seconds * sample_rate) * SAMPLE_WIDTH * channels
+
+    async def decode(self) -> DecodedAudio:
+        """Decode the upload through ffmpeg, rejecting it past max_seconds."""
+        decoder = await self.transcoder.open_stream(
+            input_format=CONTENT_TYPE_FORMATS.get(self.content_type),
+            sample_rate=self.sample_rate,
+            channels=self.channels,
+            low_latency=False
+        )
+        pcm = bytearray()
+        too_long = False
+
+        async def read_pcm():
+            nonlocal too_long
+            while True:
+                chunk = await decoder.read(PCM_READ_SIZE)
+                if not chunk:
+                    break
+                pcm.extend(chunk)
+                if len(pcm) > self.max_pcm_bytes:
+                    # Stop ffmpeg so pending writes fail fast instead of blocking
+                    too_long = True
+                    decoder.process.kill()
+                    break
+
+        reader_task = asyncio.create_task(read_pcm())
+        try:
+            view = memoryview(self.audio)
+            for offset in range(0, len(view), PCM_READ_SIZE):
+                try:
+                    await decoder.write(bytes(view[offset:offset + PCM_READ_SIZE]))
+                except (BrokenPipeError, ConnectionResetError):
+                    # ffmpeg stopped reading: either the duration cap or bad input
+                    break
+            if not too_long:
+                await decoder.close_input()
+            await reader_task
+            if too_long:
+                raise UploadRejected(413, f"Audio exceeds {self.max_seconds:g} seconds")
+            returncode = await decoder.process.wait()
+            if returncode != 0 or not pcm:
+                raise UploadRejected(422, "Could not decode the uploaded audio")
+
+            decoded = DecodedAudio(bytes(pcm), self.sample_rate, self.channels, source_size=self.size)
+            logger.info(f"Decoded upload {self.filename}: {self.size} bytes, {decoded.duration_seconds:.2f}s")
+            return decoded
+
+        finally:
+            if not reader_task.done():
+                reader_task.cancel()
+            await decoder.aclose()
+
+
+class AudioUploadStream:
+    """Reads a multipart/form-data request without spooling it to disk.
+
+    The body is parsed chunk by chunk; bytes of the audio field are hashed
+    and buffered in memory, and the request is rejected as soon as the
+    declared length or the received bytes exceed the cap. Decoding is left
+    to StreamedUpload.decode(), so an upload whose fingerprint is already
+    cached or being transcribed is never decoded.
+    """
+
+    def __init__(
+        self,
+        request: Request,
+        transcoder: AudioTranscoder,
+        field_name: str = "audio",
+        max_bytes: int = MAX_UPLOAD_BYTES,
+        max_seconds: float = MAX_AUDIO_SECONDS
+    ):
+        self.request = request
+        self.transcoder = transcoder
+        self.field_name = field_name
+        self.max_bytes = max_bytes
+        self.max_seconds = max_seconds
+
+        self.digest = hashlib.sha256()
+        self.audio = bytearray()
+        self.filename: Optional[str] = None
+        self.content_type: Optional[str] = None
+
+        self._header_name = b""
+        self._header_value = b""
+        self._part_headers = {}
+        self._in_audio_part = False
+        self._audio_seen = False
+
+    # multipart parser callbacks (synchronous; data is queued for the decoder)
+
+    def _on_part_begin(self):
+        self._part_headers = {}
+        self._in_audio_part = False
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._header_value += data[start:end]
+
+    def _on_header_end(self):
+        self._part_headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self):
+        from multipart.multipart import parse_options_header
+
+        _, options = parse_options_header(self._part_headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("latin-1")
+        if name != self.field_name or b"filename" not in options:
+            return
+        if self._audio_seen:
+            raise UploadRejected(400, f"Only one '{self.field_name}' file is accepted")
+        self._audio_seen = True
+        self._in_audio_part = True
+        self.filename = options[b"filename"].decode("utf-8", errors="replace")
+        content_type = self._part_headers.get(b"content-type")
+        self.content_type = content_type.decode("latin-1").split(";")[0].strip().lower() if content_type else None
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if not self._in_audio_part:
+            return
+        chunk = data[start:end]
+        if len(self.audio) + len(chunk) > self.max_bytes:
+            raise UploadRejected(413, f"Audio file exceeds {self.max_bytes} bytes")
+        self.digest.update(chunk)
+        self.audio += chunk
+
+    def _on_part_end(self):
+        self._in_audio_part = False
+
+    def _check_declared_length(self):
+        content_length = self.request.headers.get("content-length")
+        if content_length and content_length.isdigit() \
+                and int(content_length) > self.max_bytes + MULTIPART_OVERHEAD_BYTES:
+            raise UploadRejected(413, f"Upload exceeds {self.max_bytes} bytes")
+
+    def _create_parser(self):
+        import multipart
+        from multipart.multipart import parse_options_header
+
+        content_type, params = parse_options_header(self.request.headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            raise UploadRejected(400, "Expected a multipart/form-data upload")
+        return multipart.MultipartParser(params[b"boundary"], {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished
+        })
+
+    async def read(self) -> StreamedUpload:
+        """Consume the request body and return the fingerprinted upload."""
+        self._check_declared_length()
+        parser = self._create_parser()
+        body_bytes = 0
+        async for chunk in self.request.stream():
+            body_bytes += len(chunk)
+            if body_bytes > self.max_bytes + MULTIPART_OVERHEAD_BYTES:
+                raise UploadRejected(413, f"Upload exceeds {self.max_bytes} bytes")
+            parser.write(chunk)
+        parser.finalize()
+
+        if not self._audio_seen:
+            raise UploadRejected(400, f"Missing '{self.field_name}' file in upload")
+        if not self.audio:
+            raise UploadRejected(400, "Empty audio file received")
+
+        logger.info(f"Received upload {self.filename}: {len(self.audio)} bytes")
+        return StreamedUpload(
+            bytes(self.audio),
+            self.digest.hexdigest(),
+            len(self.audio),
+            self.filename,
+            self.content_type,
+            self.transcoder,
+            max_seconds=self.max_seconds
+        )
@@ -0,0 +1,92 @@
+# backend/app/utils/context_compactor.py
+"""Compaction of the Redis conversation context.
+
+Every turn appends two messages to chat_context_<id>, and each turn reads,
+re-serialises and re-analyses the whole list. Once a context grows past
+CONTEXT_COMPACT_MESSAGES, the compact_context job replaces all but the
+last CONTEXT_KEEP_MESSAGES with a single summary message built from the
+consultation's symptom state, which already covers every message, so no
+model call is needed. The full history stays in MongoDB.
+"""
+from typing import Dict, List
+from app.config.database import redis_client
+from app.utils.symptom_state import SymptomState
+from datetime import datetime
+from redis.exceptions import WatchError
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_COMPACT_MESSAGES = int(os.getenv("CONTEXT_COMPACT_MESSAGES", "30"))
+# At least the five messages the reply prompt quotes verbatim
+CONTEXT_KEEP_MESSAGES = int(os.getenv("CONTEXT_KEEP_MESSAGES", "10"))
+
+SUMMARY_TYPE = "summary"
+
+
+def needs_compaction(context: List[Dict]) -> bool:
+    return len(context) > CONTEXT_COMPACT_MESSAGES
+
+
+def _describe(symptom: Dict) -> str:
+    details = [f"severity {symptom['severity']}"]
+    for key in ("duration", "pattern"):
+        if symptom.get(key, "Not specified") != "Not specified":
+            details.append(f"{key} {symptom[key]}")
+    return f"{symptom['name']} ({', '.join(details)})"
+
+
+def compact_context(context: List[Dict], state: SymptomState, keep: int = CONTEXT_KEEP_MESSAGES) -> List[Dict]:
+    """Replace all but the last keep messages with one summary message."""
+    if len(context) <= keep:
+        return context
+
+    dropped = context[:-keep]
+    compacted = sum(
+        message.get("compacted_messages", 0) if message.get("type") == SUMMARY_TYPE else 1
+        for message in dropped
+    )
+    symptoms = "; ".join(_describe(symptom) for symptom in state.symptom_list) or "no specific symptoms"
+    summary = {
+        "type": SUMMARY_TYPE,
+        "content": f"Earlier in this consultation the patient reported: {symptoms}.",
+        "compacted_messages": compacted,
+        "emergency_flags": list(state.emergency_flags),
+        "timestamp": datetime.utcnow().isoformat()
+    }
+    return [summary] + context[-keep:]
+
+
+def compact_stored_context(consultation_id: str) -> Dict:
+    """Compact a consultation's stored context unless a turn changes it meanwhile.
+
+    Turns rewrite the whole context, so the write is a WATCH transaction:
+    if a turn stores its context first, this compaction is dropped rather
+    than overwriting the new messages, and the next long turn queues
+    another one.
+    """
+    context_key = f"chat_context_{consultation_id}"
+    state_key = f"symptom_state_{consultation_id}"
+    with redis_client.pipeline() as pipe:
+        try:
+            pipe.watch(context_key, state_key)
+            raw_context = pipe.get(context_key)
+            context = json.loads(raw_context) if raw_context else []
+            if not needs_compaction(context):
+                return {"consultation_id": consultation_id, "compacted": False, "messages": len(context)}
+
+            raw_state = pipe.get(state_key)
+            state = SymptomState.from_dict(json.loads(raw_state) if raw_state else None)
+            compacted = compact_context(context, state)
+
+            pipe.multi()
+            pipe.set(context_key, json.dumps(compacted), keepttl=True)
+            pipe.execute()
+        except WatchError:
+            logger.info(f"Context of {consultation_id} changed during compaction; skipped")
+            return {"consultation_id": consultation_id, "compacted": False, "messages": None}
+
+    logger.info(f"Compacted context of {consultation_id}: {len(context)} -> {len(compacted)} messages")
+    return {"consultation_id": consultation_id, "compacted": True, "messages": len(compacted)}
@@ -0,0 +1,171 @@
+# backend/app/utils/hedging.py
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from collections import deque
+from app.utils.resilience import DependencyUnavailable, RetryBudget
+import asyncio
+import logging
+import os
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TRANSLATION_HEDGING = os.getenv("TRANSLATION_HEDGING", "false").lower() in ("1", "true", "yes")
+# Hedges allowed per call, e.g. 0.1 = at most 10% extra translate requests
+TRANSLATION_HEDGE_BUDGET = float(os.getenv("TRANSLATION_HEDGE_BUDGET", "0.1"))
+
+
+class LatencyWindow:
+    """Sliding window of recent latencies (seconds) with percentile lookup."""
+
+    def __init__(self, size: int = 500):
+        self.samples = deque(maxlen=size)
+
+    def record(self, latency: float):
+        self.samples.append(latency)
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def summary(self) -> Dict:
+        def ms(value):
+            return round(value * 1000, 1) if value is not None else None
+        return {
+            "samples": len(self.samples),
+            "p50_ms": ms(self.percentile(0.50)),
+            "p95_ms": ms(self.percentile(0.95)),
+            "p99_ms": ms(self.percentile(0.99))
+        }
+
+
+class HedgePolicy:
+    """Send a duplicate request when the first has not answered by the observed p95.
+
+    Whichever attempt succeeds first wins. The loser is not cancelled: its
+    upstream cost is already paid, and letting it finish keeps the
+    first-attempt latency window uncensored. That window is what calls
+    would have taken without hedging, so comparing it to the hedged
+    window shows the tail improvement. Hedges draw from a token budget
+    (budget_ratio per call), which bounds the extra load during a
+    slowdown, and no hedging happens until min_samples latencies have
+    been observed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        percentile: float = 0.95,
+        budget_ratio: float = 0.1,
+        min_samples: int = 20,
+        min_delay: float = 0.05,
+        enabled: bool = True
+    ):
+        self.name = name
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.enabled = enabled
+        self.budget = RetryBudget(ratio=budget_ratio, max_tokens=5.0)
+        self.first_attempts = LatencyWindow()
+        self.hedged = LatencyWindow()
+        self.calls = 0
+        self.hedges_sent = 0
+        self.hedge_wins = 0
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None while there is too little data."""
+        if len(self.first_attempts) < self.min_samples:
+            return None
+        return max(self.min_delay, self.first_attempts.percentile(self.percentile))
+
+    async def _timed(self, call: Callable[[], Awaitable[T]], window: Optional[LatencyWindow]) -> T:
+        started = time.perf_counter()
+        result = await call()
+        if window is not None:
+            window.record(time.perf_counter() - started)
+        return result
+
+    async def run(self, call: Callable[[], Awaitable[T]]) -> T:
+        """Run call, hedging it once if it is slow; call must be safe to repeat."""
+        started = time.perf_counter()
+        self.calls += 1
+        self.budget.deposit()
+        delay = self.hedge_delay() if self.enabled else None
+
+        primary = asyncio.ensure_future(self._timed(call, self.first_attempts))
+        try:
+            if delay is None:
+                result = await primary
+            else:
+                result = await self._race(call, primary, delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+        self.hedged.record(time.perf_counter() - started)
+        return result
+
+    async def _race(self, call: Callable[[], Awaitable[T]], primary: asyncio.Future, delay: float) -> T:
+        done, _ = await asyncio.wait({primary}, timeout=delay)
+        if done or not self.budget.try_spend():
+            return await primary
+
+        self.hedges_sent += 1
+        hedge = asyncio.ensure_future(self._timed(call, None))
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for attempt in done:
+                if attempt.exception() is None:
+                    if attempt is hedge:
+                        self.hedge_wins += 1
+                    self._finish_in_background(pending)
+                    return attempt.result()
+                # A refused hedge is not the primary's failure; keep waiting
+                if attempt is primary or not isinstance(attempt.exception(), DependencyUnavailable):
+                    error = error or attempt.exception()
+        raise error
+
+    def _finish_in_background(self, pending):
+        for attempt in pending:
+            # Retrieve the loser's outcome so a late failure is not reported as unhandled
+            attempt.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+    def to_dict(self) -> Dict:
+        unhedged, hedged = self.first_attempts.summary(), self.hedged.summary()
+        improvement = None
+        if unhedged["p99_ms"] is not None and hedged["p99_ms"] is not None:
+            improvement = round(unhedged["p99_ms"] - hedged["p99_ms"], 1)
+        delay = self.hedge_delay()
+        return {
+            "enabled": self.enabled,
+            "calls": self.calls,
+            "hedges_sent": self.hedges_sent,
+            "hedge_wins": self.hedge_wins,
+            "extra_load": round(self.hedges_sent / self.calls, 4) if self.calls else 0.0,
+            "hedge_delay_ms": round(delay * 1000, 1) if delay is not None else None,
+            "first_attempt_latency": unhedged,
+            "hedged_latency": hedged,
+            "p99_improvement_ms": improvement,
+            "budget_tokens": round(self.budget.tokens, 2),
+            "hedges_denied": self.budget.denied
+        }
+
+
+# Shared by every BhashiniService instance in the worker
+translation_hedge = HedgePolicy(
+    "translation",
+    budget_ratio=TRANSLATION_HEDGE_BUDGET,
+    enabled=TRANSLATION_HEDGING
+)
+
+
+def hedging_status() -> Dict[str, Dict]:
+    return {translation_hedge.name: translation_hedge.to_dict()}
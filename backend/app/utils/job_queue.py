@@ -0,0 +1,320 @@
+# backend/app/utils/job_queue.py
+"""Redis-backed background job queue.
+
+Jobs are Redis hashes (job:<id>) pushed onto a list per queue
+(jobs:queue:<queue>). A worker moves each job atomically onto the
+queue's processing list while it runs, and renews a lease on it. Jobs
+whose worker died are returned to the queue once the lease expires, or
+failed if that was their last attempt.
+Failed attempts are retried with jittered backoff through the
+jobs:delayed sorted set, up to the task's max_attempts. A job key
+dedupes enqueues: while a job with the same key is queued, running or
+finished (and not yet expired), enqueueing it again returns that job.
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from app.config.database import redis_client, REDIS_URL
+from app.utils.resilience import backoff_delay
+from datetime import datetime
+import asyncio
+import json
+import logging
+import os
+import signal
+import time
+import uuid
+
+logger = logging.getLogger(__name__)
+
+JOB_RESULT_TTL_SECONDS = int(os.getenv("JOB_RESULT_TTL_SECONDS", str(24 * 3600)))
+JOB_LEASE_SECONDS = int(os.getenv("JOB_LEASE_SECONDS", "60"))
+MAINTENANCE_INTERVAL_SECONDS = 1.0
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+DELAYED_KEY = "jobs:delayed"
+JSON_FIELDS = ("args", "result")
+
+
+def _job_key(job_id: str) -> str:
+    return f"job:{job_id}"
+
+
+def _queue_key(queue: str) -> str:
+    return f"jobs:queue:{queue}"
+
+
+def _processing_key(queue: str) -> str:
+    return f"jobs:processing:{queue}"
+
+
+def _dedupe_key(queue: str, key: str) -> str:
+    return f"jobs:key:{queue}:{key}"
+
+
+class TaskSpec:
+    """A registered job function and its queue, retry and timeout settings."""
+
+    def __init__(self, name: str, func: Callable[..., Awaitable[Any]], queue: str, max_attempts: int, timeout: float):
+        self.name = name
+        self.func = func
+        self.queue = queue
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+
+
+tasks: Dict[str, TaskSpec] = {}
+
+
+def task(name: str, queue: str = "default", max_attempts: int = 3, timeout: float = 300):
+    """Register an async function as a job; its return value must be JSON-serializable."""
+    def decorator(func):
+        tasks[name] = TaskSpec(name, func, queue, max_attempts, timeout)
+        return func
+    return decorator
+
+
+def _decode(record: Dict[str, str]) -> Optional[Dict]:
+    if not record:
+        return None
+    job = dict(record)
+    for field in JSON_FIELDS:
+        if job.get(field):
+            job[field] = json.loads(job[field])
+    for field in ("attempts", "max_attempts"):
+        if field in job:
+            job[field] = int(job[field])
+    return job
+
+
+class JobQueue:
+    """Enqueue jobs and read their status (used by API handlers)."""
+
+    def __init__(self, redis=redis_client):
+        self.redis = redis
+
+    def enqueue(self, name: str, args: Optional[Dict] = None, key: Optional[str] = None) -> Dict:
+        """Queue a registered task; returns the job, or the existing job for the same key."""
+        spec = tasks[name]
+        job_id = uuid.uuid4().hex
+
+        if key is not None:
+            dedupe_key = _dedupe_key(spec.queue, key)
+            if not self.redis.set(dedupe_key, job_id, nx=True, ex=JOB_RESULT_TTL_SECONDS):
+                existing = self.get(self.redis.get(dedupe_key) or "")
+                if existing and existing["status"] != FAILED:
+                    existing["deduplicated"] = True
+                    return existing
+                # The previous job failed or expired; this one takes over the key
+                self.redis.set(dedupe_key, job_id, ex=JOB_RESULT_TTL_SECONDS)
+
+        record = {
+            "id": job_id,
+            "name": name,
+            "queue": spec.queue,
+            "key": key or "",
+            "args": json.dumps(args or {}),
+            "status": QUEUED,
+            "attempts": 0,
+            "max_attempts": spec.max_attempts,
+            "created_at": datetime.utcnow().isoformat()
+        }
+        pipe = self.redis.pipeline()
+        pipe.hset(_job_key(job_id), mapping=record)
+        pipe.lpush(_queue_key(spec.queue), job_id)
+        pipe.execute()
+        logger.info(f"Enqueued {name} job {job_id} on {spec.queue}")
+        return _decode({k: str(v) for k, v in record.items()})
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        if not job_id:
+            return None
+        return _decode(self.redis.hgetall(_job_key(job_id)))
+
+    def queue_lengths(self) -> Dict[str, Dict[str, int]]:
+        queues = sorted({spec.queue for spec in tasks.values()})
+        pipe = self.redis.pipeline()
+        for queue in queues:
+            pipe.llen(_queue_key(queue))
+            pipe.llen(_processing_key(queue))
+        counts = pipe.execute()
+        return {
+            queue: {"queued": counts[2 * i], "running": counts[2 * i + 1]}
+            for i, queue in enumerate(queues)
+        }
+
+
+class PeriodicJob:
+    """A task enqueued every interval_seconds; the interval bucket is its dedupe key."""
+
+    def __init__(self, name: str, interval_seconds: float, args: Optional[Dict] = None):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.args = args or {}
+
+    def key(self, now: float) -> str:
+        return f"{self.name}:{int(now // self.interval_seconds)}"
+
+
+class Worker:
+    """Runs jobs from Redis with a fixed number of concurrent slots per queue.
+
+    The concurrency limits apply per worker process; run more processes
+    to scale out.
+    """
+
+    def __init__(self, concurrency: Dict[str, int], periodic: Optional[List[PeriodicJob]] = None):
+        self.concurrency = concurrency
+        self.periodic = periodic or []
+        self.stopping = asyncio.Event()
+        self.redis = None
+
+    async def _wait_stopping(self, timeout: float):
+        try:
+            await asyncio.wait_for(self.stopping.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    async def _consume(self, queue: str):
+        failures = 0
+        while not self.stopping.is_set():
+            try:
+                job_id = await self.redis.blmove(_queue_key(queue), _processing_key(queue), 1, "RIGHT", "LEFT")
+                if job_id:
+                    await self._execute(queue, job_id)
+                failures = 0
+            except Exception as e:
+                # A Redis outage must not end the slot; the lease returns any job it held
+                failures += 1
+                delay = backoff_delay(failures, base=0.5, cap=30.0)
+                logger.error(f"Worker slot on {queue} failed ({e}); retrying in {delay:.1f}s")
+                await self._wait_stopping(delay)
+
+    async def _renew_lease(self, job_id: str):
+        while True:
+            await asyncio.sleep(JOB_LEASE_SECONDS / 3)
+            await self.redis.hset(_job_key(job_id), "lease_until", time.time() + JOB_LEASE_SECONDS)
+
+    async def _execute(self, queue: str, job_id: str):
+        key = _job_key(job_id)
+        job = _decode(await self.redis.hgetall(key))
+        if job is None:
+            await self.redis.lrem(_processing_key(queue), 1, job_id)
+            return
+
+        spec = tasks.get(job["name"])
+        attempts = await self.redis.hincrby(key, "attempts", 1)
+        await self.redis.hset(key, mapping={
+            "status": RUNNING,
+            "started_at": datetime.utcnow().isoformat(),
+            "lease_until": time.time() + JOB_LEASE_SECONDS
+        })
+        heartbeat = asyncio.create_task(self._renew_lease(job_id))
+        try:
+            if spec is None:
+                raise LookupError(f"Unknown task {job['name']}")
+            result = await asyncio.wait_for(spec.func(**job["args"]), timeout=spec.timeout)
+            await self.redis.hset(key, mapping={
+                "status": SUCCEEDED,
+                "result": json.dumps(result, default=str),
+                "error": "",
+                "finished_at": datetime.utcnow().isoformat()
+            })
+            await self.redis.expire(key, JOB_RESULT_TTL_SECONDS)
+            logger.info(f"Job {job['name']} {job_id} succeeded on attempt {attempts}")
+
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if spec is not None and attempts < job["max_attempts"]:
+                delay = backoff_delay(attempts, base=5.0, cap=300.0)
+                await self.redis.hset(key, mapping={"status": QUEUED, "error": error})
+                await self.redis.zadd(DELAYED_KEY, {f"{queue}:{job_id}": time.time() + delay})
+                logger.warning(f"Job {job['name']} {job_id} failed ({error}); retrying in {delay:.1f}s")
+            else:
+                await self.redis.hset(key, mapping={
+                    "status": FAILED,
+                    "error": error,
+                    "finished_at": datetime.utcnow().isoformat()
+                })
+                await self.redis.expire(key, JOB_RESULT_TTL_SECONDS)
+                logger.error(f"Job {job['name']} {job_id} failed permanently: {error}")
+        finally:
+            heartbeat.cancel()
+            await self.redis.lrem(_processing_key(queue), 1, job_id)
+
+    async def _promote_delayed(self):
+        """Move retries whose backoff has elapsed back onto their queue."""
+        for member in await self.redis.zrangebyscore(DELAYED_KEY, 0, time.time()):
+            # zrem succeeds for exactly one worker, which then owns the retry
+            if await self.redis.zrem(DELAYED_KEY, member):
+                queue, job_id = member.split(":", 1)
+                await self.redis.lpush(_queue_key(queue), job_id)
+
+    async def _reclaim_expired(self):
+        """Requeue jobs whose worker stopped renewing the lease."""
+        now = time.time()
+        for queue in self.concurrency:
+            for job_id in await self.redis.lrange(_processing_key(queue), 0, -1):
+                key = _job_key(job_id)
+                lease_until, attempts, max_attempts = await self.redis.hmget(
+                    key, "lease_until", "attempts", "max_attempts"
+                )
+                if not (lease_until and float(lease_until) < now):
+                    continue
+                if not await self.redis.lrem(_processing_key(queue), 1, job_id):
+                    continue
+                # A job that keeps killing its worker must not be run forever
+                if int(attempts or 0) >= int(max_attempts or 1):
+                    await self.redis.hset(key, mapping={
+                        "status": FAILED,
+                        "error": f"Worker lost during attempt {attempts}",
+                        "finished_at": datetime.utcnow().isoformat()
+                    })
+                    await self.redis.expire(key, JOB_RESULT_TTL_SECONDS)
+                    logger.error(f"Job {job_id} failed permanently: worker lost on its last attempt")
+                    continue
+                logger.warning(f"Reclaiming job {job_id} from a lost worker")
+                await self.redis.hset(key, "status", QUEUED)
+                await self.redis.lpush(_queue_key(queue), job_id)
+
+    async def _enqueue_periodic(self):
+        now = time.time()
+        for job in self.periodic:
+            # One enqueue per interval across all workers, even if the job fails
+            if await self.redis.set(f"jobs:periodic:{job.key(now)}", 1, nx=True, ex=int(job.interval_seconds) + 1):
+                await asyncio.to_thread(JobQueue().enqueue, job.name, job.args, job.key(now))
+
+    async def _maintenance(self):
+        last_reclaim = 0.0
+        while not self.stopping.is_set():
+            try:
+                await self._promote_delayed()
+                await self._enqueue_periodic()
+                if time.monotonic() - last_reclaim >= JOB_LEASE_SECONDS:
+                    await self._reclaim_expired()
+                    last_reclaim = time.monotonic()
+            except Exception as e:
+                logger.error(f"Job queue maintenance failed: {e}")
+            await self._wait_stopping(MAINTENANCE_INTERVAL_SECONDS)
+
+    async def run(self):
+        from redis import asyncio as aioredis
+
+        self.redis = aioredis.from_url(REDIS_URL, decode_responses=True)
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self.stopping.set)
+
+        logger.info(f"Worker started with concurrency {self.concurrency}")
+        consumers = [
+            self._consume(queue)
+            for queue, slots in self.concurrency.items()
+            for _ in range(slots)
+        ]
+        try:
+            await asyncio.gather(self._maintenance(), *consumers)
+        finally:
+            await self.redis.aclose()
+            logger.info("Worker stopped")
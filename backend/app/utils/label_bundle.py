@@ -0,0 +1,287 @@
+# backend/app/utils/label_bundle.py
+"""Precomputed translations of fixed English strings, stored on disk.
+
+Covers report labels and the system messages sent on the chat hot path.
+
+    cd backend && python -m app.utils.label_bundle [--language hi ...]
+
+A bundle maps keys to English source strings. Its version is a hash of
+those strings, so editing a string makes the stored translations stale
+instead of wrong: the new version is built into a new file. Bundles are
+built once through the translation backend, here or by the worker's
+build_label_bundles job, and lookups only read memory; at most every
+LABEL_BUNDLE_RELOAD_SECONDS a lookup checks the file's mtime, so other
+processes pick up a rebuild without a restart.
+"""
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+from datetime import datetime
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+LABEL_BUNDLE_DIR = os.getenv("LABEL_BUNDLE_DIR", os.path.join(os.getcwd(), "data", "labels"))
+# Parallel translation calls per build; stays under the Bhashini limiter's queue
+LABEL_BUILD_CONCURRENCY = int(os.getenv("LABEL_BUILD_CONCURRENCY", "4"))
+# How often lookups check the stored bundle for a rebuild by the worker
+LABEL_BUNDLE_RELOAD_SECONDS = float(os.getenv("LABEL_BUNDLE_RELOAD_SECONDS", "60"))
+
+SOURCE_LANGUAGE = "en"
+
+# Static report text; only patient-specific values are translated per report
+REPORT_LABELS = {
+    "title": "Medical Consultation Report",
+    "consultation_id": "Consultation ID:",
+    "date": "Date:",
+    "patient_info": "Patient Information",
+    "name": "Name",
+    "age": "Age",
+    "gender": "Gender",
+    "height": "Height",
+    "weight": "Weight",
+    "gender_male": "Male",
+    "gender_female": "Female",
+    "gender_other": "Other",
+    "diagnosis": "Diagnosis Summary",
+    "symptoms": "Based on your reported symptoms:",
+    "intensity": "intensity",
+    "confidence": "confidence",
+    "safety": "Safety Concerns",
+    "urgency": "Urgency Level",
+    "symptoms_analysis": "Detailed Symptoms Analysis",
+    "chart": "Symptoms Analysis Chart",
+    "followup": "Follow-up Information",
+    "treatment": "Treatment Recommendations",
+    "medications": "Recommended Medications:",
+    "remedies": "Home Remedies:",
+    "precautions": "Important Precautions",
+    "disclaimer": "This is an AI-generated pre-diagnosis report and should not be considered as a replacement for professional medical advice."
+}
+
+# Fixed chat and API messages; looked up per request, never translated there
+SYSTEM_MESSAGES = {
+    "emergency_warning": "URGENT: This requires immediate medical attention!",
+    "llm_unavailable": (
+        "I'm having trouble reaching the medical assistant right now. "
+        "Please try again in a moment. If your symptoms are severe, contact a doctor or emergency services."
+    ),
+    "rephrase": "I need to rephrase. Please repeat your message.",
+    "processing_error": "Processing error. Please try again.",
+    "message_error": "Error processing message",
+    "audio_stream_error": "Error processing audio stream",
+    "internal_error": "Something went wrong on our side. Please try again."
+}
+
+Translate = Callable[[str, str], Awaitable[str]]
+
+
+class LabelBundle:
+    """Fixed strings with their stored translations, held in memory.
+
+    Keys with no stored translation for a language fall back to English;
+    build() fills them in and writes <name>.<version>.json atomically.
+    """
+
+    def __init__(self, name: str, labels: Dict[str, str], root: str = LABEL_BUNDLE_DIR):
+        self.name = name
+        self.labels = labels
+        self.root = root
+        canonical = json.dumps(labels, sort_keys=True, ensure_ascii=False)
+        self.version = hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:12]
+        self._translations: Dict[str, Dict[str, str]] = {}
+        self._loaded_mtime: Optional[float] = None
+        self._checked_at: Optional[float] = None
+        self.built_at: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        return os.path.join(self.root, f"{self.name}.{self.version}.json")
+
+    def load(self) -> bool:
+        """(Re)read the stored bundle if it changed on disk; True if one is loaded."""
+        self._checked_at = time.monotonic()
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            return self._loaded_mtime is not None
+        if mtime == self._loaded_mtime:
+            return True
+
+        try:
+            with open(self.path, encoding="utf-8") as bundle_file:
+                data = json.load(bundle_file)
+        except (OSError, ValueError) as e:
+            logger.error(f"Error reading label bundle {self.path}: {e}")
+            return self._loaded_mtime is not None
+
+        # Ignore keys that are no longer labels
+        self._translations = {
+            language: {key: text for key, text in entries.items() if key in self.labels}
+            for language, entries in data.get("languages", {}).items()
+        }
+        self.built_at = data.get("built_at")
+        self._loaded_mtime = mtime
+        return True
+
+    def _refresh(self):
+        if self._checked_at is None or time.monotonic() - self._checked_at >= LABEL_BUNDLE_RELOAD_SECONDS:
+            self.load()
+
+    def get(self, key: str, language: str) -> str:
+        """One label in language, English if it has not been translated."""
+        self._refresh()
+        return self._translations.get(language, {}).get(key) or self.labels[key]
+
+    def for_language(self, language: str) -> Dict[str, str]:
+        """Every label in language, English where untranslated."""
+        self._refresh()
+        translated = self._translations.get(language, {})
+        return {key: translated.get(key) or text for key, text in self.labels.items()}
+
+    def fingerprint(self, language: str) -> str:
+        """Version plus a hash of the loaded translations for language.
+
+        Changes whenever the text for_language() returns does, so output
+        rendered from the labels can be keyed by it.
+        """
+        self._refresh()
+        translated = json.dumps(self._translations.get(language, {}), sort_keys=True, ensure_ascii=False)
+        return f"{self.version}-{hashlib.sha256(translated.encode('utf-8')).hexdigest()[:12]}"
+
+    def missing(self, languages: Iterable[str]) -> Dict[str, List[str]]:
+        """Keys without a stored translation, per language."""
+        missing = {}
+        for language in languages:
+            if language == SOURCE_LANGUAGE:
+                continue
+            translated = self._translations.get(language, {})
+            keys = [key for key in self.labels if key not in translated]
+            if keys:
+                missing[language] = keys
+        return missing
+
+    async def build(self, languages: Iterable[str], translate: Translate) -> Dict:
+        """Translate the missing labels and store the bundle.
+
+        Labels that fail to translate stay missing and are retried by the
+        next build, so a partial outage never stores English as a translation.
+        """
+        self.load()
+        missing = self.missing(languages)
+        semaphore = asyncio.Semaphore(LABEL_BUILD_CONCURRENCY)
+
+        async def translate_label(language: str, key: str):
+            async with semaphore:
+                try:
+                    return language, key, await translate(self.labels[key], language)
+                except Exception as e:
+                    logger.warning(f"Label {self.name}.{key} -> {language} failed: {e}")
+                    return language, key, None
+
+        results = await asyncio.gather(*[
+            translate_label(language, key) for language, keys in missing.items() for key in keys
+        ])
+
+        translations = {language: dict(entries) for language, entries in self._translations.items()}
+        translated = 0
+        for language, key, text in results:
+            if text:
+                translations.setdefault(language, {})[key] = text
+                translated += 1
+        if translated:
+            self._write(translations)
+
+        return {
+            "bundle": self.name,
+            "version": self.version,
+            "translated": translated,
+            "failed": len(results) - translated
+        }
+
+    def _write(self, translations: Dict[str, Dict[str, str]]):
+        built_at = datetime.utcnow().isoformat()
+        data = {
+            "name": self.name,
+            "version": self.version,
+            "built_at": built_at,
+            "source": self.labels,
+            "languages": translations
+        }
+        os.makedirs(self.root, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.root, suffix=".part")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as bundle_file:
+                json.dump(data, bundle_file, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._translations = translations
+        self._loaded_mtime = os.path.getmtime(self.path)
+        self.built_at = built_at
+        logger.info(f"Stored label bundle {self.path}")
+
+    def status(self) -> Dict:
+        return {
+            "version": self.version,
+            "built_at": self.built_at,
+            "languages": sorted(self._translations)
+        }
+
+
+report_labels = LabelBundle("report_labels", REPORT_LABELS)
+system_messages = LabelBundle("system_messages", SYSTEM_MESSAGES)
+
+# Every bundle the build command and the worker job keep up to date
+BUNDLES = [report_labels, system_messages]
+
+
+def load_bundles() -> Dict[str, Dict]:
+    """Warm every stored bundle into memory; called at startup."""
+    for bundle in BUNDLES:
+        if not bundle.load():
+            logger.warning(f"No stored {bundle.name} bundle for version {bundle.version}; using English")
+    return {bundle.name: bundle.status() for bundle in BUNDLES}
+
+
+def bundle_languages() -> List[str]:
+    """Languages the app offers, all of which get precomputed labels."""
+    from app.services.bhashini_service import BhashiniService
+    return sorted(BhashiniService().supported_languages)
+
+
+async def translate_label(text: str, language: str) -> str:
+    from app.services.bhashini_service import BhashiniService
+    translation = await BhashiniService().translate_text(
+        text=text,
+        source_language=SOURCE_LANGUAGE,
+        target_language=language
+    )
+    return translation["text"]
+
+
+async def build_bundles(languages: Optional[Iterable[str]] = None) -> List[Dict]:
+    """Fill in every bundle's missing translations through the translation backend."""
+    languages = list(languages or bundle_languages())
+    return [await bundle.build(languages, translate_label) for bundle in BUNDLES]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute label translations")
+    parser.add_argument("--language", action="append", help="limit the build to these languages")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for result in asyncio.run(build_bundles(args.language)):
+        print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
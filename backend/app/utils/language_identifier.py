@@ -0,0 +1,271 @@
+# backend/app/utils/language_identifier.py
+from typing import Dict, List, Optional
+from collections import Counter
+import math
+import re
+import unicodedata
+
+# Unicode blocks per script, and the LanguageCode values written in each
+SCRIPT_RANGES = [
+    ("devanagari", 0x0900, 0x097F),
+    ("bengali", 0x0980, 0x09FF),
+    ("gurmukhi", 0x0A00, 0x0A7F),
+    ("gujarati", 0x0A80, 0x0AFF),
+    ("odia", 0x0B00, 0x0B7F),
+    ("tamil", 0x0B80, 0x0BFF),
+    ("telugu", 0x0C00, 0x0C7F),
+    ("kannada", 0x0C80, 0x0CFF),
+    ("malayalam", 0x0D00, 0x0D7F),
+    ("arabic", 0x0600, 0x06FF),
+    ("arabic", 0x0750, 0x077F),
+    ("arabic", 0xFB50, 0xFDFF),
+    ("arabic", 0xFE70, 0xFEFF),
+    ("meitei", 0xAAE0, 0xAAFF),
+    ("meitei", 0xABC0, 0xABFF),
+]
+
+SCRIPT_LANGUAGES = {
+    "latin": ["en", "hi"],
+    "devanagari": ["hi", "mr", "bo", "raj"],
+    "bengali": ["bn", "as", "mni"],
+    "gurmukhi": ["pa"],
+    "gujarati": ["gu"],
+    "odia": ["or"],
+    "tamil": ["ta"],
+    "telugu": ["te"],
+    "kannada": ["kn"],
+    "malayalam": ["ml"],
+    "arabic": ["ur"],
+    "meitei": ["mni"],
+}
+
+# Share of letters a non-Latin script needs to win over embedded English terms
+MIN_NATIVE_SHARE = 0.2
+
+# Seed text for the character n-gram profiles of scripts shared by several
+# languages. "hi" under Latin is romanized Hindi.
+SEED_TEXT = {
+    ("latin", "en"): (
+        "I have had a fever and headache for three days. My stomach hurts and I have been vomiting. "
+        "Should I see a doctor? I feel very tired and weak. I have a cough and a sore throat. "
+        "How long have you had this pain? I cannot sleep at night. What medicine should I take? "
+        "The pain is worse in the morning and my chest feels tight when I walk."
+    ),
+    ("latin", "hi"): (
+        "mujhe teen din se bukhar hai aur sir mein dard ho raha hai. mere pet mein dard hai aur ulti bhi "
+        "ho rahi hai. kya mujhe doctor ke paas jana chahiye? main bahut thaka hua mehsoos kar raha hoon. "
+        "khansi aur gale mein kharash hai. yeh dard kab se hai? mujhe neend nahi aati hai. "
+        "subah dard zyada hota hai aur chalne par seene mein jakdan hoti hai."
+    ),
+    ("devanagari", "hi"): (
+        "मुझे तीन दिन से बुखार है और सिर में दर्द हो रहा है। मेरे पेट में दर्द है और उल्टी भी हो रही है। "
+        "क्या मुझे डॉक्टर के पास जाना चाहिए? मैं बहुत थका हुआ महसूस कर रहा हूँ। खांसी और गले में खराश है। "
+        "यह दर्द कब से है? मुझे नींद नहीं आती है।"
+    ),
+    ("devanagari", "mr"): (
+        "मला तीन दिवसांपासून ताप आहे आणि डोकं दुखत आहे. माझ्या पोटात दुखतंय आणि उलटी होत आहे. "
+        "मी डॉक्टरांकडे जावं का? मला खूप थकवा जाणवतो. खोकला आणि घसा खवखवतो आहे. "
+        "हे दुखणं कधीपासून आहे? मला झोप लागत नाही."
+    ),
+    ("devanagari", "bo"): (
+        "आंनि सानथाम सान निफ्राय लोमजानाय जादों आरो खोरहाया सानायो। आंनि उदैआव सानाय जादों आरो "
+        "बायनाय जायो। आं डाक्टरनि खाथियाव थांनो नांगौ नामा? आं जोबोद गोजोन। गुसु आरो गोदोआव सानाय दं। "
+        "बेयो माबे सम निफ्राय दं? आं हराव उन्दुनो हायाखै।"
+    ),
+    ("devanagari", "raj"): (
+        "म्हनै तीन दिनां सूं ताव है अर माथो दुखै है। म्हारै पेट में दरद है अर उल्टी भी होवै है। "
+        "कांई म्हनै डाक्टर कनै जावणो चाईजै? म्हूं घणो थाक्योड़ो हूं। खांसी अर गळै में खराश है। "
+        "थानै ओ दरद कद सूं है? म्हनै नींद कोनी आवै।"
+    ),
+    ("bengali", "bn"): (
+        "আমার তিন দিন ধরে জ্বর আর মাথাব্যথা হচ্ছে। আমার পেটে ব্যথা এবং বমি হচ্ছে। "
+        "আমার কি ডাক্তারের কাছে যাওয়া উচিত? আমি খুব ক্লান্ত বোধ করছি। কাশি আর গলা ব্যথা আছে। "
+        "এই ব্যথা কবে থেকে? আমার ঘুম হয় না।"
+    ),
+    ("bengali", "as"): (
+        "মোৰ তিনি দিনৰ পৰা জ্বৰ আৰু মূৰৰ বিষ হৈছে। মোৰ পেটৰ বিষ আৰু বমি হৈছে। "
+        "মই ডাক্তৰৰ ওচৰলৈ যাব লাগিবনে? মই বৰ ভাগৰুৱা অনুভৱ কৰিছোঁ। কাহ আৰু ডিঙিৰ বিষ আছে। "
+        "এই বিষ কেতিয়াৰ পৰা? মোৰ টোপনি নাহে।"
+    ),
+    ("bengali", "mni"): (
+        "ঐগী নুমিৎ অহুম লৈরে অমসুং কোক অনারে। ঐগী পুক নাই অমসুং ওনবা লাক্লি। "
+        "ঐ দাক্তরগী মফমদা চৎকদ্রা? ঐ য়াম্না শোক্লে। খোং অমসুং লোলদা নাই। "
+        "অসি করম্বা মতমদগী নাইবনো? ঐ তুম্বা ঙমদে।"
+    ),
+}
+
+# Frequent words that separate romanized Hindi from English
+ROMANIZED_HINDI_WORDS = {
+    "hai", "hain", "ho", "hoon", "hu", "tha", "thi", "raha", "rahi", "rahe", "mujhe", "mera", "meri",
+    "mere", "main", "mai", "hum", "aap", "kya", "kyun", "kab", "kaise", "nahi", "nahin", "bahut",
+    "aur", "se", "ko", "ka", "ki", "ke", "mein", "par", "bhi", "dard", "bukhar", "pet", "sir",
+    "khansi", "ulti", "din", "kal", "abhi", "thoda", "zyada", "jyada", "haan", "ji", "dawai", "neend"
+}
+ENGLISH_WORDS = {
+    "i", "is", "am", "are", "was", "have", "has", "had", "my", "me", "the", "a", "an", "and", "or",
+    "of", "to", "in", "on", "for", "with", "it", "this", "that", "what", "when", "how", "not", "no",
+    "yes", "pain", "fever", "feel", "since", "days", "very", "doctor", "cough", "headache", "can"
+}
+
+_WORD = re.compile(r"[^\W\d_]+", re.UNICODE)
+
+
+def script_of(char: str) -> Optional[str]:
+    """Script name of a letter, or None for anything that is not a letter."""
+    code = ord(char)
+    for name, start, end in SCRIPT_RANGES:
+        if start <= code <= end:
+            return name
+    if char.isalpha() and code < 0x0250:
+        return "latin"
+    return None
+
+
+def _ngrams(text: str, n: int = 3) -> List[str]:
+    padded = f" {' '.join(_WORD.findall(text.lower()))} "
+    return [padded[i:i + n] for i in range(len(padded) - n + 1)]
+
+
+class LanguageGuess:
+    """Result of identifying the language of a piece of text."""
+
+    def __init__(
+        self,
+        language: Optional[str],
+        script: Optional[str],
+        confidence: float,
+        romanized: bool = False,
+        source: str = "local",
+        hint: Optional[str] = None
+    ):
+        self.language = language
+        self.script = script
+        self.confidence = confidence
+        self.romanized = romanized
+        self.source = source
+        self.hint = hint
+
+    def to_dict(self) -> Dict:
+        return {
+            "language": self.language,
+            "script": self.script,
+            "confidence": round(self.confidence, 3),
+            "romanized": self.romanized,
+            "source": self.source,
+            "hint": self.hint
+        }
+
+
+class LanguageIdentifier:
+    """Offline text language identification for the supported LanguageCodes.
+
+    The dominant Unicode script decides the language outright where only one
+    supported language uses it. Devanagari, Bengali-Assamese and Latin are
+    shared, so a character trigram model trained on SEED_TEXT picks between
+    their languages; Latin text also gets a function-word vote to separate
+    romanized Hindi from English.
+    """
+
+    def __init__(self, seed_text: Dict = SEED_TEXT, alpha: float = 0.5):
+        self.alpha = alpha
+        self.profiles: Dict[tuple, Counter] = {key: Counter(_ngrams(text)) for key, text in seed_text.items()}
+        self.totals = {key: sum(profile.values()) for key, profile in self.profiles.items()}
+        self.vocab_size = len(set().union(*self.profiles.values())) if self.profiles else 1
+
+    def dominant_script(self, text: str) -> Optional[str]:
+        counts = Counter(script for script in map(script_of, text) if script)
+        if not counts:
+            return None
+        letters = sum(counts.values())
+        native = [(count, script) for script, count in counts.items() if script != "latin"]
+        if native:
+            count, script = max(native)
+            if count / letters >= MIN_NATIVE_SHARE:
+                return script
+        return counts.most_common(1)[0][0]
+
+    def _ngram_scores(self, text: str, script: str) -> Dict[str, float]:
+        """Log-likelihood of the text under each language profile for a script."""
+        grams = _ngrams(text)
+        scores = {}
+        for language in SCRIPT_LANGUAGES[script]:
+            key = (script, language)
+            if key not in self.profiles:
+                continue
+            profile, total = self.profiles[key], self.totals[key]
+            denominator = total + self.alpha * self.vocab_size
+            scores[language] = sum(math.log((profile[g] + self.alpha) / denominator) for g in grams)
+        return scores
+
+    @staticmethod
+    def _softmax_best(scores: Dict[str, float]):
+        best = max(scores, key=scores.get)
+        top = scores[best]
+        total = sum(math.exp(score - top) for score in scores.values())
+        return best, 1.0 / total
+
+    def _latin(self, text: str) -> LanguageGuess:
+        words = [word.lower() for word in _WORD.findall(text)]
+        hindi = sum(word in ROMANIZED_HINDI_WORDS for word in words)
+        english = sum(word in ENGLISH_WORDS for word in words)
+        if hindi != english:
+            language = "hi" if hindi > english else "en"
+            confidence = max(hindi, english) / (hindi + english)
+        else:
+            language, confidence = self._softmax_best(self._ngram_scores(text, "latin"))
+        return LanguageGuess(language, "latin", confidence, romanized=language == "hi")
+
+    def identify(self, text: str) -> LanguageGuess:
+        """Identify the language of text; language is None if it has no letters."""
+        text = unicodedata.normalize("NFC", text or "")
+        script = self.dominant_script(text)
+        if script is None:
+            return LanguageGuess(None, None, 0.0)
+        if script == "latin":
+            return self._latin(text)
+
+        candidates = SCRIPT_LANGUAGES[script]
+        if len(candidates) == 1:
+            return LanguageGuess(candidates[0], script, 1.0)
+        scores = self._ngram_scores(text, script)
+        language, confidence = self._softmax_best(scores)
+        return LanguageGuess(language, script, confidence)
+
+    def resolve(self, text: str, hint: Optional[str] = None, default: str = "en") -> LanguageGuess:
+        """Pick the language to translate a message from, using the client's hint when it fits.
+
+        A hint in the same script as the text is trusted (the client knows
+        Marathi from Hindi better than a few words do); a hint that
+        contradicts the script is overridden by detection. Latin text is
+        always read as English: the translation backend only takes Hindi
+        in Devanagari, while the model understands romanized Hindi as
+        written, so it goes through untranslated with romanized set.
+        The hint is kept on the result either way.
+        """
+        guess = self.identify(text)
+        if guess.language is None:
+            return LanguageGuess(hint or default, None, 0.0, source="hint" if hint else "default", hint=hint)
+        if guess.script == "latin":
+            return LanguageGuess(
+                "en",
+                "latin",
+                guess.confidence,
+                romanized=guess.romanized,
+                source="hint" if hint == "en" else "local",
+                hint=hint
+            )
+        if hint and hint in SCRIPT_LANGUAGES.get(guess.script, []):
+            return LanguageGuess(hint, guess.script, guess.confidence, source="hint", hint=hint)
+        guess.hint = hint
+        return guess
+
+
+_language_identifier: Optional[LanguageIdentifier] = None
+
+
+def get_language_identifier() -> LanguageIdentifier:
+    """Return the process-wide identifier, building its profiles on first use."""
+    global _language_identifier
+    if _language_identifier is None:
+        _language_identifier = LanguageIdentifier()
+    return _language_identifier
@@ -0,0 +1,144 @@
+# backend/app/utils/language_registry.py
+from typing import Dict, FrozenSet, List, Optional
+from datetime import datetime
+from app.services.bhashini_service import BhashiniService
+import asyncio
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+LANGUAGE_REFRESH_SECONDS = int(os.getenv("LANGUAGE_REFRESH_SECONDS", "900"))
+LANGUAGE_REFRESH_TIMEOUT_SECONDS = float(os.getenv("LANGUAGE_REFRESH_TIMEOUT_SECONDS", "10"))
+
+# Bhashini /languages keys
+CAPABILITIES = ("stt", "tts", "translation")
+
+# Languages the app has metadata for; also the fallback capability set
+LANGUAGE_METADATA = {
+    "en": {
+        "name": "English",
+        "variants": ["eng", "en-IN", "en-US"],
+        "common_phrases": ["hello", "hi", "thank you"]
+    },
+    "hi": {
+        "name": "Hindi",
+        "variants": ["hin", "hi-IN"],
+        "common_phrases": ["नमस्ते", "धन्यवाद"]
+    },
+    "ta": {
+        "name": "Tamil",
+        "variants": ["tam", "ta-IN"],
+        "common_phrases": ["வணக்கம்", "நன்றி"]
+    },
+    "te": {
+        "name": "Telugu",
+        "variants": ["tel", "te-IN"],
+        "common_phrases": ["నమస్కారం", "ధన్యవాదాలు"]
+    },
+    "ml": {
+        "name": "Malayalam",
+        "variants": ["mal", "ml-IN"],
+        "common_phrases": ["നമസ്കാരം", "നന്ദി"]
+    },
+    "kn": {
+        "name": "Kannada",
+        "variants": ["kan", "kn-IN"],
+        "common_phrases": ["ನಮಸ್ಕಾರ", "ಧನ್ಯವಾದಗಳು"]
+    },
+    "bn": {
+        "name": "Bengali",
+        "variants": ["ben", "bn-IN"],
+        "common_phrases": ["নমস্কার", "ধন্যবাদ"]
+    }
+}
+
+
+class LanguageCapabilityRegistry:
+    """In-memory matrix of which languages Bhashini supports per capability.
+
+    Loaded in the background at startup and refreshed every refresh_seconds,
+    so language checks on the request path are set lookups. Until the first
+    successful refresh, and whenever the live data is unusable, every
+    capability falls back to the languages in LANGUAGE_METADATA.
+    """
+
+    def __init__(self, refresh_seconds: int = LANGUAGE_REFRESH_SECONDS):
+        self.refresh_seconds = refresh_seconds
+        self._fallback: FrozenSet[str] = frozenset(LANGUAGE_METADATA)
+        self._capabilities: Dict[str, FrozenSet[str]] = {
+            capability: self._fallback for capability in CAPABILITIES
+        }
+        self.source = "static"
+        self.refreshed_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def supports(self, language_code: str, capability: Optional[str] = None) -> bool:
+        """True if the language is supported for capability (or for any, if None)."""
+        if capability is None:
+            return any(language_code in languages for languages in self._capabilities.values())
+        return language_code in self._capabilities.get(capability, self._fallback)
+
+    def capabilities(self) -> Dict[str, List[str]]:
+        return {capability: sorted(languages) for capability, languages in self._capabilities.items()}
+
+    async def refresh(self) -> bool:
+        """Reload the matrix from Bhashini; keeps the current one on failure."""
+        try:
+            data = await asyncio.wait_for(
+                BhashiniService().get_supported_languages(),
+                timeout=LANGUAGE_REFRESH_TIMEOUT_SECONDS
+            )
+            capabilities = {
+                capability: frozenset(data.get(capability) or [])
+                for capability in CAPABILITIES
+            }
+            # The service answers non-200 responses with empty lists
+            if not any(capabilities.values()):
+                raise ValueError("Bhashini returned no supported languages")
+
+            self._capabilities = {
+                capability: languages or self._fallback
+                for capability, languages in capabilities.items()
+            }
+            self.source = "bhashini"
+            self.refreshed_at = datetime.utcnow()
+            self.last_error = None
+            logger.info(f"Language capabilities refreshed: {self.capabilities()}")
+            return True
+
+        except Exception as e:
+            self.last_error = str(e) or type(e).__name__
+            logger.error(f"Language capability refresh failed, keeping {self.source} data: {self.last_error}")
+            return False
+
+    async def _refresh_loop(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_seconds)
+
+    def start(self):
+        """Load the matrix now and keep it fresh in a background task."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def status(self) -> Dict:
+        return {
+            "source": self.source,
+            "refreshed_at": self.refreshed_at.isoformat() if self.refreshed_at else None,
+            "last_error": self.last_error,
+            "capabilities": self.capabilities()
+        }
+
+
+language_registry = LanguageCapabilityRegistry()
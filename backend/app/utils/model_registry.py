@@ -0,0 +1,121 @@
+# backend/app/utils/model_registry.py
+from typing import Dict, Optional
+from datetime import datetime
+import threading
+import time
+import logging
+from app.utils.symptom_lexicon import SymptomLexicon
+
+logger = logging.getLogger(__name__)
+
+NER_MODEL_NAME = "samrawal/bert-base-uncased_clinical-ner"
+
+# Representative patient inputs used to trigger the first (slow) forward pass
+WARMUP_INPUTS = [
+    "I have had a severe headache and fever for three days.",
+    "My chest feels tight and I am short of breath when climbing stairs.",
+    "Stomach pain after eating, with nausea and occasional vomiting.",
+]
+
+_ner_pipeline = None
+_symptom_lexicon: Optional[SymptomLexicon] = None
+_lock = threading.Lock()
+
+
+def get_ner_pipeline():
+    """Return the process-wide clinical NER pipeline, loading it on first use."""
+    global _ner_pipeline
+    if _ner_pipeline is None:
+        with _lock:
+            if _ner_pipeline is None:
+                from transformers import pipeline
+                _ner_pipeline = pipeline("ner", model=NER_MODEL_NAME)
+    return _ner_pipeline
+
+
+def get_symptom_lexicon() -> SymptomLexicon:
+    """Return the process-wide compiled symptom lexicon."""
+    global _symptom_lexicon
+    if _symptom_lexicon is None:
+        with _lock:
+            if _symptom_lexicon is None:
+                _symptom_lexicon = SymptomLexicon()
+    return _symptom_lexicon
+
+
+class StartupState:
+    """Tracks model warm-up progress for the readiness endpoint."""
+
+    def __init__(self):
+        self.ready = False
+        self.started_at: Optional[datetime] = None
+        self.completed_at: Optional[datetime] = None
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    def record(self, component: str, seconds: float):
+        self.timings[component] = round(seconds * 1000, 2)
+        logger.info(f"Startup component '{component}' took {self.timings[component]}ms")
+
+    def to_dict(self) -> Dict:
+        return {
+            "ready": self.ready,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "timings_ms": self.timings,
+            "total_ms": round(sum(self.timings.values()), 2),
+            "errors": self.errors
+        }
+
+
+startup_state = StartupState()
+
+
+def _timed(component: str, fn):
+    """Run one warm-up step, recording its duration and any error."""
+    start = time.perf_counter()
+    try:
+        result = fn()
+        # A retry in a forked worker clears an error inherited from the parent
+        startup_state.errors.pop(component, None)
+        return result
+    except Exception as e:
+        logger.error(f"Warm-up of '{component}' failed: {str(e)}")
+        startup_state.errors[component] = str(e)
+        return None
+    finally:
+        startup_state.record(component, time.perf_counter() - start)
+
+
+def preload_models() -> StartupState:
+    """Load model weights without running inference.
+
+    Used by the pre-fork launcher in the parent process: workers inherit the
+    loaded weights copy-on-write. Inference is left to each worker because
+    thread pools started before fork() are not safe to reuse in the child.
+    """
+    startup_state.started_at = datetime.utcnow()
+    _timed("symptom_lexicon_compile", get_symptom_lexicon)
+    _timed("ner_model_load", get_ner_pipeline)
+    return startup_state
+
+
+def warm_up_models() -> StartupState:
+    """Load every local model and run representative inputs through it.
+
+    Blocking; call it from a worker thread so the event loop keeps serving
+    liveness checks while models load.
+    """
+    startup_state.started_at = datetime.utcnow()
+
+    lexicon = _timed("symptom_lexicon_compile", get_symptom_lexicon)
+    if lexicon:
+        _timed("symptom_lexicon_warmup", lambda: [lexicon.extract(text) for text in WARMUP_INPUTS])
+
+    # Download/load weights and build the tokenizer, then the first forward pass
+    ner = _timed("ner_model_load", get_ner_pipeline)
+    if ner:
+        _timed("ner_first_inference", lambda: ner(WARMUP_INPUTS[0]))
+        _timed("ner_warmup_batch", lambda: [ner(text) for text in WARMUP_INPUTS])
+
+    return startup_state
@@ -1,16 +1,12 @@
 # backend/app/utils/report_generator.py
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+# Rendering (reportlab, matplotlib) lives in app.utils.report_renderer and runs
+# in a process pool, so importing the API does not pay for the rendering stack.
 from io import BytesIO
-import matplotlib.pyplot as plt
-import numpy as np
 from datetime import datetime
+from xml.sax.saxutils import escape
 from app.utils.speech_processor import MultilingualSpeechProcessor
+from app.utils.label_bundle import report_labels
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -18,46 +14,6 @@ logger = logging.getLogger(__name__)
 class MultilingualReportGenerator:
     def __init__(self):
         self.speech_processor = MultilingualSpeechProcessor()
-        
-        # Register fonts for different scripts
-        self._register_fonts()
-        
-        # Translation labels for different languages
-        self.section_labels = {
-            "en": {
-                "title": "Medical Consultation Report",
-                "patient_info": "Patient Information",
-                "diagnosis": "Diagnosis Summary",
-                "symptoms": "Based on your reported symptoms:",
-                "safety": "Safety Concerns",
-                "urgency": "Urgency Level",
-                "symptoms_analysis": "Detailed Symptoms Analysis",
-                "chart": "Symptoms Analysis Chart",
-                "followup": "Follow-up Information",
-                "treatment": "Treatment Recommendations",
-                "medications": "Recommended Medications:",
-                "remedies": "Home Remedies:",
-                "precautions": "Important Precautions",
-                "disclaimer": "This is an AI-generated pre-diagnosis report and should not be considered as a replacement for professional medical advice."
-            },
-            "hi": {
-                "title": "चिकित्सा परामर्श रिपोर्ट",
-                "patient_info": "रोगी की जानकारी",
-                # Add other Hindi translations
-            },
-            # Add other language translations
-        }
-
-    def _register_fonts(self):
-        """Register fonts for different scripts."""
-        try:
-            # Register custom fonts for different scripts
-            pdfmetrics.registerFont(TTFont('NotoSans', 'path/to/NotoSans-Regular.ttf'))
-            pdfmetrics.registerFont(TTFont('NotoSansDevanagari', 'path/to/NotoSansDevanagari-Regular.ttf'))
-            # Add more script-specific fonts
-        except Exception as e:
-            logger.error(f"Error registering fonts: {e}")
-            # Fallback to default fonts
 
     async def _get_translated_text(self, text: str, target_language: str) -> str:
         """Translate text if needed."""
@@ -75,154 +31,78 @@ class MultilingualReportGenerator:
             return text
 
     def _get_font_for_language(self, language: str) -> str:
-        """Get appropriate font for language."""
-        font_mapping = {
-            "hi": "NotoSansDevanagari",
-            "ta": "NotoSansTamil",
-            # Add more language-font mappings
-        }
-        return font_mapping.get(language, "Helvetica")
+        """Get appropriate font for language (as resolved in the render processes)."""
+        from app.utils.report_renderer import font_for_language
+        return font_for_language(language)
 
     async def create_pdf_report(self, consultation_data: dict, language: str = "en") -> BytesIO:
-        """Create multilingual PDF report."""
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72
-        )
+        """Create multilingual PDF report.
 
-        # Get labels for target language
-        labels = self.section_labels.get(language, self.section_labels["en"])
-        
-        # Get appropriate font
-        base_font = self._get_font_for_language(language)
-        
-        styles = getSampleStyleSheet()
-        # Add custom styles with language-specific fonts
-        styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor('#1976d2'),
-            fontName=base_font
-        ))
-        styles.add(ParagraphStyle(
-            name='SectionTitle',
-            parent=styles['Heading2'],
-            fontSize=18,
-            spaceAfter=12,
-            textColor=colors.HexColor('#1976d2'),
-            fontName=base_font
-        ))
-        styles.add(ParagraphStyle(
-            name='NormalMulti',
-            parent=styles['Normal'],
-            fontName=base_font
-        ))
+        Labels come from the precomputed bundle and symptom names are
+        translated here on the event loop; layout and rendering run in the
+        warm process pool.
+        """
+        from app.utils.report_renderer import render_pool
+
+        labels = report_labels.for_language(language)
+        details = consultation_data['userDetails']
 
-        story = []
+        blocks = []
         
         # Header with translated title
-        title = await self._get_translated_text(labels["title"], language)
-        story.append(Paragraph(title, styles['CustomTitle']))
-        
-        consultation_id_text = await self._get_translated_text("Consultation ID:", language)
-        story.append(Paragraph(f"{consultation_id_text} {consultation_data['consultation_id']}", styles['NormalMulti']))
-        
-        date_text = await self._get_translated_text("Date:", language)
-        story.append(Paragraph(f"{date_text} {datetime.now().strftime('%Y-%m-%d %H:%M')}", styles['NormalMulti']))
-        story.append(Spacer(1, 20))
+        blocks.append(("title", labels["title"]))
+        blocks.append(("text", f"{labels['consultation_id']} {consultation_data['consultation_id']}"))
+        blocks.append(("text", f"{labels['date']} {datetime.now().strftime('%Y-%m-%d %H:%M')}"))
+        blocks.append(("spacer", 20))
 
         # Patient Information
-        patient_info_title = await self._get_translated_text(labels["patient_info"], language)
-        story.append(Paragraph(patient_info_title, styles['SectionTitle']))
+        blocks.append(("section", labels["patient_info"]))
         
-        # Translate patient data labels
         patient_data = [
-            [await self._get_translated_text("Name", language), 
-             f"{consultation_data['userDetails']['firstName']} {consultation_data['userDetails']['lastName']}"],
-            [await self._get_translated_text("Age", language), 
-             str(consultation_data['userDetails']['age'])],
-            [await self._get_translated_text("Gender", language), 
-             await self._get_translated_text(consultation_data['userDetails']['gender'], language)],
-            [await self._get_translated_text("Height", language), 
-             f"{consultation_data['userDetails']['height']} cm"],
-            [await self._get_translated_text("Weight", language), 
-             f"{consultation_data['userDetails']['weight']} kg"]
+            [labels["name"], f"{details['firstName']} {details['lastName']}"],
+            [labels["age"], str(details['age'])],
+            [labels["gender"], labels.get(f"gender_{details['gender']}", details['gender'])],
+            [labels["height"], f"{details['height']} cm"],
+            [labels["weight"], f"{details['weight']} kg"]
         ]
-
-        # Similar updates for other sections...
-        # Continue with the same structure but with translations
+        # Values are user input and the renderer parses Paragraph markup
+        for label, value in patient_data:
+            blocks.append(("text", f"{label}: {escape(value)}"))
+        blocks.append(("spacer", 10))
 
         # Diagnosis Summary
-        diagnosis_title = await self._get_translated_text(labels["diagnosis"], language)
-        story.append(Paragraph(diagnosis_title, styles['SectionTitle']))
+        blocks.append(("section", labels["diagnosis"]))
         
         # Translate and format symptoms
-        symptoms_text = await self._get_translated_text(labels["symptoms"], language) + "\n"
-        for symptom in consultation_data['diagnosis']['symptoms']:
-            symptom_name = await self._get_translated_text(symptom['name'], language)
-            intensity_text = await self._get_translated_text("intensity", language)
-            confidence_text = await self._get_translated_text("confidence", language)
-            symptoms_text += f"- {symptom_name}: {symptom['severity']}/10 {intensity_text} {symptom.get('confidence', 'N/A')}% {confidence_text}\n"
+        symptoms = consultation_data['diagnosis']['symptoms']
+        symptom_names = await asyncio.gather(*[
+            self._get_translated_text(symptom['name'], language) for symptom in symptoms
+        ])
+        symptoms_text = labels["symptoms"] + "\n"
+        for symptom, symptom_name in zip(symptoms, symptom_names):
+            symptoms_text += f"- {symptom_name}: {symptom['severity']}/10 {labels['intensity']} {symptom.get('confidence', 'N/A')}% {labels['confidence']}\n"
         
-        story.append(Paragraph(symptoms_text, styles['NormalMulti']))
-        story.append(Spacer(1, 10))
+        blocks.append(("text", symptoms_text))
+        blocks.append(("spacer", 10))
 
         # Continue with other sections...
         # Add translated charts, recommendations, etc.
 
         # Disclaimer in target language
-        disclaimer_style = ParagraphStyle(
-            'Disclaimer',
-            parent=styles['NormalMulti'],
-            fontSize=8,
-            textColor=colors.grey,
-            alignment=1
-        )
-        
-        disclaimer_text = await self._get_translated_text(labels["disclaimer"], language)
-        story.append(Paragraph(disclaimer_text, disclaimer_style))
+        blocks.append(("disclaimer", labels["disclaimer"]))
         
-        # Build document
-        doc.build(story)
-        buffer.seek(0)
+        # Build document off the event loop
+        buffer = BytesIO(await render_pool.render_pdf(language, blocks))
         return buffer
 
     def create_symptoms_chart(self, symptoms, language: str = "en"):
         """Create symptoms radar chart with translated labels."""
         try:
-            # Translate symptom names
+            from app.utils.report_renderer import render_symptoms_chart
+
             names = [symptom['name'] for symptom in symptoms]
             values = [symptom.get('severity', symptom.get('intensity', 0)) for symptom in symptoms]
-            
-            num_vars = len(names)
-            angles = [n / float(num_vars) * 2 * np.pi for n in range(num_vars)]
-            angles += angles[:1]
-            values += values[:1]
-            
-            fig, ax = plt.subplots(figsize=(4, 5), subplot_kw=dict(projection='polar'))
-            
-            # Use appropriate font for the language
-            plt.rcParams['font.family'] = self._get_font_for_language(language)
-            
-            ax.plot(angles, values)
-            ax.fill(angles, values, alpha=0.25)
-            
-            ax.set_xticks(angles[:-1])
-            ax.set_xticklabels(names)
-            
-            img_buffer = BytesIO()
-            plt.savefig(img_buffer, format='png', bbox_inches='tight')
-            plt.close()
-            
-            return img_buffer
+            return BytesIO(render_symptoms_chart(names, values, self._get_font_for_language(language)))
             
         except Exception as e:
             logger.error(f"Error creating symptoms chart: {e}")
-            return None
\ No newline at end of file
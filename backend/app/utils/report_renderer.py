@@ -0,0 +1,207 @@
+# backend/app/utils/report_renderer.py
+"""CPU-bound PDF and chart rendering, run in a warm process pool.
+
+Kept free of app imports (database clients, models) so pool processes
+start quickly and only load reportlab and matplotlib. Each process
+registers fonts once in its initializer and builds each style sheet
+once; charts use matplotlib's object-oriented Agg API, so no pyplot
+global state is touched.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
+from typing import Dict, List, Optional, Tuple
+import asyncio
+import logging
+import math
+import multiprocessing
+import os
+
+logger = logging.getLogger(__name__)
+
+REPORT_RENDER_PROCESSES = int(os.getenv("REPORT_RENDER_PROCESSES", "2"))
+REPORT_FONT_DIR = os.getenv("REPORT_FONT_DIR", os.path.join(os.getcwd(), "fonts"))
+
+FONT_FILES = {
+    "NotoSans": "NotoSans-Regular.ttf",
+    "NotoSansDevanagari": "NotoSansDevanagari-Regular.ttf",
+    "NotoSansTamil": "NotoSansTamil-Regular.ttf"
+}
+LANGUAGE_FONTS = {
+    "hi": "NotoSansDevanagari",
+    "mr": "NotoSansDevanagari",
+    "ta": "NotoSansTamil"
+}
+DEFAULT_FONT = "Helvetica"
+
+# Fonts registered in this process
+_registered_fonts = set()
+
+
+def register_fonts(font_dir: str = REPORT_FONT_DIR):
+    """Register the script fonts that are installed; missing ones fall back to Helvetica."""
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+
+    for name, filename in FONT_FILES.items():
+        path = os.path.join(font_dir, filename)
+        if name in _registered_fonts or not os.path.exists(path):
+            continue
+        try:
+            pdfmetrics.registerFont(TTFont(name, path))
+            _registered_fonts.add(name)
+        except Exception as e:
+            logger.error(f"Error registering font {name}: {e}")
+
+
+def font_for_language(language: str) -> str:
+    font = LANGUAGE_FONTS.get(language, DEFAULT_FONT)
+    return font if font in _registered_fonts else DEFAULT_FONT
+
+
+@lru_cache(maxsize=None)
+def styles_for(font: str) -> Dict:
+    """Paragraph styles for a base font, built once per process."""
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    sample = getSampleStyleSheet()
+    normal = ParagraphStyle(name='NormalMulti', parent=sample['Normal'], fontName=font)
+    return {
+        "title": ParagraphStyle(
+            name='CustomTitle',
+            parent=sample['Heading1'],
+            fontSize=24,
+            spaceAfter=30,
+            textColor=colors.HexColor('#1976d2'),
+            fontName=font
+        ),
+        "section": ParagraphStyle(
+            name='SectionTitle',
+            parent=sample['Heading2'],
+            fontSize=18,
+            spaceAfter=12,
+            textColor=colors.HexColor('#1976d2'),
+            fontName=font
+        ),
+        "text": normal,
+        "disclaimer": ParagraphStyle(
+            'Disclaimer',
+            parent=normal,
+            fontSize=8,
+            textColor=colors.grey,
+            alignment=1
+        )
+    }
+
+
+def render_symptoms_chart(names: List[str], values: List[float], font: str = DEFAULT_FONT) -> bytes:
+    """Symptoms radar chart as PNG bytes."""
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    num_vars = len(names)
+    angles = [n / float(num_vars) * 2 * math.pi for n in range(num_vars)]
+    angles += angles[:1]
+    values = list(values) + list(values[:1])
+
+    fig = Figure(figsize=(4, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection='polar')
+    ax.plot(angles, values)
+    ax.fill(angles, values, alpha=0.25)
+    ax.set_xticks(angles[:-1])
+    # Matplotlib knows fonts by family name; unknown families fall back to its default
+    ax.set_xticklabels(names, fontfamily=font if font != DEFAULT_FONT else "sans-serif")
+
+    img_buffer = BytesIO()
+    fig.savefig(img_buffer, format='png', bbox_inches='tight')
+    return img_buffer.getvalue()
+
+
+def render_pdf(language: str, blocks: List[Tuple]) -> bytes:
+    """Lay out a report from pre-translated blocks.
+
+    Blocks are ("title" | "section" | "text" | "disclaimer", text),
+    ("spacer", height) or ("chart", names, values).
+    """
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image
+
+    font = font_for_language(language)
+    styles = styles_for(font)
+    story = []
+    for block in blocks:
+        kind = block[0]
+        if kind == "spacer":
+            story.append(Spacer(1, block[1]))
+        elif kind == "chart":
+            png = render_symptoms_chart(block[1], block[2], font)
+            story.append(Image(BytesIO(png), width=240, height=300))
+        else:
+            story.append(Paragraph(block[1], styles[kind]))
+
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=letter,
+        rightMargin=72,
+        leftMargin=72,
+        topMargin=72,
+        bottomMargin=72
+    )
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def _init_worker():
+    """Pool initializer: pay font registration and imports once per process."""
+    register_fonts()
+    for font in {DEFAULT_FONT, *_registered_fonts}:
+        styles_for(font)
+    import reportlab.platypus  # noqa: F401
+    import matplotlib.backends.backend_agg  # noqa: F401
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class RenderPool:
+    """Lazily started process pool for report rendering."""
+
+    def __init__(self, processes: int = REPORT_RENDER_PROCESSES):
+        self.processes = processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn: forking a process that holds event loops, DB clients and
+            # model threads is unsafe. Spawned processes re-import __main__,
+            # so entry points keep their heavy imports under main()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker
+            )
+        return self._executor
+
+    async def warm(self):
+        """Start every pool process now instead of on the first report."""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[
+            loop.run_in_executor(self.executor, _ping) for _ in range(self.processes)
+        ])
+
+    async def render_pdf(self, language: str, blocks: List[Tuple]) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, render_pdf, language, blocks)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+render_pool = RenderPool()
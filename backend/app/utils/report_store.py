@@ -0,0 +1,150 @@
+# backend/app/utils/report_store.py
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import time
+
+logger = logging.getLogger(__name__)
+
+REPORT_DIR = os.getenv("REPORT_DIR", os.path.join(os.getcwd(), "data", "reports"))
+REPORT_URL_PREFIX = "/api/report"
+# Stored reports are deleted after this; a later request renders them again
+REPORT_RETENTION_SECONDS = int(os.getenv("REPORT_RETENTION_SECONDS", str(30 * 24 * 3600)))
+
+SAFE_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,128}$")
+REPORT_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+LANGUAGE_PATTERN = re.compile(r"^[a-z]{2,3}$")
+
+
+def _canonical(value):
+    # MongoDB stores datetimes at millisecond precision; hash them the same
+    # way so a freshly built summary and its stored copy agree
+    if isinstance(value, datetime):
+        return value.isoformat(timespec="milliseconds")
+    return str(value)
+
+
+def summary_hash(summary: dict) -> str:
+    """Stable hash of a diagnosis summary; a new summary gives a new report."""
+    canonical = json.dumps(summary, sort_keys=True, default=_canonical, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def report_key(summary: dict, labels_fingerprint: str) -> str:
+    """Key of a rendered report: its summary plus the label text it was rendered with."""
+    combined = f"{summary_hash(summary)}:{labels_fingerprint}"
+    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+
+
+class ReportStore:
+    """Local disk store for rendered PDF reports.
+
+    A report is keyed by consultation id, report key and language, so a
+    stored file never changes: a new summary or newly translated labels
+    give a new key and are stored as a new file. The key and language
+    double as the ETag.
+    """
+
+    def __init__(self, root: str = REPORT_DIR):
+        self.root = root
+
+    def path_for(self, consultation_id: str, digest: str, language: str) -> Optional[str]:
+        """Return the file path of a report, or None for a malformed key."""
+        if not (SAFE_ID_PATTERN.match(consultation_id)
+                and REPORT_KEY_PATTERN.match(digest)
+                and LANGUAGE_PATTERN.match(language)):
+            return None
+        return os.path.join(self.root, consultation_id, f"{digest}.{language}.pdf")
+
+    def exists(self, consultation_id: str, digest: str, language: str) -> bool:
+        path = self.path_for(consultation_id, digest, language)
+        return bool(path) and os.path.exists(path)
+
+    @staticmethod
+    def etag_for(digest: str, language: str) -> str:
+        return f'"{digest[:32]}-{language}"'
+
+    @staticmethod
+    def url_for(consultation_id: str, digest: str, language: str) -> str:
+        return f"{REPORT_URL_PREFIX}/{consultation_id}/files/{digest}.{language}.pdf"
+
+    def put(self, consultation_id: str, digest: str, language: str, pdf: bytes) -> str:
+        """Store a rendered report atomically and return its path."""
+        path = self.path_for(consultation_id, digest, language)
+        if path is None:
+            raise ValueError("Invalid report key")
+
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as report_file:
+                report_file.write(pdf)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        logger.info(f"Stored report {consultation_id}/{digest[:12]}.{language} ({len(pdf)} bytes)")
+        return path
+
+    def sweep(self, max_age_seconds: float, superseded_age_seconds: float) -> Dict[str, int]:
+        """Delete expired reports and reports replaced by a newer one.
+
+        A report is expired once older than max_age_seconds. One with a
+        newer report for the same consultation and language (new summary
+        or labels) goes once older than superseded_age_seconds, which
+        leaves its download URL valid for as long as a job result can
+        still point at it.
+        """
+        now = time.time()
+        deleted = {"expired": 0, "superseded": 0}
+        try:
+            consultation_ids = os.listdir(self.root)
+        except FileNotFoundError:
+            return deleted
+
+        for consultation_id in consultation_ids:
+            directory = os.path.join(self.root, consultation_id)
+            if not (SAFE_ID_PATTERN.match(consultation_id) and os.path.isdir(directory)):
+                continue
+
+            by_language: Dict[str, List[Tuple[float, str]]] = {}
+            for filename in os.listdir(directory):
+                parts = filename.split(".")
+                if len(parts) != 3 or parts[2] != "pdf":
+                    continue
+                path = os.path.join(directory, filename)
+                try:
+                    by_language.setdefault(parts[1], []).append((os.path.getmtime(path), path))
+                except OSError:
+                    continue
+
+            for reports in by_language.values():
+                reports.sort(reverse=True)
+                for index, (mtime, path) in enumerate(reports):
+                    age = now - mtime
+                    if age > max_age_seconds:
+                        reason = "expired"
+                    elif index > 0 and age > superseded_age_seconds:
+                        reason = "superseded"
+                    else:
+                        continue
+                    try:
+                        os.remove(path)
+                        deleted[reason] += 1
+                    except OSError as e:
+                        logger.warning(f"Error deleting report {path}: {e}")
+
+            try:
+                os.rmdir(directory)
+            except OSError:
+                pass  # Not empty
+
+        logger.info(f"Report sweep deleted {deleted['expired']} expired and {deleted['superseded']} superseded reports")
+        return deleted
@@ -0,0 +1,382 @@
+# backend/app/utils/resilience.py
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+from functools import wraps
+import asyncio
+import logging
+import os
+import random
+import time
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class DependencyUnavailable(RuntimeError):
+    """An upstream call was refused without being attempted (breaker open or overloaded)."""
+
+    def __init__(self, dependency: str, reason: str):
+        super().__init__(f"{dependency} unavailable: {reason}")
+        self.dependency = dependency
+        self.reason = reason
+
+
+class CircuitBreaker:
+    """Closed -> open after failure_threshold consecutive failures.
+
+    While open every call is refused for open_seconds; the breaker then goes
+    half-open and lets a single probe through, closing on success and
+    re-opening on failure.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, open_seconds: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.open_seconds = open_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at: Optional[float] = None
+        self.probe_in_flight = False
+        self.times_opened = 0
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.open_seconds:
+                return False
+            self.state = self.HALF_OPEN
+            self.probe_in_flight = False
+        if self.state == self.HALF_OPEN:
+            if self.probe_in_flight:
+                return False
+            self.probe_in_flight = True
+        return True
+
+    def record_success(self):
+        self.consecutive_failures = 0
+        self.probe_in_flight = False
+        self.state = self.CLOSED
+
+    def record_failure(self):
+        self.consecutive_failures += 1
+        self.probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    def to_dict(self) -> Dict:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "times_opened": self.times_opened
+        }
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit driven by observed latency.
+
+    The limit grows by one per limit's worth of fast successes (additive
+    increase) and is cut by backoff_ratio when a call fails or takes longer
+    than tolerance times the smoothed baseline latency (multiplicative
+    decrease). Callers beyond the limit wait at most queue_timeout, and no
+    more than max_queue of them wait at once; the rest are refused so a
+    slow upstream cannot build an unbounded backlog.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.7,
+        tolerance: float = 2.0,
+        max_queue: int = 20,
+        queue_timeout: float = 0.5
+    ):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.tolerance = tolerance
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.in_flight = 0
+        self.waiting = 0
+        self.baseline_latency: Optional[float] = None
+        self.last_decrease = 0.0
+        self.rejected = 0
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def condition(self) -> asyncio.Condition:
+        # Created lazily so it binds to the running event loop
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> bool:
+        if self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return True
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            return False
+
+        self.waiting += 1
+        try:
+            async with self.condition:
+                await asyncio.wait_for(
+                    self.condition.wait_for(lambda: self.in_flight < int(self.limit)),
+                    timeout=self.queue_timeout
+                )
+                self.in_flight += 1
+                return True
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            return False
+        finally:
+            self.waiting -= 1
+
+    async def release(self, latency: Optional[float], ok: bool):
+        self.in_flight -= 1
+        if ok and latency is not None:
+            if self.baseline_latency is None:
+                self.baseline_latency = latency
+            slow = latency > self.baseline_latency * self.tolerance
+            # Track the baseline slowly so a brownout does not become the new normal
+            self.baseline_latency = 0.95 * self.baseline_latency + 0.05 * latency
+        else:
+            slow = True
+
+        if slow:
+            # Back off at most once per round trip, not once per slow call
+            now = time.monotonic()
+            if now - self.last_decrease >= (self.baseline_latency or 0.0):
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+                self.last_decrease = now
+        else:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+        async with self.condition:
+            self.condition.notify_all()
+
+    def to_dict(self) -> Dict:
+        return {
+            "limit": round(self.limit, 2),
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "baseline_latency_ms": round(self.baseline_latency * 1000, 1) if self.baseline_latency else None
+        }
+
+
+class RetryBudget:
+    """Token bucket that caps retries at a fraction of first attempts.
+
+    Every call deposits ratio tokens and every retry spends one, so during an
+    outage retries add at most ratio extra load instead of multiplying it.
+    """
+
+    def __init__(self, ratio: float = 0.2, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.retries = 0
+        self.denied = 0
+
+    def deposit(self):
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        if self.tokens >= 1.0:
+            self.tokens -= 1.0
+            self.retries += 1
+            return True
+        self.denied += 1
+        return False
+
+    def to_dict(self) -> Dict:
+        return {"tokens": round(self.tokens, 2), "retries": self.retries, "denied": self.denied}
+
+
+def backoff_delay(attempt: int, base: float = 0.1, cap: float = 2.0) -> float:
+    """Full-jitter exponential backoff."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+class ResilientDependency:
+    """Breaker, adaptive limit, timeout and retry budget for one upstream.
+
+    A caller that gives up (its own deadline cancels the call) after
+    slow_seconds counts as a failure, since it waited on a slow upstream.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timeout: float,
+        max_attempts: int = 2,
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        slow_seconds: Optional[float] = None
+    ):
+        self.name = name
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.breaker = breaker or CircuitBreaker()
+        self.limiter = limiter or AdaptiveLimiter()
+        self.retry_budget = retry_budget or RetryBudget()
+        self.slow_seconds = slow_seconds if slow_seconds is not None else timeout / 2
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self._pending_releases = set()
+
+    def _release_after(self, thread_done: Optional[asyncio.Future]) -> Optional[Awaitable]:
+        """Release a failed call's slot now, or once its thread has returned.
+
+        Cancelling a task does not stop a thread it is waiting on, and the
+        upstream call in it stays in flight, so the slot stays taken.
+        """
+        if thread_done is None or thread_done.done():
+            return self.limiter.release(None, ok=False)
+
+        def release(_):
+            task = asyncio.ensure_future(self.limiter.release(None, ok=False))
+            self._pending_releases.add(task)
+            task.add_done_callback(self._pending_releases.discard)
+
+        thread_done.add_done_callback(release)
+        return None
+
+    async def _attempt(self, call: Callable[[], T], timeout: float, in_thread: bool = False) -> T:
+        if not self.breaker.allow():
+            raise DependencyUnavailable(self.name, "circuit open")
+        if not await self.limiter.acquire():
+            # Refused before reaching upstream: not a breaker failure
+            if self.breaker.state == CircuitBreaker.HALF_OPEN:
+                self.breaker.probe_in_flight = False
+            raise DependencyUnavailable(self.name, "concurrency limit reached")
+
+        thread_done = None
+        if in_thread:
+            loop = asyncio.get_running_loop()
+            thread_done = loop.create_future()
+
+            def run():
+                try:
+                    return call()
+                finally:
+                    loop.call_soon_threadsafe(lambda: thread_done.done() or thread_done.set_result(None))
+
+            pending = asyncio.to_thread(run)
+        else:
+            pending = call()
+
+        started = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(pending, timeout=timeout)
+        except asyncio.CancelledError:
+            if time.perf_counter() - started >= self.slow_seconds:
+                self.failures += 1
+                self.timeouts += 1
+                self.breaker.record_failure()
+            else:
+                self.breaker.probe_in_flight = False
+            release = self._release_after(thread_done)
+            if release is not None:
+                await release
+            raise
+        except Exception as e:
+            self.failures += 1
+            if isinstance(e, asyncio.TimeoutError):
+                self.timeouts += 1
+            self.breaker.record_failure()
+            release = self._release_after(thread_done)
+            if release is not None:
+                await release
+            raise
+        self.breaker.record_success()
+        await self.limiter.release(time.perf_counter() - started, ok=True)
+        return result
+
+    async def call(
+        self,
+        call: Callable[[], Awaitable[T]],
+        timeout: Optional[float] = None,
+        retry: bool = True,
+        in_thread: bool = False
+    ) -> T:
+        """Run call under the dependency's protections.
+
+        With in_thread, call is a blocking function run in the default
+        executor, and its concurrency slot is held until it returns.
+        Raises DependencyUnavailable when refused up front, asyncio.TimeoutError
+        when the call exceeds its timeout, or the call's own exception.
+        """
+        self.calls += 1
+        self.retry_budget.deposit()
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(call, timeout or self.timeout, in_thread)
+            except DependencyUnavailable:
+                raise
+            except Exception as e:
+                attempt += 1
+                if not retry or attempt >= self.max_attempts or not self.retry_budget.try_spend():
+                    raise
+                delay = backoff_delay(attempt)
+                logger.warning(f"{self.name} call failed ({type(e).__name__}: {e}); retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    def to_dict(self) -> Dict:
+        return {
+            "breaker": self.breaker.to_dict(),
+            "concurrency": self.limiter.to_dict(),
+            "retry_budget": self.retry_budget.to_dict(),
+            "calls": self.calls,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "timeout_seconds": self.timeout
+        }
+
+
+# One instance per upstream per worker process
+dependencies: Dict[str, ResilientDependency] = {
+    "bhashini": ResilientDependency(
+        "bhashini",
+        timeout=float(os.getenv("BHASHINI_TIMEOUT_SECONDS", "8")),
+        limiter=AdaptiveLimiter(initial_limit=int(os.getenv("BHASHINI_CONCURRENCY", "16")), max_limit=64)
+    ),
+    # Below the 8s turn budget, so a slow call fails here (and counts
+    # against the breaker) before the turn deadline cancels it
+    "gemini": ResilientDependency(
+        "gemini",
+        timeout=float(os.getenv("GEMINI_TIMEOUT_SECONDS", "6")),
+        limiter=AdaptiveLimiter(initial_limit=int(os.getenv("GEMINI_CONCURRENCY", "8")), max_limit=32)
+    ),
+}
+
+
+def resilient(dependency: str, timeout: Optional[float] = None, retry: bool = True):
+    """Decorator running an async method through a named dependency's protections."""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await dependencies[dependency].call(
+                lambda: func(*args, **kwargs),
+                timeout=timeout,
+                retry=retry
+            )
+        return wrapper
+    return decorator
+
+
+def resilience_status() -> Dict[str, Dict]:
+    return {name: dependency.to_dict() for name, dependency in dependencies.items()}
@@ -0,0 +1,79 @@
+# backend/app/utils/sentence_segmenter.py
+from typing import List
+import re
+
+# Sentence terminators per script. Devanagari-derived scripts (Hindi, Marathi,
+# Bengali/Assamese, Gurmukhi, Odia, Bodo) use the danda; Urdu uses the Arabic
+# full stop and question mark; Meitei Mayek has its own full stop. Tamil,
+# Telugu, Kannada and Malayalam use Latin punctuation.
+DANDA = "।॥"
+ARABIC = "۔؟"
+MEITEI = "꯫"
+LATIN = ".!?"
+TERMINATORS = LATIN + DANDA + ARABIC + MEITEI
+
+# Abbreviations that end in a full stop but do not end a sentence. Units and
+# words like "no" often end one ("take 2.5 mg."), so they are not listed.
+ABBREVIATIONS = {"dr", "mr", "mrs", "ms", "vs", "e.g", "i.e", "approx"}
+
+_BOUNDARY = re.compile(
+    r"([" + re.escape(TERMINATORS) + r"]+[\"'”’)\]]*)(\s+|$)|\n+"
+)
+_CLAUSE = re.compile(r"(?<=[,;:،])\s+")
+
+
+def _ends_with_abbreviation(chunk: str) -> bool:
+    """True when a chunk ends in something like "Dr." that does not end a sentence."""
+    if not chunk.endswith("."):
+        return False
+    last_word = chunk[:-1].rsplit(None, 1)[-1].lower() if chunk[:-1].strip() else ""
+    return last_word in ABBREVIATIONS
+
+
+def split_sentences(text: str, min_chars: int = 12, max_chars: int = 300) -> List[str]:
+    """Split text into sentences for incremental speech synthesis.
+
+    Fragments shorter than min_chars are merged into their neighbour to avoid
+    one synthesis call per interjection; sentences longer than max_chars are
+    further split at clause punctuation.
+    """
+    text = text.strip()
+    if not text:
+        return []
+
+    raw = []
+    start = 0
+    for match in _BOUNDARY.finditer(text):
+        end = match.end(1) if match.group(1) else match.start()
+        chunk = text[start:end].strip()
+        if match.group(1) and _ends_with_abbreviation(chunk) and match.group(2):
+            continue
+        if chunk:
+            raw.append(chunk)
+        start = match.end()
+    if text[start:].strip():
+        raw.append(text[start:].strip())
+
+    sentences = []
+    for sentence in raw:
+        if len(sentence) <= max_chars:
+            sentences.append(sentence)
+            continue
+        current = ""
+        for clause in _CLAUSE.split(sentence):
+            if current and len(current) + len(clause) + 1 > max_chars:
+                sentences.append(current)
+                current = clause
+            else:
+                current = f"{current} {clause}".strip()
+        if current:
+            sentences.append(current)
+
+    merged: List[str] = []
+    for sentence in sentences:
+        if merged and (len(merged[-1]) < min_chars or len(sentence) < min_chars) \
+                and len(merged[-1]) + len(sentence) + 1 <= max_chars:
+            merged[-1] = f"{merged[-1]} {sentence}"
+        else:
+            merged.append(sentence)
+    return merged
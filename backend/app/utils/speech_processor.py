@@ -1,101 +1,75 @@
 # backend/app/utils/speech_processor.py
-import io
-import tempfile
-import os
 import base64
 import logging
 import uuid
-from pydub import AudioSegment
 from app.services.bhashini_service import BhashiniService
-from typing import Dict, List, Optional, Tuple
-from fastapi import HTTPException
+from app.utils.audio_transcoder import AudioTranscoder, DecodedAudio
+from app.utils.audio_preprocessor import AudioPreprocessor, STT_SAMPLE_RATE, STT_CHANNELS
+from app.utils.tts_cache import TTSCache
+from app.utils.stt_cache import STTCache
+from app.utils.audio_upload import AudioUploadStream, StreamedUpload, UploadRejected
+from app.utils.audio_blob_store import AudioBlobStore
+from app.utils.sentence_segmenter import split_sentences
+from app.utils.language_registry import LANGUAGE_METADATA, language_registry
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
+import asyncio
+from fastapi import HTTPException, Request
 
 logger = logging.getLogger(__name__)
 
 class MultilingualSpeechProcessor:
     def __init__(self):
         self.bhashini_service = BhashiniService()
+        self.transcoder = AudioTranscoder()
+        self.preprocessor = AudioPreprocessor()
+        self.tts_cache = TTSCache()
+        self.stt_cache = STTCache()
+        self.blob_store = AudioBlobStore()
         self.default_language = "en"
-        
-        # Enhanced language metadata
-        self.language_metadata = {
-            "en": {
-                "name": "English",
-                "variants": ["eng", "en-IN", "en-US"],
-                "common_phrases": ["hello", "hi", "thank you"]
-            },
-            "hi": {
-                "name": "Hindi",
-                "variants": ["hin", "hi-IN"],
-                "common_phrases": ["नमस्ते", "धन्यवाद"]
-            },
-            "ta": {
-                "name": "Tamil",
-                "variants": ["tam", "ta-IN"],
-                "common_phrases": ["வணக்கம்", "நன்றி"]
-            },
-            "te": {
-                "name": "Telugu",
-                "variants": ["tel", "te-IN"],
-                "common_phrases": ["నమస్కారం", "ధన్యవాదాలు"]
-            },
-            "ml": {
-                "name": "Malayalam",
-                "variants": ["mal", "ml-IN"],
-                "common_phrases": ["നമസ്കാരം", "നന്ദി"]
-            },
-            "kn": {
-                "name": "Kannada",
-                "variants": ["kan", "kn-IN"],
-                "common_phrases": ["ನಮಸ್ಕಾರ", "ಧನ್ಯವಾದಗಳು"]
-            },
-            "bn": {
-                "name": "Bengali",
-                "variants": ["ben", "bn-IN"],
-                "common_phrases": ["নমস্কার", "ধন্যবাদ"]
-            }
-        }
+        self.language_metadata = LANGUAGE_METADATA
 
-    async def verify_language_support(self, language_code: str) -> bool:
-        """Verify if a language is supported by Bhashini."""
-        try:
-            supported_langs = await self.bhashini_service.get_supported_languages()
-            return language_code in supported_langs
-        except Exception as e:
-            logger.error(f"Error verifying language support: {str(e)}")
-            return language_code in self.language_metadata
+    def verify_language_support(self, language_code: str, capability: Optional[str] = None) -> bool:
+        """Verify if a language is supported by Bhashini (for stt, tts or translation)."""
+        return language_registry.supports(language_code, capability)
 
-    async def convert_to_wav(self, audio_data: bytes) -> bytes:
-        """Convert audio data to WAV format."""
-        try:
-            # Save incoming audio to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.webm') as temp_webm:
-                temp_webm.write(audio_data)
-                temp_webm_path = temp_webm.name
+    async def decode_audio(self, audio_data: Union[bytes, DecodedAudio, StreamedUpload]) -> DecodedAudio:
+        """Decode an upload once; already-decoded audio is passed through.
 
+        Uploads are resampled to the recognizer's native 16 kHz mono during
+        decoding and then have leading/trailing silence trimmed.
+        """
+        if isinstance(audio_data, DecodedAudio):
+            return audio_data
+        if isinstance(audio_data, StreamedUpload):
+            # Size and duration limits surface as UploadRejected
+            decoded = await audio_data.decode()
+        else:
             try:
-                # Convert to WAV
-                audio = AudioSegment.from_file(temp_webm_path, format="webm")
-                wav_path = temp_webm_path + ".wav"
-                audio.export(wav_path, format="wav")
+                decoded = await self.transcoder.decode(
+                    audio_data,
+                    sample_rate=STT_SAMPLE_RATE,
+                    channels=STT_CHANNELS
+                )
+            except Exception as e:
+                logger.error(f"Error converting audio format: {str(e)}")
+                raise HTTPException(status_code=500, detail=f"Error converting audio: {str(e)}")
 
-                # Read the WAV file
-                with open(wav_path, 'rb') as wav_file:
-                    wav_data = wav_file.read()
-
-                return wav_data
+        try:
+            return self.preprocessor.preprocess(decoded)
+        except Exception as e:
+            logger.error(f"Error preprocessing audio, using untrimmed audio: {str(e)}")
+            return decoded
 
-            finally:
-                # Cleanup temporary files
-                for path in [temp_webm_path, wav_path]:
-                    if os.path.exists(path):
-                        os.remove(path)
+    async def ingest_upload(self, request: Request, field_name: str = "audio") -> StreamedUpload:
+        """Receive and fingerprint a multipart audio upload; decoding waits for a cache miss."""
+        return await AudioUploadStream(request, self.transcoder, field_name=field_name).read()
 
-        except Exception as e:
-            logger.error(f"Error converting audio format: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Error converting audio: {str(e)}")
+    async def convert_to_wav(self, audio_data: Union[bytes, DecodedAudio]) -> bytes:
+        """Convert audio data to WAV format in memory."""
+        decoded = await self.decode_audio(audio_data)
+        return decoded.wav
 
-    async def detect_language_from_audio(self, audio_data: bytes) -> Dict[str, any]:
+    async def detect_language_from_audio(self, audio_data: Union[bytes, DecodedAudio]) -> Dict[str, any]:
         """Automatically detect language from audio using Bhashini."""
         try:
             wav_data = await self.convert_to_wav(audio_data)
@@ -113,7 +87,7 @@ class MultilingualSpeechProcessor:
                 "language_code": detected_lang,
                 "language_name": lang_meta.get("name", "Unknown"),
                 "confidence": confidence,
-                "is_supported": await self.verify_language_support(detected_lang),
+                "is_supported": self.verify_language_support(detected_lang, "stt"),
                 "metadata": lang_meta
             }
         except Exception as e:
@@ -128,17 +102,47 @@ class MultilingualSpeechProcessor:
 
     async def process_speech_to_text(
         self, 
-        audio_data: bytes,
+        audio_data: Union[bytes, DecodedAudio, StreamedUpload],
         preferred_language: Optional[str] = None,
-        enable_auto_detect: bool = True
+        enable_auto_detect: bool = True,
+        fingerprint: Optional[str] = None
     ) -> Dict[str, any]:
         """
         Process speech to text with smart language handling.
+
+        Uploads are served from the STT cache when byte-identical audio was
+        transcribed recently with the same language parameters, and are
+        only decoded on a miss. Raw bytes are fingerprinted here, streamed
+        uploads carry their fingerprint; decoded audio is only cached when
+        the fingerprint of its source upload is passed in.
         """
+        if fingerprint is None and isinstance(audio_data, StreamedUpload):
+            fingerprint = audio_data.fingerprint
+        if fingerprint is None:
+            if isinstance(audio_data, DecodedAudio):
+                return await self._transcribe(audio_data, preferred_language, enable_auto_detect)
+            fingerprint = self.stt_cache.fingerprint(audio_data)
+        return await self.stt_cache.get_or_transcribe(
+            fingerprint,
+            preferred_language,
+            enable_auto_detect,
+            lambda: self._transcribe(audio_data, preferred_language, enable_auto_detect)
+        )
+
+    async def _transcribe(
+        self,
+        audio_data: Union[bytes, DecodedAudio, StreamedUpload],
+        preferred_language: Optional[str],
+        enable_auto_detect: bool
+    ) -> Dict[str, any]:
+        """Decode, detect the language and run STT."""
         try:
+            # Decode once; detection and recognition share the result
+            decoded = await self.decode_audio(audio_data)
+
             detected_info = None
             if enable_auto_detect:
-                detected_info = await self.detect_language_from_audio(audio_data)
+                detected_info = await self.detect_language_from_audio(decoded)
                 logger.info(f"Detected language: {detected_info['language_name']}")
 
             # Determine final language choice
@@ -149,14 +153,15 @@ class MultilingualSpeechProcessor:
             if not final_language:
                 final_language = self.default_language
 
-            # Convert to WAV for processing
-            wav_data = await self.convert_to_wav(audio_data)
+            wav_data = decoded.wav
 
             # Process with Bhashini
-            result = await self.bhashini_service.speech_to_text(
+            transcript = await self.bhashini_service.speech_to_text(
                 audio_data=wav_data,
-                language=final_language
+                source_language=final_language,
+                sample_rate=decoded.sample_rate
             )
+            result = {"text": transcript}
 
             return {
                 "text": result["text"],
@@ -168,9 +173,12 @@ class MultilingualSpeechProcessor:
                     "user_preferred": preferred_language is not None
                 },
                 "confidence": result.get("confidence", 1.0),
+                "audio": decoded.metadata(),
                 "timestamp": str(uuid.uuid4())
             }
 
+        except UploadRejected:
+            raise
         except Exception as e:
             logger.error(f"Error processing speech to text: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error processing speech: {str(e)}")
@@ -180,60 +188,123 @@ class MultilingualSpeechProcessor:
         text: str, 
         target_language: Optional[str] = None,
         voice_gender: str = "female",
-        voice_style: Optional[str] = None
+        voice_style: Optional[str] = None,
+        include_audio_data: bool = False
     ) -> Dict[str, str]:
-        """Convert text to speech with multiple language support."""
-        temp_path = None
+        """Convert text to speech with multiple language support.
+
+        Audio is stored in the blob store and returned by URL; inline base64
+        is only included when include_audio_data is set.
+        """
         try:
             if not target_language:
                 target_language = self.default_language
 
-            if not await self.verify_language_support(target_language):
+            if not self.verify_language_support(target_language, "tts"):
                 raise ValueError(f"Language {target_language} not supported")
 
-            temp_path = os.path.join(tempfile.gettempdir(), f'speech_{uuid.uuid4()}.mp3')
-
-            # Generate speech using Bhashini
-            audio_content = await self.bhashini_service.text_to_speech(
-                text=text,
-                target_language=target_language,
-                gender=voice_gender,
-                style=voice_style
-            )
-
-            # Save and encode audio
-            with open(temp_path, 'wb') as audio_file:
-                audio_file.write(audio_content)
-
-            with open(temp_path, 'rb') as audio_file:
-                audio_data = base64.b64encode(audio_file.read()).decode()
+            audio_content, cached = await self._synthesize(text, target_language, voice_gender, voice_style)
+            audio_url = await asyncio.to_thread(self.blob_store.store_url, audio_content)
 
             return {
-                "audio_data": audio_data,
+                "audio_url": audio_url,
+                "audio_data": base64.b64encode(audio_content).decode() if include_audio_data else None,
                 "language": target_language,
                 "language_name": self.language_metadata.get(target_language, {}).get("name", "Unknown"),
                 "voice_gender": voice_gender,
-                "voice_style": voice_style
+                "voice_style": voice_style,
+                "cached": cached
             }
 
         except Exception as e:
             logger.error(f"Error generating speech: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error generating speech: {str(e)}")
 
-        finally:
-            if temp_path and os.path.exists(temp_path):
+    async def _synthesize(
+        self,
+        text: str,
+        target_language: str,
+        voice_gender: str,
+        voice_style: Optional[str]
+    ) -> Tuple[bytes, bool]:
+        """Synthesize text, serving repeated phrases from the TTS cache."""
+        audio_content = await self.tts_cache.get_cached_audio(
+            text, target_language, voice_gender, voice_style
+        )
+        if audio_content is not None:
+            return audio_content, True
+
+        # Generate speech using Bhashini
+        audio_content = await self.bhashini_service.text_to_speech(
+            text=text,
+            target_language=target_language,
+            gender=voice_gender,
+            style=voice_style
+        )
+        await self.tts_cache.cache_audio(
+            text, target_language, voice_gender, voice_style, audio_content
+        )
+        return audio_content, False
+
+    async def stream_text_to_speech(
+        self,
+        text: str,
+        target_language: Optional[str] = None,
+        voice_gender: str = "female",
+        voice_style: Optional[str] = None,
+        max_concurrency: int = 4
+    ) -> AsyncIterator[Dict]:
+        """Synthesize a reply sentence by sentence, yielding segments in order.
+
+        All sentences are synthesized concurrently (at most max_concurrency
+        at a time), but each segment is yielded as soon as it and every
+        segment before it are ready, so playback can start with the first.
+        """
+        target_language = target_language or self.default_language
+        if not self.verify_language_support(target_language, "tts"):
+            raise ValueError(f"Language {target_language} not supported")
+
+        sentences = split_sentences(text)
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def synthesize_sentence(sentence: str) -> Tuple[bytes, bool]:
+            async with slots:
+                return await self._synthesize(sentence, target_language, voice_gender, voice_style)
+
+        tasks = [asyncio.create_task(synthesize_sentence(sentence)) for sentence in sentences]
+        try:
+            for index, (sentence, task) in enumerate(zip(sentences, tasks)):
                 try:
-                    os.remove(temp_path)
-                except:
-                    pass
+                    audio_content, cached = await task
+                    audio_url = await asyncio.to_thread(self.blob_store.store_url, audio_content)
+                    error = None
+                except Exception as e:
+                    logger.error(f"Error generating speech for segment {index}: {str(e)}")
+                    audio_content, audio_url, cached, error = None, None, False, str(e)
+
+                yield {
+                    "index": index,
+                    "total": len(sentences),
+                    "text": sentence,
+                    "audio_url": audio_url,
+                    "audio_content": audio_content,
+                    "language": target_language,
+                    "cached": cached,
+                    "error": error
+                }
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
 
     async def translate_speech(
         self,
-        audio_data: bytes,
+        audio_data: Union[bytes, DecodedAudio, StreamedUpload],
         source_language: Optional[str] = None,
         target_language: Optional[str] = None,
         auto_detect: bool = True,
-        voice_gender: str = "female"
+        voice_gender: str = "female",
+        fingerprint: Optional[str] = None
     ) -> Dict[str, any]:
         """Complete speech-to-speech translation."""
         try:
@@ -241,14 +312,15 @@ class MultilingualSpeechProcessor:
             stt_result = await self.process_speech_to_text(
                 audio_data=audio_data,
                 preferred_language=source_language,
-                enable_auto_detect=auto_detect
+                enable_auto_detect=auto_detect,
+                fingerprint=fingerprint
             )
 
             source_language = stt_result["language"]["code"]
             target_language = target_language or self.default_language
 
             # Verify target language
-            if not await self.verify_language_support(target_language):
+            if not self.verify_language_support(target_language, "translation"):
                 raise ValueError(f"Target language {target_language} not supported")
 
             # Translate the text
@@ -276,7 +348,7 @@ class MultilingualSpeechProcessor:
                     "text": translation_result["text"],
                     "language": target_language,
                     "language_name": self.language_metadata.get(target_language, {}).get("name", "Unknown"),
-                    "audio": tts_result["audio_data"]
+                    "audio_url": tts_result["audio_url"]
                 },
                 "metadata": {
                     "translation_confidence": translation_result.get("confidence", 1.0),
@@ -286,6 +358,8 @@ class MultilingualSpeechProcessor:
                 }
             }
 
+        except UploadRejected:
+            raise
         except Exception as e:
             logger.error(f"Error in speech translation: {str(e)}")
             raise HTTPException(status_code=500, detail=f"Error in speech translation: {str(e)}")
@@ -293,12 +367,13 @@ class MultilingualSpeechProcessor:
     async def get_supported_languages(self) -> Dict[str, any]:
         """Get information about supported languages and capabilities."""
         try:
-            bhashini_langs = await self.bhashini_service.get_supported_languages()
+            bhashini_langs = language_registry.capabilities()
             
             return {
                 "supported_languages": self.language_metadata,
                 "active_languages": bhashini_langs,
                 "default_language": self.default_language,
+                "capabilities_source": language_registry.source,
                 "capabilities": {
                     "speech_to_text": bhashini_langs.get("stt", []),
                     "text_to_speech": bhashini_langs.get("tts", []),
@@ -0,0 +1,128 @@
+# backend/app/utils/stt_cache.py
+from typing import Awaitable, Callable, Dict, Optional
+from app.config.database import redis_client
+import asyncio
+import hashlib
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+# Transcriptions currently running in this process, by cache key. Shared by
+# every STTCache instance since routes create a speech processor per request.
+_in_flight: Dict[str, asyncio.Future] = {}
+
+
+class STTCache:
+    """Short-lived cache of speech-to-text results keyed by audio fingerprint.
+
+    Mobile clients retry uploads of byte-identical audio; the SHA-256 of the
+    upload plus the language parameters identifies a result, which is kept
+    in Redis for ttl_seconds. Concurrent requests for the same key in one
+    worker share a single transcription instead of each calling STT.
+    """
+
+    def __init__(self, ttl_seconds: Optional[int] = None):
+        self.ttl_seconds = ttl_seconds or int(os.getenv("STT_CACHE_TTL_SECONDS", "600"))
+        self.redis_prefix = "stt:"
+        self.hits_key = f"{self.redis_prefix}hits"
+        self.misses_key = f"{self.redis_prefix}misses"
+        self.coalesced_key = f"{self.redis_prefix}coalesced"
+
+    @staticmethod
+    def fingerprint(audio: bytes) -> str:
+        return hashlib.sha256(audio).hexdigest()
+
+    def _generate_cache_key(
+        self,
+        fingerprint: str,
+        preferred_language: Optional[str],
+        enable_auto_detect: bool
+    ) -> str:
+        """Key from the upload fingerprint and the parameters that shape the result."""
+        detect = "auto" if enable_auto_detect else "fixed"
+        return f"{self.redis_prefix}result:{preferred_language or '-'}:{detect}:{fingerprint}"
+
+    def _get(self, cache_key: str) -> Optional[Dict]:
+        try:
+            cached = redis_client.get(cache_key)
+            redis_client.incr(self.hits_key if cached else self.misses_key)
+            return json.loads(cached) if cached else None
+        except Exception as e:
+            logger.error(f"Error retrieving cached transcript: {str(e)}")
+            return None
+
+    def _set(self, cache_key: str, result: Dict):
+        try:
+            redis_client.setex(cache_key, self.ttl_seconds, json.dumps(result))
+        except Exception as e:
+            logger.error(f"Error caching transcript: {str(e)}")
+
+    async def get_or_transcribe(
+        self,
+        fingerprint: str,
+        preferred_language: Optional[str],
+        enable_auto_detect: bool,
+        transcribe: Callable[[], Awaitable[Dict]]
+    ) -> Dict:
+        """Return a cached result, join an identical in-flight call, or run transcribe.
+
+        fingerprint is the SHA-256 hex digest of the uploaded bytes.
+        """
+        cache_key = self._generate_cache_key(fingerprint, preferred_language, enable_auto_detect)
+
+        cached = self._get(cache_key)
+        if cached is not None:
+            logger.info(f"Transcript served from cache: {cache_key}")
+            return {**cached, "cached": True}
+
+        while cache_key in _in_flight:
+            pending = _in_flight[cache_key]
+            try:
+                redis_client.incr(self.coalesced_key)
+            except Exception:
+                pass
+            logger.info(f"Joining in-flight transcription: {cache_key}")
+            try:
+                result = await asyncio.shield(pending)
+                return {**result, "cached": True}
+            except asyncio.CancelledError:
+                # Only retry when the request we joined was cancelled, not us
+                if not pending.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        _in_flight[cache_key] = future
+        try:
+            result = await transcribe()
+            self._set(cache_key, result)
+            future.set_result(result)
+            return {**result, "cached": False}
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody joined is not logged as unhandled
+            future.exception()
+            raise
+        finally:
+            _in_flight.pop(cache_key, None)
+
+    def get_stats(self) -> Dict:
+        """Hit, miss and coalesced-request counts."""
+        try:
+            hits, misses, coalesced = redis_client.mget(self.hits_key, self.misses_key, self.coalesced_key)
+            hits, misses = int(hits or 0), int(misses or 0)
+            lookups = hits + misses
+            return {
+                "hits": hits,
+                "misses": misses,
+                "coalesced": int(coalesced or 0),
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "ttl_seconds": self.ttl_seconds
+            }
+        except Exception as e:
+            logger.error(f"Error reading STT cache stats: {str(e)}")
+            return {"error": str(e)}
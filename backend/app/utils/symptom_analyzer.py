@@ -2,30 +2,40 @@
 from typing import Dict, List
 import logging
 from app.utils.ai_config import GeminiConfig
+from app.utils.symptom_lexicon import EMERGENCY_SYMPTOMS
+from app.utils.model_registry import get_ner_pipeline, get_symptom_lexicon
+from app.utils.symptom_state import SymptomState
 import json
-import re
-from transformers import pipeline
 
 logger = logging.getLogger(__name__)
 
 
-from transformers import pipeline
-from typing import Dict, List
-import logging
-
 class SymptomAnalyzer:
     def __init__(self):
         self.ai_config = GeminiConfig()
-        # Using a verified medical NER model
-        self.ner_pipeline = pipeline("ner", model="samrawal/bert-base-uncased_clinical-ner")
+        # Compiled lexicon used as a fast path before the NER model
+        self.symptom_lexicon = get_symptom_lexicon()
+        self.symptom_patterns = {
+            'pain': self.symptom_lexicon.symptom_regex,
+            'severity': self.symptom_lexicon.severity_regex,
+            'duration': self.symptom_lexicon.duration_regex,
+            'frequency': self.symptom_lexicon.frequency_regex
+        }
         
+    @property
+    def ner_pipeline(self):
+        """Shared clinical NER pipeline, preloaded by the startup warm-up."""
+        return get_ner_pipeline()
+
     async def analyze_conversation(self, chat_history: List[Dict]) -> Dict:
         try:
             # Extract conversation text
             conversation_text = "\n".join([msg["content"] for msg in chat_history])
             
-            # Use NER to identify medical entities
-            medical_entities = self.ner_pipeline(conversation_text)
+            # Use the lexicon first and fall back to NER when it finds nothing specific
+            medical_entities = self._extract_symptoms(conversation_text)
+            if not self.symptom_lexicon.is_conclusive(medical_entities):
+                medical_entities = self.ner_pipeline(conversation_text)
             
             # Structure prompt for Gemini
             analysis_prompt = f"""
@@ -56,7 +66,7 @@ class SymptomAnalyzer:
             """
             
             # Get AI analysis
-            response = self.ai_config.model.generate_content(analysis_prompt)
+            response = await self.ai_config.generate(analysis_prompt)
             return self._parse_ai_response(response.text)
             
         except Exception as e:
@@ -69,20 +79,42 @@ class SymptomAnalyzer:
 
 
     def _extract_symptoms(self, text: str) -> List[Dict]:
+        """Extract symptoms with the compiled lexicon (no model call)."""
+        return self.symptom_lexicon.extract(text)
+
+    def _extract_symptoms_ner(self, text: str) -> List[Dict]:
+        """Extract symptoms with the clinical NER model."""
         symptoms = []
-        for match in re.finditer(self.symptom_patterns['pain'], text, re.IGNORECASE):
-            severity = re.search(self.symptom_patterns['severity'], text[match.start():match.start()+50])
-            duration = re.search(self.symptom_patterns['duration'], text[match.start():match.start()+50])
-            frequency = re.search(self.symptom_patterns['frequency'], text[match.start():match.start()+50])
-            
-            symptoms.append({
-                "name": match.group(),
-                "severity": int(severity.group(1)) if severity else 5,
-                "duration": duration.group() if duration else "Not specified",
-                "pattern": frequency.group() if frequency else "Not specified"
-            })
+        for entity in self.ner_pipeline(text):
+            if entity['entity'].startswith('B-PROBLEM'):
+                symptoms.append({
+                    'name': entity['word'],
+                    'severity': 5,  # Default severity
+                    'duration': 'Not specified',
+                    'pattern': 'Not specified'
+                })
         return symptoms
 
+    def extract_message_symptoms(self, text: str) -> List[Dict]:
+        """Lexicon fast path; NER only runs when the lexicon is inconclusive."""
+        symptoms = self._extract_symptoms(text)
+        if not self.symptom_lexicon.is_conclusive(symptoms):
+            symptoms = self._extract_symptoms_ner(text) or symptoms
+        return symptoms
+
+    def update_symptom_state(self, state: SymptomState, message: Dict) -> SymptomState:
+        """Fold one new message into the consultation's symptom state."""
+        try:
+            state.update(message, self.extract_message_symptoms)
+        except Exception as e:
+            logger.error(f"Error updating symptom state: {str(e)}")
+        return state
+
+    def _contains_emergency_indicators(self, symptom_name: str) -> bool:
+        """Check whether a symptom name maps to an emergency symptom."""
+        name = symptom_name.lower()
+        return name in EMERGENCY_SYMPTOMS or self.symptom_lexicon.surface_to_name.get(name) in EMERGENCY_SYMPTOMS
+
     async def validate_medical_response(self, response: str, context: List[Dict]) -> Dict:
         """Validate medical response using AI."""
         try:
@@ -113,7 +145,7 @@ class SymptomAnalyzer:
             }}
             """
 
-            validation_response = self.ai_config.model.generate_content(validation_prompt)
+            validation_response = await self.ai_config.generate(validation_prompt)
             return self._parse_ai_response(validation_response.text)
 
         except Exception as e:
@@ -124,7 +156,7 @@ class SymptomAnalyzer:
         """Format chat history for AI prompt."""
         formatted = []
         for msg in chat_history:
-            role = "Patient" if msg["type"] == "user" else "Doctor"
+            role = {"user": "Patient", "summary": "Summary"}.get(msg["type"], "Doctor")
             formatted.append(f"{role}: {msg['content']}")
         return "\n".join(formatted)
 
@@ -184,7 +216,7 @@ class SymptomAnalyzer:
         }}
         """
 
-        response = self.ai_config.model.generate_content(severity_prompt)
+        response = await self.ai_config.generate(severity_prompt)
         return self._parse_ai_response(response.text)
     
     def analyze_symptoms(self, chat_history: List[Dict]) -> List[Dict]:
@@ -194,16 +226,7 @@ class SymptomAnalyzer:
                     # Add direct symptom extraction from message content
                     content = message.get('content', '')
                     if content:
-                        # Extract symptoms using NER pipeline
-                        entities = self.ner_pipeline(content)
-                        for entity in entities:
-                            if entity['entity'].startswith('B-PROBLEM'):
-                                symptoms.append({
-                                    'name': entity['word'],
-                                    'severity': 5,  # Default severity
-                                    'duration': 'Not specified',
-                                    'pattern': 'Not specified'
-                                })
+                        symptoms.extend(self.extract_message_symptoms(content))
                 return symptoms
         except Exception as e:
             logger.error(f"Error analyzing symptoms: {str(e)}")
@@ -249,7 +272,7 @@ class SymptomAnalyzer:
         else:
             return "within a week"
 
-    def recommend_specialist(self, symptoms: List[Dict]) -> str:
+    async def recommend_specialist(self, symptoms: List[Dict]) -> str:
         """Recommend appropriate medical specialist based on symptoms."""
         try:
             specialist_prompt = f"""
@@ -279,7 +302,7 @@ class SymptomAnalyzer:
             }}
             """
             
-            response = self.ai_config.model.generate_content(specialist_prompt)
+            response = await self.ai_config.generate(specialist_prompt)
             result = self._parse_ai_response(response.text)
             
             return result.get("recommended_specialist", "General Practitioner")
@@ -289,7 +312,10 @@ class SymptomAnalyzer:
             return "General Practitioner"
 
     
-    def needs_conclusion(self, context: list) -> bool:
+    def needs_conclusion(self, context: list, state: SymptomState = None) -> bool:
+        if state is not None:
+            return state.needs_conclusion()
+
         symptoms = self.analyze_symptoms(context)
         severity_score = self.calculate_severity_score(symptoms)
         
@@ -312,7 +338,7 @@ class SymptomAnalyzer:
         Include 2-3 specific items in each category.
         """
         
-        response = self.ai_config.model.generate_content(prompt)
+        response = await self.ai_config.generate(prompt)
         response_text = response.text.strip()
         
         # Extract JSON if embedded in other text
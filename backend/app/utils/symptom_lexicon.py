@@ -0,0 +1,178 @@
+# backend/app/utils/symptom_lexicon.py
+from typing import Dict, List, Optional, Tuple
+import re
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Canonical symptom name -> surface forms patients commonly use
+SYMPTOM_TERMS: Dict[str, List[str]] = {
+    "headache": ["headache", "head ache", "head pain", "migraine", "head is pounding", "throbbing head"],
+    # "temperature" alone is too often a question ("what is your temperature?")
+    "fever": ["fever", "feverish", "high temperature", "running a temperature", "have a temperature",
+              "chills", "shivering"],
+    "cough": ["cough", "coughing", "dry cough", "wet cough", "productive cough"],
+    "sore throat": ["sore throat", "throat pain", "scratchy throat", "painful swallowing"],
+    "runny nose": ["runny nose", "stuffy nose", "blocked nose", "nasal congestion", "congestion", "sneezing"],
+    "shortness of breath": ["shortness of breath", "short of breath", "breathlessness", "difficulty breathing",
+                            "trouble breathing", "can't breathe", "cannot breathe", "breathing problem", "wheezing"],
+    "chest pain": ["chest pain", "chest tightness", "tight chest", "pain in my chest", "pressure in my chest"],
+    "palpitations": ["palpitations", "racing heart", "heart racing", "heart pounding", "irregular heartbeat"],
+    "abdominal pain": ["abdominal pain", "stomach pain", "stomach ache", "stomachache", "tummy ache",
+                       "belly pain", "pain in my stomach", "cramps", "cramping"],
+    "nausea": ["nausea", "nauseous", "queasy", "feel sick", "feeling sick"],
+    "vomiting": ["vomiting", "vomit", "throwing up", "threw up"],
+    "diarrhea": ["diarrhea", "diarrhoea", "loose motions", "loose stools", "watery stools"],
+    "constipation": ["constipation", "constipated"],
+    "heartburn": ["heartburn", "acidity", "acid reflux", "indigestion"],
+    "back pain": ["back pain", "backache", "lower back pain", "pain in my back"],
+    "joint pain": ["joint pain", "joint ache", "aching joints", "knee pain", "arthritis"],
+    "muscle pain": ["muscle pain", "muscle ache", "body ache", "body pain", "aches"],
+    "fatigue": ["fatigue", "tired", "tiredness", "exhausted", "exhaustion", "weakness", "lethargy", "no energy"],
+    "dizziness": ["dizziness", "dizzy", "lightheaded", "light-headed", "vertigo", "giddiness"],
+    "fainting": ["fainting", "fainted", "passed out", "blackout", "loss of consciousness", "unconscious"],
+    "rash": ["rash", "rashes", "hives", "skin eruption", "red spots"],
+    "itching": ["itching", "itchy", "itch"],
+    "swelling": ["swelling", "swollen", "puffiness"],
+    "numbness": ["numbness", "numb", "tingling", "pins and needles"],
+    "ear pain": ["ear pain", "earache", "ear ache"],
+    "toothache": ["toothache", "tooth pain", "tooth ache"],
+    "eye pain": ["eye pain", "red eyes", "itchy eyes", "watery eyes", "blurred vision", "blurry vision"],
+    "insomnia": ["insomnia", "can't sleep", "cannot sleep", "trouble sleeping", "sleeplessness"],
+    "anxiety": ["anxiety", "anxious", "panic attack", "panic"],
+    "loss of appetite": ["loss of appetite", "no appetite", "not hungry", "poor appetite"],
+    "weight loss": ["weight loss", "losing weight", "lost weight"],
+    "frequent urination": ["frequent urination", "urinating often", "peeing a lot"],
+    "painful urination": ["painful urination", "burning urination", "burning when urinating", "burning sensation"],
+    "bleeding": ["bleeding", "blood in stool", "blood in urine", "coughing blood", "coughing up blood"],
+    # "fits" has an everyday meaning ("the shoe fits") and seizure is an emergency symptom
+    "seizure": ["seizure", "seizures", "convulsions", "convulsing"],
+    "confusion": ["confusion", "confused", "disoriented"],
+    "slurred speech": ["slurred speech", "difficulty speaking", "can't speak properly"],
+    "pain": ["pain", "painful", "ache", "aching", "hurts", "hurting", "soreness", "sore"],
+}
+
+# Symptoms that on their own warrant immediate escalation
+EMERGENCY_SYMPTOMS = frozenset({
+    "chest pain", "shortness of breath", "fainting", "seizure", "confusion", "slurred speech", "bleeding",
+})
+
+SEVERITY_WORDS: Dict[str, int] = {
+    "mild": 3, "slight": 3, "minor": 2, "little": 3,
+    "moderate": 5, "bad": 6, "strong": 7,
+    "severe": 8, "intense": 8, "terrible": 8, "really bad": 7, "very bad": 8,
+    "unbearable": 10, "excruciating": 10, "worst": 10,
+}
+
+_NUMBER_WORDS = r"(?:\d+|a|an|one|two|three|four|five|six|seven|eight|nine|ten|few|couple of|several)"
+
+SEVERITY_PATTERN = (
+    r"\b(\d{1,2})\s*(?:/|out of)\s*10\b"
+    r"|\b(" + "|".join(sorted((re.escape(w) for w in SEVERITY_WORDS), key=len, reverse=True)) + r")\b"
+)
+DURATION_PATTERN = (
+    r"\b(?:for|since|past|last|about|over|almost|nearly)?\s*"
+    + _NUMBER_WORDS
+    + r"\s+(?:minutes?|hours?|days?|weeks?|months?|years?)(?:\s+ago)?\b"
+    r"|\bsince\s+(?:yesterday|last\s+\w+|this\s+morning|morning|last night|\w+day)\b"
+    r"|\b(?:yesterday|today|this morning|last night)\b"
+)
+FREQUENCY_PATTERN = (
+    r"\b(?:constant(?:ly)?|continuous(?:ly)?|all the time|always|persistent"
+    r"|intermittent(?:ly)?|comes and goes|on and off|off and on|occasional(?:ly)?|sometimes"
+    r"|frequent(?:ly)?|often|every\s+(?:day|night|morning|evening|few hours|hour)"
+    r"|at night|in the morning|after (?:eating|meals|exercise))\b"
+)
+
+
+class SymptomLexicon:
+    """Compiled multi-pattern matcher for common symptoms and their qualifiers.
+
+    All surface forms are folded into one alternation so a single regex scan finds
+    every symptom mention; severity, duration and frequency are then looked up in
+    the sentence containing each mention.
+    """
+
+    def __init__(self, terms: Optional[Dict[str, List[str]]] = None):
+        self.terms = terms or SYMPTOM_TERMS
+        self.surface_to_name: Dict[str, str] = {}
+        for name, forms in self.terms.items():
+            for form in [name] + forms:
+                self.surface_to_name.setdefault(form.lower(), name)
+
+        # Longest forms first so "chest pain" wins over "pain"
+        alternation = "|".join(
+            re.escape(form) for form in sorted(self.surface_to_name, key=len, reverse=True)
+        )
+        self.symptom_regex = re.compile(r"\b(?:" + alternation + r")\b", re.IGNORECASE)
+        self.severity_regex = re.compile(SEVERITY_PATTERN, re.IGNORECASE)
+        self.duration_regex = re.compile(DURATION_PATTERN, re.IGNORECASE)
+        self.frequency_regex = re.compile(FREQUENCY_PATTERN, re.IGNORECASE)
+        self.negation_regex = re.compile(r"\b(?:no|not|don't|dont|do not|without|never|denies)\b(?:\s+\w+){0,2}\s*$", re.IGNORECASE)
+        self.sentence_regex = re.compile(r"[^.!?\n।]+")
+
+    def _sentence_bounds(self, text: str, position: int) -> Tuple[int, int]:
+        """Return the start and end offsets of the sentence containing position."""
+        for sentence in self.sentence_regex.finditer(text):
+            if sentence.start() <= position < sentence.end():
+                return sentence.start(), sentence.end()
+        return 0, len(text)
+
+    def _parse_severity(self, window: str) -> Optional[int]:
+        """Read a 1-10 severity from a numeric score or an intensity word."""
+        match = self.severity_regex.search(window)
+        if not match:
+            return None
+        if match.group(1):
+            return max(1, min(10, int(match.group(1))))
+        return SEVERITY_WORDS.get(match.group(2).lower())
+
+    def extract(self, text: str) -> List[Dict]:
+        """Extract symptoms with severity, duration and pattern from text."""
+        symptoms: Dict[str, Dict] = {}
+        if not text:
+            return []
+
+        for match in self.symptom_regex.finditer(text):
+            name = self.surface_to_name[match.group().lower()]
+            start, end = self._sentence_bounds(text, match.start())
+
+            # Skip negated mentions such as "no fever"
+            if self.negation_regex.search(text[start:match.start()]):
+                continue
+
+            window = text[start:end]
+            severity = self._parse_severity(window)
+            duration = self.duration_regex.search(window)
+            frequency = self.frequency_regex.search(window)
+
+            existing = symptoms.get(name)
+            if existing is None:
+                symptoms[name] = {
+                    "name": name,
+                    "severity": severity if severity is not None else 5,
+                    "duration": duration.group().strip() if duration else "Not specified",
+                    "pattern": frequency.group().strip() if frequency else "Not specified",
+                    "source": "lexicon"
+                }
+            else:
+                if severity is not None:
+                    existing["severity"] = max(existing["severity"], severity)
+                if duration and existing["duration"] == "Not specified":
+                    existing["duration"] = duration.group().strip()
+                if frequency and existing["pattern"] == "Not specified":
+                    existing["pattern"] = frequency.group().strip()
+
+        # A bare "pain" only adds information when nothing more specific was found
+        if "pain" in symptoms and len(symptoms) > 1:
+            del symptoms["pain"]
+
+        return list(symptoms.values())
+
+    def is_conclusive(self, symptoms: List[Dict]) -> bool:
+        """Whether lexicon hits are specific enough to skip the NER model."""
+        return any(symptom["name"] != "pain" for symptom in symptoms)
+
+    def contains_emergency(self, symptoms: List[Dict]) -> bool:
+        """Check extracted symptoms against the emergency list."""
+        return any(symptom["name"] in EMERGENCY_SYMPTOMS for symptom in symptoms)
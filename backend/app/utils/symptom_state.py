@@ -0,0 +1,120 @@
+# backend/app/utils/symptom_state.py
+from typing import Callable, Dict, List, Optional
+from app.utils.symptom_lexicon import EMERGENCY_SYMPTOMS
+
+# Thresholds shared by the prompt builder and needs_conclusion
+CONCLUSION_SYMPTOM_COUNT = 3
+CONCLUSION_SEVERITY = 7
+CONCLUSION_MESSAGE_COUNT = 10
+ASSESSMENT_QUESTION_COUNT = 4
+
+
+class SymptomState:
+    """Running symptom picture for one consultation.
+
+    Updated once per message instead of re-analysing the whole context every
+    turn, and serialised next to the conversation context so every read
+    (question count, severity, emergency flags) is O(1).
+    """
+
+    def __init__(self):
+        self.symptoms: Dict[str, Dict] = {}
+        self.question_count = 0
+        self.message_count = 0
+        self.max_severity = 0
+        self.severity_total = 0.0
+        self.emergency_flags: List[str] = []
+
+    def add_symptom(self, symptom: Dict):
+        """Merge one extracted symptom into the state."""
+        name = symptom["name"]
+        severity = symptom.get("severity") or 0
+        existing = self.symptoms.get(name)
+
+        if existing is None:
+            self.symptoms[name] = {
+                "name": name,
+                "severity": severity,
+                "duration": symptom.get("duration", "Not specified"),
+                "pattern": symptom.get("pattern", "Not specified")
+            }
+            self.severity_total += severity
+        else:
+            # Keep the worst reported severity and the first concrete qualifiers
+            if severity > existing["severity"]:
+                self.severity_total += severity - existing["severity"]
+                existing["severity"] = severity
+            for key in ("duration", "pattern"):
+                if existing[key] == "Not specified" and symptom.get(key, "Not specified") != "Not specified":
+                    existing[key] = symptom[key]
+
+        self.max_severity = max(self.max_severity, severity)
+        if name in EMERGENCY_SYMPTOMS and name not in self.emergency_flags:
+            self.emergency_flags.append(name)
+
+    def update(self, message: Dict, extract: Callable[[str], List[Dict]]):
+        """Apply a single context message using the given symptom extractor."""
+        self.message_count += 1
+        content = message.get("content", "")
+        if message.get("type") == "bot":
+            if "?" in content:
+                self.question_count += 1
+        elif content:
+            for symptom in extract(content):
+                self.add_symptom(symptom)
+
+    @property
+    def severity_score(self) -> float:
+        """Average severity across distinct symptoms."""
+        return self.severity_total / len(self.symptoms) if self.symptoms else 0.0
+
+    @property
+    def symptom_list(self) -> List[Dict]:
+        return list(self.symptoms.values())
+
+    @property
+    def has_emergency(self) -> bool:
+        return bool(self.emergency_flags)
+
+    def should_assess(self) -> bool:
+        """Whether the next reply should be a final assessment."""
+        return self.question_count >= ASSESSMENT_QUESTION_COUNT or self.severity_score >= CONCLUSION_SEVERITY
+
+    def needs_conclusion(self) -> bool:
+        return any([
+            len(self.symptoms) >= CONCLUSION_SYMPTOM_COUNT,
+            self.severity_score >= CONCLUSION_SEVERITY,
+            self.message_count >= CONCLUSION_MESSAGE_COUNT,
+            self.has_emergency
+        ])
+
+    def to_dict(self) -> Dict:
+        return {
+            "symptoms": self.symptom_list,
+            "question_count": self.question_count,
+            "message_count": self.message_count,
+            "max_severity": self.max_severity,
+            "severity_total": self.severity_total,
+            "emergency_flags": self.emergency_flags
+        }
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> "SymptomState":
+        state = cls()
+        if not data:
+            return state
+        state.symptoms = {symptom["name"]: symptom for symptom in data.get("symptoms", [])}
+        state.question_count = data.get("question_count", 0)
+        state.message_count = data.get("message_count", 0)
+        state.max_severity = data.get("max_severity", 0)
+        state.severity_total = data.get("severity_total", 0.0)
+        state.emergency_flags = data.get("emergency_flags", [])
+        return state
+
+    @classmethod
+    def from_context(cls, context: List[Dict], extract: Callable[[str], List[Dict]]) -> "SymptomState":
+        """Rebuild state from a stored context (sessions that predate the state)."""
+        state = cls()
+        for message in context:
+            state.update(message, extract)
+        return state
@@ -137,13 +137,15 @@ class TranslationCache:
         except Exception as e:
             logger.error(f"Error updating Redis cache: {str(e)}")
 
-    async def clear_expired_cache(self):
-        """Clear expired translations from MongoDB."""
+    async def clear_expired_cache(self) -> int:
+        """Clear expired translations from MongoDB; returns the number removed."""
         try:
             expiry_date = datetime.utcnow() - self.cache_duration
             result = await translations_cache.delete_many({
                 "created_at": {"$lt": expiry_date}
             })
             logger.info(f"Cleared {result.deleted_count} expired translations from cache")
+            return result.deleted_count
         except Exception as e:
-            logger.error(f"Error clearing expired cache: {str(e)}")
\ No newline at end of file
+            logger.error(f"Error clearing expired cache: {str(e)}")
+            return 0
\ No newline at end of file
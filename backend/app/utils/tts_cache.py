@@ -0,0 +1,147 @@
+# backend/app/utils/tts_cache.py
+from typing import Dict, Optional
+from datetime import timedelta
+from app.config.database import redis_binary_client
+import hashlib
+import logging
+import os
+import time
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+
+class TTSCache:
+    """Content-addressed cache of synthesized speech.
+
+    Entries are keyed on a hash of (normalized text, language, gender, style)
+    and stored in Redis. A sorted set of last-access times and a running byte
+    total keep the tier under max_bytes by evicting least recently used
+    entries; hit and miss counters are kept alongside for metrics.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes or int(os.getenv("TTS_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+        self.cache_duration = timedelta(days=30)
+        self.redis_prefix = "tts:"
+        self.index_key = f"{self.redis_prefix}lru"
+        self.sizes_key = f"{self.redis_prefix}sizes"
+        self.total_key = f"{self.redis_prefix}bytes"
+        self.hits_key = f"{self.redis_prefix}hits"
+        self.misses_key = f"{self.redis_prefix}misses"
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        """Canonical form so trivially different strings share one entry."""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    def _generate_cache_key(
+        self,
+        text: str,
+        language: str,
+        gender: str,
+        style: Optional[str]
+    ) -> str:
+        """Generate a content-addressed cache key."""
+        material = "\x1f".join([
+            self.normalize_text(text),
+            language,
+            (gender or "").lower(),
+            (style or "").lower()
+        ])
+        return f"{self.redis_prefix}audio:{hashlib.sha256(material.encode()).hexdigest()}"
+
+    async def get_cached_audio(
+        self,
+        text: str,
+        language: str,
+        gender: str,
+        style: Optional[str] = None
+    ) -> Optional[bytes]:
+        """Get synthesized audio from cache, refreshing its LRU position."""
+        try:
+            cache_key = self._generate_cache_key(text, language, gender, style)
+            audio = redis_binary_client.get(cache_key)
+
+            pipe = redis_binary_client.pipeline()
+            if audio is not None:
+                pipe.zadd(self.index_key, {cache_key: time.time()})
+                pipe.incr(self.hits_key)
+            else:
+                pipe.incr(self.misses_key)
+            pipe.execute()
+
+            if audio is not None:
+                logger.debug(f"TTS audio found in cache: {cache_key}")
+            return audio
+
+        except Exception as e:
+            logger.error(f"Error retrieving cached TTS audio: {str(e)}")
+            return None
+
+    async def cache_audio(
+        self,
+        text: str,
+        language: str,
+        gender: str,
+        style: Optional[str],
+        audio: bytes
+    ):
+        """Store synthesized audio and evict least recently used entries."""
+        try:
+            cache_key = self._generate_cache_key(text, language, gender, style)
+            size = len(audio)
+            if size > self.max_bytes:
+                return
+
+            previous_size = redis_binary_client.hget(self.sizes_key, cache_key)
+            pipe = redis_binary_client.pipeline()
+            pipe.setex(cache_key, int(self.cache_duration.total_seconds()), audio)
+            pipe.zadd(self.index_key, {cache_key: time.time()})
+            pipe.hset(self.sizes_key, cache_key, size)
+            pipe.incrby(self.total_key, size - int(previous_size or 0))
+            pipe.execute()
+
+            self._evict()
+
+        except Exception as e:
+            logger.error(f"Error caching TTS audio: {str(e)}")
+
+    def _evict(self):
+        """Drop least recently used entries until the tier fits in max_bytes."""
+        while int(redis_binary_client.get(self.total_key) or 0) > self.max_bytes:
+            oldest = redis_binary_client.zpopmin(self.index_key)
+            if not oldest:
+                redis_binary_client.set(self.total_key, 0)
+                break
+            cache_key = oldest[0][0]
+            size = int(redis_binary_client.hget(self.sizes_key, cache_key) or 0)
+            pipe = redis_binary_client.pipeline()
+            pipe.delete(cache_key)
+            pipe.hdel(self.sizes_key, cache_key)
+            pipe.decrby(self.total_key, size)
+            pipe.execute()
+            logger.debug(f"Evicted TTS audio from cache: {cache_key}")
+
+    def get_stats(self) -> Dict:
+        """Hit rate and occupancy of the TTS cache."""
+        try:
+            pipe = redis_binary_client.pipeline()
+            pipe.get(self.hits_key)
+            pipe.get(self.misses_key)
+            pipe.zcard(self.index_key)
+            pipe.get(self.total_key)
+            hits, misses, entries, total = pipe.execute()
+            hits, misses = int(hits or 0), int(misses or 0)
+            lookups = hits + misses
+            return {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+                "entries": entries,
+                "bytes": int(total or 0),
+                "max_bytes": self.max_bytes
+            }
+        except Exception as e:
+            logger.error(f"Error reading TTS cache stats: {str(e)}")
+            return {"error": str(e)}
@@ -0,0 +1,111 @@
+# backend/app/utils/turn_deadline.py
+from typing import Awaitable, Dict, Optional, TypeVar
+import asyncio
+import os
+import time
+
+T = TypeVar("T")
+
+TURN_BUDGET_SECONDS = float(os.getenv("TURN_BUDGET_SECONDS", "8"))
+# Required stages always get at least this long, even past the deadline
+REQUIRED_STAGE_FLOOR_SECONDS = float(os.getenv("REQUIRED_STAGE_FLOOR_SECONDS", "1"))
+DEFERRED_STAGE_TIMEOUT_SECONDS = float(os.getenv("DEFERRED_STAGE_TIMEOUT_SECONDS", "30"))
+
+# Starting estimates (seconds) until real latencies have been observed
+DEFAULT_STAGE_ESTIMATES = {
+    "input_translation": 0.5,
+    "llm": 2.5,
+    "symptom_analysis": 2.0,
+    "treatment_recommendations": 2.0,
+    "validation": 2.0,
+    "output_translation": 0.5,
+    "audio": 1.5
+}
+
+
+class StageLatencies:
+    """Smoothed per-stage latency, used to predict whether a stage fits the budget."""
+
+    def __init__(self, defaults: Dict[str, float] = DEFAULT_STAGE_ESTIMATES, alpha: float = 0.2):
+        self.estimates = dict(defaults)
+        self.alpha = alpha
+
+    def estimate(self, stage: str) -> float:
+        return self.estimates.get(stage, 1.0)
+
+    def record(self, stage: str, latency: float):
+        previous = self.estimates.get(stage)
+        self.estimates[stage] = latency if previous is None else (1 - self.alpha) * previous + self.alpha * latency
+
+    def record_timeout(self, stage: str, waited: float):
+        """A stage that timed out took longer than waited; move the estimate past it."""
+        self.estimates[stage] = max(self.estimate(stage), waited) * (1 + self.alpha)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {stage: round(value * 1000, 1) for stage, value in self.estimates.items()}
+
+
+stage_latencies = StageLatencies()
+
+
+class TurnDeadline:
+    """Deadline for one chat turn, carried through every pipeline stage.
+
+    Required stages run with the remaining budget as their timeout (never
+    less than REQUIRED_STAGE_FLOOR_SECONDS). Optional stages are only run
+    inline when their estimated latency fits in what is left after
+    reserving time for the required stages still to come; otherwise the
+    caller defers or skips them.
+    """
+
+    def __init__(self, budget_seconds: float = TURN_BUDGET_SECONDS, latencies: StageLatencies = stage_latencies):
+        self.budget_seconds = budget_seconds
+        self.latencies = latencies
+        self.started = time.monotonic()
+        self.expires_at = self.started + budget_seconds
+        self.timings: Dict[str, float] = {}
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def fits(self, stage: str, reserve_for: tuple = ()) -> bool:
+        """Whether an optional stage is expected to finish before the deadline."""
+        reserve = sum(self.latencies.estimate(name) for name in reserve_for)
+        return self.latencies.estimate(stage) <= self.remaining() - reserve
+
+    async def run(self, stage: str, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Await a stage within the remaining budget, recording its latency.
+
+        Successful runs and timeouts update the estimate. The time waited
+        before a timeout is a lower bound, and the estimate moves past it,
+        so a stage that keeps timing out stops fitting and gets deferred.
+        Errors, such as instant refusals from an open breaker, say nothing
+        about how long the stage takes.
+        """
+        if timeout is None:
+            timeout = max(self.remaining(), REQUIRED_STAGE_FLOOR_SECONDS)
+        started = time.monotonic()
+        try:
+            result = await asyncio.wait_for(awaitable, timeout=timeout)
+        except asyncio.TimeoutError:
+            latency = time.monotonic() - started
+            self.timings[stage] = round(latency * 1000, 1)
+            self.latencies.record_timeout(stage, latency)
+            raise
+        except Exception:
+            self.timings[stage] = round((time.monotonic() - started) * 1000, 1)
+            raise
+        latency = time.monotonic() - started
+        self.timings[stage] = round(latency * 1000, 1)
+        self.latencies.record(stage, latency)
+        return result
+
+    def to_dict(self) -> Dict:
+        return {
+            "budget_ms": round(self.budget_seconds * 1000),
+            "elapsed_ms": round(self.elapsed() * 1000, 1),
+            "stages_ms": self.timings
+        }
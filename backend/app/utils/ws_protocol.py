@@ -0,0 +1,117 @@
+# backend/app/utils/ws_protocol.py
+from typing import Any, Dict, Iterable, Optional
+from fastapi import WebSocket, WebSocketDisconnect
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# WebSocket subprotocols a client may offer in Sec-WebSocket-Protocol
+JSON_SUBPROTOCOL = "arogo.json.v1"
+MSGPACK_SUBPROTOCOL = "arogo.msgpack.v1"
+
+# ?protocol= values accepted from clients that cannot set subprotocols
+PROTOCOL_ALIASES = {
+    "json": JSON_SUBPROTOCOL,
+    "msgpack": MSGPACK_SUBPROTOCOL
+}
+
+# ?audio= value for clients that play per-sentence audio_segment frames;
+# other clients get one audio_url for the whole reply
+AUDIO_SEGMENTS_CAPABILITY = "segments"
+
+
+class FrameCodec:
+    """JSON frames over text messages: the default and fallback protocol.
+
+    binary is False, so senders keep audio out of band (by URL) rather than
+    paying the base64 penalty of embedding it in JSON.
+    """
+
+    name = "json"
+    subprotocol = JSON_SUBPROTOCOL
+    binary = False
+
+    async def send(self, websocket: WebSocket, message: Dict[str, Any]):
+        await websocket.send_text(json.dumps(message))
+
+    def decode(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        """Decode a raw ASGI receive() message; raises ValueError if malformed."""
+        if message.get("text") is not None:
+            return json.loads(message["text"])
+        raise ValueError("Binary frame received on a JSON connection")
+
+    async def receive(self, websocket: WebSocket) -> Dict[str, Any]:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        return self.decode(message)
+
+
+class MessagePackCodec(FrameCodec):
+    """MessagePack frames over binary messages; bytes values travel raw.
+
+    Text frames are still decoded as JSON so a client can mix the two.
+    """
+
+    name = "msgpack"
+    subprotocol = MSGPACK_SUBPROTOCOL
+    binary = True
+
+    def __init__(self):
+        import msgpack
+
+        self._packb = msgpack.packb
+        self._unpackb = msgpack.unpackb
+        self._error = msgpack.UnpackException
+
+    async def send(self, websocket: WebSocket, message: Dict[str, Any]):
+        await websocket.send_bytes(self._packb(message, use_bin_type=True))
+
+    def decode(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        if message.get("bytes") is not None:
+            try:
+                decoded = self._unpackb(message["bytes"], raw=False)
+            except (self._error, ValueError) as e:
+                raise ValueError(f"Invalid MessagePack frame: {str(e)}")
+            if not isinstance(decoded, dict):
+                raise ValueError("MessagePack frame is not a map")
+            return decoded
+        return super().decode(message)
+
+
+def _requested_protocols(websocket: WebSocket) -> Iterable[str]:
+    offered = list(websocket.scope.get("subprotocols") or [])
+    alias = PROTOCOL_ALIASES.get(websocket.query_params.get("protocol", ""))
+    if alias:
+        offered.append(alias)
+    return offered
+
+
+def wants_audio_segments(websocket: WebSocket) -> bool:
+    """True if the client declared it handles audio_segment frames."""
+    return websocket.query_params.get("audio") == AUDIO_SEGMENTS_CAPABILITY
+
+
+def negotiate_codec(websocket: WebSocket) -> FrameCodec:
+    """Pick the frame codec for a connection before it is accepted.
+
+    MessagePack is used when the client offers it and msgpack is installed;
+    everything else gets JSON.
+    """
+    if MSGPACK_SUBPROTOCOL in _requested_protocols(websocket):
+        try:
+            return MessagePackCodec()
+        except ImportError:
+            logger.warning("Client requested MessagePack but msgpack is not installed; using JSON")
+    return FrameCodec()
+
+
+async def accept_with_codec(websocket: WebSocket) -> FrameCodec:
+    """Accept the socket, echoing the chosen subprotocol if one was offered."""
+    codec = negotiate_codec(websocket)
+    subprotocol: Optional[str] = None
+    if codec.subprotocol in (websocket.scope.get("subprotocols") or []):
+        subprotocol = codec.subprotocol
+    await websocket.accept(subprotocol=subprotocol)
+    return codec
@@ -0,0 +1,42 @@
+# backend/app/worker.py
+"""Background job worker.
+
+    cd backend && python -m app.worker
+
+Runs jobs enqueued by the API (summaries, PDF reports) and periodic
+maintenance (translation cache cleanup, label bundle builds) so LLM-heavy
+and rendering work stays off the API workers. Run as many worker
+processes as needed; per-queue slots in each come from app.services.jobs.
+"""
+import asyncio
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+async def run():
+    # Imported here: render pool processes are spawned and re-import this
+    # module, and must not pull in the database clients and job code
+    from app.config.database import setup_indexes
+    from app.services.jobs import QUEUE_CONCURRENCY, PERIODIC_JOBS
+    from app.utils.job_queue import Worker
+    from app.utils.report_renderer import render_pool
+
+    # Start the render processes before the first report job arrives
+    await render_pool.warm()
+    await setup_indexes()
+    try:
+        await Worker(QUEUE_CONCURRENCY, PERIODIC_JOBS).run()
+    finally:
+        render_pool.shutdown()
+
+
+def main():
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
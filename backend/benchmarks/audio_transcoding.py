@@ -0,0 +1,120 @@
+# backend/benchmarks/audio_transcoding.py
+"""Compare the legacy temp-file transcoder with the in-memory ffmpeg pipe.
+
+Run from the backend directory (needs ffmpeg; pydub for the legacy path):
+    python benchmarks/audio_transcoding.py [--iterations 50] [--seconds 5]
+
+Reports per-request latency for both paths. When strace is installed each
+path is also re-run under ``strace -f -c`` to count syscalls, including the
+file syscalls (openat/unlink/write/read) the temp-file path spends on disk.
+"""
+import argparse
+import asyncio
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.audio_transcoder import AudioTranscoder, FFMPEG_BINARY
+
+FILE_SYSCALLS = ("openat", "unlink", "write", "read", "lseek", "fstat", "newfstatat")
+
+
+def make_sample(seconds):
+    """Render a WebM/Opus test tone of the given length, like a browser upload."""
+    return subprocess.run(
+        [FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-f", "lavfi",
+         "-i", f"sine=frequency=440:duration={seconds}", "-ac", "1", "-c:a", "libopus", "-f", "webm", "pipe:1"],
+        capture_output=True,
+        check=True
+    ).stdout
+
+
+def legacy_convert(audio_data):
+    """The original NamedTemporaryFile + pydub implementation."""
+    from pydub import AudioSegment
+
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.webm') as temp_webm:
+        temp_webm.write(audio_data)
+        temp_webm_path = temp_webm.name
+    wav_path = temp_webm_path + ".wav"
+    try:
+        audio = AudioSegment.from_file(temp_webm_path, format="webm")
+        audio.export(wav_path, format="wav")
+        with open(wav_path, 'rb') as wav_file:
+            return wav_file.read()
+    finally:
+        for path in [temp_webm_path, wav_path]:
+            if os.path.exists(path):
+                os.remove(path)
+
+
+async def run(mode, sample, iterations):
+    transcoder = AudioTranscoder()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        if mode == "legacy":
+            await asyncio.to_thread(legacy_convert, sample)
+        else:
+            await transcoder.to_wav(sample)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def count_syscalls(mode, seconds, iterations):
+    """Re-run one mode under strace and return (total calls, file-related calls)."""
+    if not shutil.which("strace"):
+        return None
+    with tempfile.NamedTemporaryFile(suffix=".strace") as report:
+        subprocess.run(
+            ["strace", "-f", "-c", "-o", report.name, sys.executable, os.path.abspath(__file__),
+             "--mode", mode, "--seconds", str(seconds), "--iterations", str(iterations), "--no-strace"],
+            capture_output=True,
+            check=True
+        )
+        total = file_calls = 0
+        for line in open(report.name):
+            parts = line.split()
+            if len(parts) >= 5 and parts[-1] == "total":
+                total = int(parts[3])
+            elif len(parts) >= 5 and parts[-1] in FILE_SYSCALLS:
+                file_calls += int(parts[3])
+        return total, file_calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--mode", choices=["legacy", "pipe"], action="append")
+    parser.add_argument("--no-strace", action="store_true")
+    args = parser.parse_args()
+
+    modes = args.mode or ["legacy", "pipe"]
+    sample = make_sample(args.seconds)
+    print(f"Sample: {len(sample)} bytes WebM/Opus, {args.seconds}s")
+
+    for mode in modes:
+        try:
+            latencies = sorted(asyncio.run(run(mode, sample, args.iterations)))
+        except ImportError as e:
+            print(f"{mode:<7} skipped ({e})")
+            continue
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        line = f"{mode:<7} p50={statistics.median(latencies) * 1000:.1f}ms  p95={p95 * 1000:.1f}ms"
+        if not args.no_strace:
+            syscalls = count_syscalls(mode, args.seconds, args.iterations)
+            if syscalls:
+                line += f"  syscalls/request={syscalls[0] / args.iterations:.0f}"
+                line += f"  file syscalls/request={syscalls[1] / args.iterations:.0f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
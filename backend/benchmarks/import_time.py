@@ -0,0 +1,99 @@
+# backend/benchmarks/import_time.py
+"""Measure the import cost of the API using ``python -X importtime``.
+
+Run from the backend directory:
+    python benchmarks/import_time.py [--module app.main] [--top 25] [--budget-ms 1500]
+
+Prints the import time spent in each package and the cumulative time of each
+``app.*`` module, and flags heavy dependencies that were imported eagerly.
+Exits non-zero when the total exceeds --budget-ms or a heavy dependency is
+loaded, so it can run as a regression check.
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Packages that must only load on first use
+HEAVY_MODULES = [
+    "torch", "transformers", "matplotlib", "numpy", "reportlab", "pydub", "google.generativeai",
+]
+
+LINE_PATTERN = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+
+def collect(module):
+    """Import module in a fresh interpreter and parse the importtime report."""
+    result = subprocess.run(
+        # os._exit skips interpreter shutdown, which can block on database client threads
+        [sys.executable, "-X", "importtime", "-c", f"import {module}, os; os._exit(0)"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True
+    )
+    entries = []
+    for line in result.stderr.splitlines():
+        match = LINE_PATTERN.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append({
+                "name": name,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": len(indent) // 2
+            })
+    if result.returncode != 0:
+        print(result.stderr.splitlines()[-1] if result.stderr else "import failed", file=sys.stderr)
+    return entries, result.returncode
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="app.main")
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    entries, returncode = collect(args.module)
+    if not entries:
+        sys.exit(returncode or 1)
+
+    top_level = [e for e in entries if e["depth"] == 0]
+    total_ms = sum(e["cumulative_us"] for e in top_level) / 1000
+
+    # Self time summed per root package shows what each dependency costs,
+    # wherever in the tree it was first imported
+    by_package = {}
+    for entry in entries:
+        package = entry["name"].split(".")[0]
+        by_package[package] = by_package.get(package, 0) + entry["self_us"]
+
+    print(f"Import cost by package ({args.module}):")
+    for package, self_us in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {self_us / 1000:9.1f} ms  {package}")
+
+    print("\nApplication modules:")
+    for entry in sorted(
+        (e for e in entries if e["name"].startswith("app.")),
+        key=lambda e: e["cumulative_us"],
+        reverse=True
+    ):
+        print(f"  {entry['cumulative_us'] / 1000:9.1f} ms  {entry['name']}")
+
+    imported = {e["name"] for e in entries}
+    eager_heavy = [name for name in HEAVY_MODULES if name in imported]
+    print(f"\nTotal: {total_ms:.1f} ms")
+    print(f"Heavy modules imported eagerly: {', '.join(eager_heavy) or 'none'}")
+
+    failed = bool(eager_heavy)
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"Import time {total_ms:.1f} ms exceeds budget of {args.budget_ms:.1f} ms")
+        failed = True
+    sys.exit(1 if failed or returncode else 0)
+
+
+if __name__ == "__main__":
+    main()
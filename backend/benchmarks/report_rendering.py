@@ -0,0 +1,129 @@
+# backend/benchmarks/report_rendering.py
+"""Measure PDF report rendering throughput (reports per second per core).
+
+Run from the backend directory:
+    python benchmarks/report_rendering.py [--reports 200] [--processes 2] [--symptoms 6]
+
+Modes:
+    legacy   the previous path: styles rebuilt and doc.build run per
+             report, in this process
+    inline   render_pdf in this process (warm styles)
+    pool     render_pdf through RenderPool with --processes warm workers
+Reports have the blocks MultilingualReportGenerator.create_pdf_report
+builds. Translation is not measured: blocks are pre-translated, as they
+are when they reach the pool.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.report_renderer import RenderPool, render_pdf, register_fonts
+
+MODES = ("legacy", "inline", "pool")
+
+
+def make_blocks(symptom_count):
+    names = [f"symptom {i}" for i in range(symptom_count)]
+    values = [(i * 3) % 10 + 1 for i in range(symptom_count)]
+    symptoms = "Based on your reported symptoms:\n" + "".join(
+        f"- {name}: {value}/10 intensity 80% confidence\n" for name, value in zip(names, values)
+    )
+    return [
+        ("title", "Medical Consultation Report"),
+        ("text", "Consultation ID: 6f1a97d8-0240-49a2-ae0e-b6a0699b3ca0"),
+        ("text", "Date: 2024-01-01 10:00"),
+        ("spacer", 20),
+        ("section", "Patient Information"),
+        ("text", "Name: Asha Verma"),
+        ("text", "Age: 34"),
+        ("text", "Gender: Female"),
+        ("text", "Height: 162 cm"),
+        ("text", "Weight: 58 kg"),
+        ("spacer", 10),
+        ("section", "Diagnosis Summary"),
+        ("text", symptoms),
+        ("spacer", 10),
+        ("disclaimer", "This is an AI-generated pre-diagnosis report and should not be considered "
+                       "as a replacement for professional medical advice.")
+    ]
+
+
+def render_legacy(blocks):
+    """The pre-pool rendering path, kept here as the baseline."""
+    from io import BytesIO
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import letter
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='CustomTitle', parent=styles['Heading1'], fontSize=24, spaceAfter=30,
+                              textColor=colors.HexColor('#1976d2'), fontName="Helvetica"))
+    styles.add(ParagraphStyle(name='SectionTitle', parent=styles['Heading2'], fontSize=18, spaceAfter=12,
+                              textColor=colors.HexColor('#1976d2'), fontName="Helvetica"))
+    styles.add(ParagraphStyle(name='NormalMulti', parent=styles['Normal'], fontName="Helvetica"))
+    style_names = {"title": "CustomTitle", "section": "SectionTitle", "text": "NormalMulti", "disclaimer": "NormalMulti"}
+
+    story = []
+    for block in blocks:
+        if block[0] == "spacer":
+            story.append(Spacer(1, block[1]))
+        else:
+            story.append(Paragraph(block[1], styles[style_names[block[0]]]))
+
+    buffer = BytesIO()
+    SimpleDocTemplate(buffer, pagesize=letter, rightMargin=72, leftMargin=72,
+                      topMargin=72, bottomMargin=72).build(story)
+    return buffer.getvalue()
+
+
+async def run_pool(blocks, reports, processes):
+    pool = RenderPool(processes)
+    await pool.warm()
+    started = time.perf_counter()
+    await asyncio.gather(*[pool.render_pdf("en", blocks) for _ in range(reports)])
+    elapsed = time.perf_counter() - started
+    pool.shutdown()
+    return elapsed
+
+
+def run(mode, blocks, reports, processes):
+    """Return (wall seconds, cores used) for rendering the reports."""
+    if mode == "pool":
+        return asyncio.run(run_pool(blocks, reports, processes)), processes
+    render = render_legacy if mode == "legacy" else render_pdf
+    args = (blocks,) if mode == "legacy" else ("en", blocks)
+    render(*args)  # warm imports, fonts and styles
+    started = time.perf_counter()
+    for _ in range(reports):
+        render(*args)
+    return time.perf_counter() - started, 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=200)
+    parser.add_argument("--processes", type=int, default=2)
+    parser.add_argument("--symptoms", type=int, default=6)
+    args = parser.parse_args()
+
+    register_fonts()
+    blocks = make_blocks(args.symptoms)
+    print(f"{args.reports} reports, {args.symptoms} symptoms each, {os.cpu_count()} CPUs\n")
+    print(f"{'mode':<8} {'cores':>5} {'ms/report':>10} {'reports/s':>10} {'per core':>9}")
+
+    for mode in MODES:
+        elapsed, cores = run(mode, blocks, args.reports, args.processes)
+        per_second = args.reports / elapsed
+        print(
+            f"{mode:<8} {cores:>5} {elapsed / args.reports * 1000 * cores:>10.1f} "
+            f"{per_second:>10.1f} {per_second / cores:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# backend/benchmarks/sentence_segmentation.py
+"""Check sentence boundaries and time the segmenter used for incremental TTS.
+
+Run from the backend directory:
+    python benchmarks/sentence_segmentation.py [--iterations 2000]
+
+Each labeled reply is split with min_chars=1 so that only boundary
+detection is measured, not the merging of short fragments.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.sentence_segmenter import split_sentences
+
+# (reply text, expected sentences)
+LABELED_REPLIES = [
+    ("Take vitamin C. It helps with recovery a lot.",
+     ["Take vitamin C.", "It helps with recovery a lot."]),
+    ("Rate your pain from 1 to 9. Then tell me where it hurts.",
+     ["Rate your pain from 1 to 9.", "Then tell me where it hurts."]),
+    ("Take 2.5 mg. Rest well and drink water!",
+     ["Take 2.5 mg.", "Rest well and drink water!"]),
+    ("Please see Dr. Sharma tomorrow. Is the pain worse at night?",
+     ["Please see Dr. Sharma tomorrow.", "Is the pain worse at night?"]),
+    ("Your temperature of 38.5 is a mild fever. Drink fluids, e.g. water or soup.",
+     ["Your temperature of 38.5 is a mild fever.", "Drink fluids, e.g. water or soup."]),
+    ("Is there any pain? No. Then rest for a day.",
+     ["Is there any pain?", "No.", "Then rest for a day."]),
+    ("मुझे बुखार है। सिर में दर्द है।",
+     ["मुझे बुखार है।", "सिर में दर्द है।"]),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    correct = 0
+    latencies = []
+    for text, expected in LABELED_REPLIES:
+        actual = split_sentences(text, min_chars=1)
+        if actual == expected:
+            correct += 1
+        else:
+            print(f"MISMATCH {text!r}: {actual}")
+        for _ in range(args.iterations):
+            start = time.perf_counter()
+            split_sentences(text)
+            latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e6
+    print(f"correct={correct}/{len(LABELED_REPLIES)}  p50={p50:,.1f}us  p99={p99:,.1f}us  samples={len(latencies)}")
+
+
+if __name__ == "__main__":
+    main()
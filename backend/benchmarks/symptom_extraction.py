@@ -0,0 +1,110 @@
+# backend/benchmarks/symptom_extraction.py
+"""Compare recall and latency of the symptom lexicon against the clinical NER model.
+
+Run from the backend directory:
+    python benchmarks/symptom_extraction.py [--iterations 200]
+
+The NER half is skipped when transformers/torch are not installed.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.symptom_lexicon import SymptomLexicon
+
+# (patient message, expected canonical symptoms)
+LABELED_MESSAGES = [
+    ("I have had a severe headache for 3 days", {"headache"}),
+    ("My chest pain is 9/10 since yesterday and I feel short of breath", {"chest pain", "shortness of breath"}),
+    ("Fever and dry cough, it comes and goes", {"fever", "cough"}),
+    ("I feel dizzy every morning and very tired", {"dizziness", "fatigue"}),
+    ("Stomach ache after eating, also nausea", {"abdominal pain", "nausea"}),
+    ("There is a rash on my arm and it is itchy", {"rash", "itching"}),
+    ("Lower back pain for two weeks, mild", {"back pain"}),
+    ("I threw up twice and have loose motions", {"vomiting", "diarrhea"}),
+    ("Sore throat and runny nose since last night", {"sore throat", "runny nose"}),
+    ("My knee pain gets worse at night", {"joint pain"}),
+    ("I fainted this morning and was confused afterwards", {"fainting", "confusion"}),
+    ("Burning when urinating and frequent urination", {"painful urination", "frequent urination"}),
+    ("No fever, but my ears hurt, earache for a day", {"ear pain"}),
+    ("I can't sleep and I am anxious all the time", {"insomnia", "anxiety"}),
+    ("Palpitations and heart racing when I climb stairs", {"palpitations"}),
+    ("Numbness and tingling in my left hand", {"numbness"}),
+]
+
+
+def _time_call(fn, text, iterations):
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn(text)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _recall(predicted, expected):
+    hits = sum(1 for name in expected if name in predicted)
+    return hits, len(expected)
+
+
+def benchmark_lexicon(iterations):
+    lexicon = SymptomLexicon()
+    hits = total = 0
+    latencies = []
+    for text, expected in LABELED_MESSAGES:
+        predicted = {symptom["name"] for symptom in lexicon.extract(text)}
+        h, t = _recall(predicted, expected)
+        hits, total = hits + h, total + t
+        latencies.extend(_time_call(lexicon.extract, text, iterations))
+    return hits / total, latencies
+
+
+def benchmark_ner(iterations):
+    try:
+        from transformers import pipeline
+    except ImportError:
+        return None, None
+
+    ner = pipeline("ner", model="samrawal/bert-base-uncased_clinical-ner", aggregation_strategy="simple")
+    hits = total = 0
+    latencies = []
+    for text, expected in LABELED_MESSAGES:
+        words = " ".join(
+            entity["word"].lower() for entity in ner(text) if "PROBLEM" in entity["entity_group"]
+        )
+        # NER returns spans rather than canonical names, so count a hit when any
+        # canonical word of the expected symptom shows up in a predicted span
+        predicted = {name for name in expected if any(part in words for part in name.split())}
+        h, t = _recall(predicted, expected)
+        hits, total = hits + h, total + t
+        latencies.extend(_time_call(ner, text, max(1, iterations // 20)))
+    return hits / total, latencies
+
+
+def _report(label, recall, latencies):
+    if recall is None:
+        print(f"{label:<8} skipped (transformers not installed)")
+        return
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies) * 1e6
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1e6
+    print(f"{label:<8} recall={recall:.2%}  p50={p50:,.1f}us  p99={p99:,.1f}us  samples={len(latencies)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--skip-ner", action="store_true")
+    args = parser.parse_args()
+
+    _report("lexicon", *benchmark_lexicon(args.iterations))
+    if not args.skip_ner:
+        _report("ner", *benchmark_ner(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# backend/benchmarks/worker_memory.py
+"""Measure total memory of the gunicorn launcher for different worker counts.
+
+Run from the backend directory (Linux only, needs gunicorn and the model deps):
+    python benchmarks/worker_memory.py [--workers 1 8] [--port 8765]
+
+For each worker count the launcher is started with and without model preloading,
+every worker is given time to warm up, and the RSS and PSS of the master plus
+workers are summed. RSS double-counts pages shared copy-on-write; PSS divides
+shared pages between the processes and is the number to compare.
+"""
+import argparse
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _children(pid):
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return [int(child) for child in f.read().split()]
+    except FileNotFoundError:
+        return []
+
+
+def _memory_kb(pid):
+    """Return (rss_kb, pss_kb) for a process from smaps_rollup."""
+    values = {"Rss:": 0, "Pss:": 0}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                key = line.split()[0]
+                if key in values:
+                    values[key] = int(line.split()[1])
+    except FileNotFoundError:
+        pass
+    return values["Rss:"], values["Pss:"]
+
+
+def _wait_ready(port, workers, timeout):
+    """Poll /ready until enough consecutive successes suggest all workers are warm."""
+    deadline = time.time() + timeout
+    streak = 0
+    while time.time() < deadline:
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/ready", timeout=5) as response:
+                streak = streak + 1 if response.status == 200 else 0
+        except Exception:
+            streak = 0
+        if streak >= workers * 4:
+            return True
+        time.sleep(0.25)
+    return False
+
+
+def measure(workers, preload, port, timeout):
+    env = dict(os.environ, WEB_CONCURRENCY=str(workers), PRELOAD_MODELS="1" if preload else "0",
+               BIND=f"127.0.0.1:{port}", LOG_LEVEL="warning")
+    master = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "app.main:app"],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        ready = _wait_ready(port, workers, timeout)
+        pids = [master.pid] + _children(master.pid)
+        rss, pss = zip(*(_memory_kb(pid) for pid in pids))
+        return {
+            "workers": workers,
+            "preload": preload,
+            "ready": ready,
+            "processes": len(pids),
+            "rss_mb": sum(rss) / 1024,
+            "pss_mb": sum(pss) / 1024
+        }
+    finally:
+        master.send_signal(signal.SIGTERM)
+        master.wait(timeout=60)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=600)
+    args = parser.parse_args()
+
+    print(f"{'workers':>7} {'preload':>7} {'ready':>5} {'procs':>5} {'total RSS MB':>13} {'total PSS MB':>13}")
+    for workers in args.workers:
+        for preload in (False, True):
+            result = measure(workers, preload, args.port, args.timeout)
+            print(f"{result['workers']:>7} {str(result['preload']):>7} {str(result['ready']):>5} "
+                  f"{result['processes']:>5} {result['rss_mb']:>13.1f} {result['pss_mb']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# backend/benchmarks/ws_protocol.py
+"""Compare bytes on the wire and server CPU per chat turn by frame protocol.
+
+Run from the backend directory:
+    python benchmarks/ws_protocol.py [--turns 500] [--segments 4] [--segment-kb 24]
+
+One turn is the reply frame plus one audio_segment frame per sentence.
+Modes:
+    json-base64  JSON frames with the audio base64-encoded inline (the old protocol)
+    json-url     JSON frames carrying audio URLs; the audio is then fetched
+                 over HTTP, and those body bytes are counted too
+    msgpack      MessagePack frames with the audio bytes inline
+CPU is process time spent building and encoding frames on the server.
+"""
+import argparse
+import asyncio
+import base64
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.ws_protocol import FrameCodec, MessagePackCodec
+
+MODES = ("json-base64", "json-url", "msgpack")
+
+
+class CountingSocket:
+    """Stands in for a WebSocket and counts the payload bytes sent."""
+
+    def __init__(self):
+        self.bytes_sent = 0
+        self.frames = 0
+
+    async def send_text(self, data):
+        self.bytes_sent += len(data.encode())
+        self.frames += 1
+
+    async def send_bytes(self, data):
+        self.bytes_sent += len(data)
+        self.frames += 1
+
+
+def make_turn(segments, segment_bytes):
+    reply = {
+        "status": "success",
+        "message": "Based on your symptoms, this looks like a viral fever. Please rest and drink plenty of fluids.",
+        "original_message": "Based on your symptoms, this looks like a viral fever.",
+        "confidence_scores": {"overall": 0.92, "medical": 0.9},
+        "requires_emergency": False,
+        "language": {"source": "hi", "target": "hi", "detected": None},
+        "audio_url": None,
+        "audio_streaming": True,
+        "symptoms": ["fever", "headache"],
+        "recommendations": {"medications": [], "homeRemedies": ["rest", "fluids"]},
+        "timestamp": "2024-01-01T00:00:00"
+    }
+    audio = [os.urandom(segment_bytes) for _ in range(segments)]
+    return reply, audio
+
+
+async def send_turn(mode, socket, reply, audio):
+    """Encode and send one turn; returns extra HTTP body bytes for URL mode."""
+    codec = MessagePackCodec() if mode == "msgpack" else FrameCodec()
+    await codec.send(socket, reply)
+    fetched = 0
+    for index, content in enumerate(audio):
+        frame = {
+            "type": "audio_segment",
+            "index": index,
+            "total": len(audio),
+            "text": "Please rest and drink plenty of fluids.",
+            "audio_url": f"/api/audio/{'0' * 64}.mp3",
+            "language": "hi",
+            "final": index == len(audio) - 1,
+            "error": None
+        }
+        if mode == "json-base64":
+            frame["audio"] = base64.b64encode(content).decode()
+        elif mode == "msgpack":
+            frame["audio"] = content
+        else:
+            fetched += len(content)
+        await codec.send(socket, frame)
+    return fetched
+
+
+async def run(mode, turns, reply, audio):
+    socket = CountingSocket()
+    fetched = 0
+    cpu_start = time.process_time()
+    for _ in range(turns):
+        fetched += await send_turn(mode, socket, reply, audio)
+    cpu = time.process_time() - cpu_start
+    return {
+        "bytes_per_turn": (socket.bytes_sent + fetched) / turns,
+        "frames_per_turn": socket.frames / turns,
+        "cpu_us_per_turn": cpu / turns * 1e6
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=500)
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument("--segment-kb", type=int, default=24, help="MP3 bytes per sentence (~3 s at 64 kbps)")
+    args = parser.parse_args()
+
+    reply, audio = make_turn(args.segments, args.segment_kb * 1024)
+    audio_bytes = sum(len(content) for content in audio)
+    print(f"{args.turns} turns, {args.segments} segments, {audio_bytes} audio bytes per turn\n")
+    print(f"{'mode':<12} {'bytes/turn':>12} {'overhead':>9} {'frames':>7} {'cpu us/turn':>12}")
+
+    for mode in MODES:
+        result = asyncio.run(run(mode, args.turns, reply, audio))
+        overhead = result["bytes_per_turn"] / audio_bytes - 1
+        print(
+            f"{mode:<12} {result['bytes_per_turn']:>12.0f} {overhead:>8.1%} "
+            f"{result['frames_per_turn']:>7.0f} {result['cpu_us_per_turn']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
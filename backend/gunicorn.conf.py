@@ -0,0 +1,63 @@
+# backend/gunicorn.conf.py
+"""Production launcher: gunicorn master with uvicorn workers.
+
+    cd backend && gunicorn -c gunicorn.conf.py app.main:app
+
+The app and the read-only models are loaded once in the master before workers
+are forked, so every worker shares the model weights copy-on-write instead of
+holding its own copy. Tunables come from the environment:
+
+    WEB_CONCURRENCY          number of workers (default 2)
+    PRELOAD_MODELS           load models in the master before forking (default 1)
+    MODEL_THREADS_PER_WORKER torch intra-op threads per worker (default 1)
+    MAX_REQUESTS             recycle a worker after this many requests (default 2000)
+    MAX_REQUESTS_JITTER      random spread so workers do not recycle together (default 200)
+    GRACEFUL_TIMEOUT         seconds a recycled worker gets to finish requests (default 30)
+"""
+import gc
+import os
+import sys
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# Load app.main in the master so imports are shared by all workers. The
+# Mongo client is created with connect=False and only connects (and
+# creates indexes) in each worker's lifespan, after the fork
+preload_app = True
+
+# Graceful recycling bounds memory growth from fragmentation in long-lived workers
+max_requests = int(os.getenv("MAX_REQUESTS", "2000"))
+max_requests_jitter = int(os.getenv("MAX_REQUESTS_JITTER", "200"))
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+timeout = int(os.getenv("WORKER_TIMEOUT", "120"))
+keepalive = 5
+
+loglevel = os.getenv("LOG_LEVEL", "info")
+accesslog = "-"
+
+
+def on_starting(server):
+    """Load model weights in the master before any worker is forked."""
+    if os.getenv("PRELOAD_MODELS", "1") != "1":
+        return
+
+    from app.utils.model_registry import preload_models
+
+    state = preload_models()
+    server.log.info(f"Preloaded models in master: {state.timings}")
+
+    # Move everything allocated so far out of the collector's reach so that
+    # gc passes in the workers do not write to (and un-share) those pages
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    """Keep workers from oversubscribing cores with torch thread pools."""
+    if "torch" in sys.modules:
+        sys.modules["torch"].set_num_threads(int(os.getenv("MODEL_THREADS_PER_WORKER", "1")))
+
+
+def worker_exit(server, worker):
+    server.log.info(f"Worker {worker.pid} exited")
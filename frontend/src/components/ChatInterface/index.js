@@ -94,6 +94,10 @@ const ChatInterface = () => {
   const mediaRecorderRef = useRef(null);
   const audioChunksRef = useRef([]);
   const audioPlayerRef = useRef(null);
+  // Reply audio plays one clip at a time, in arrival order
+  const audioQueueRef = useRef([]);
+  // Per turn: index of the next segment to queue and segments that arrived early
+  const audioSegmentsRef = useRef({});
   const [selectedLanguage, setSelectedLanguage] = useState('en');
   const [autoDetectLanguage, setAutoDetectLanguage] = useState(true);
   const [showOriginalText, setShowOriginalText] = useState(false);
@@ -181,8 +185,74 @@ const ChatInterface = () => {
     }
   }, []);
   
+  const voicePreferencesRef = useRef(voicePreferences);
   useEffect(() => {
-    const wsUrl = `${process.env.REACT_APP_WS_URL || 'ws://localhost:8000'}/ws/${consultationId}`;
+    voicePreferencesRef.current = voicePreferences;
+  }, [voicePreferences]);
+
+  const playNextAudio = async () => {
+    if (audioPlayerRef.current) return;
+    const url = audioQueueRef.current.shift();
+    if (!url) return;
+
+    const audio = new Audio(url);
+    audio.playbackRate = voicePreferencesRef.current.speed;
+    // Advance once per clip, whether it ends, errors or is refused by the browser
+    const advance = () => {
+      if (audioPlayerRef.current !== audio) return;
+      audioPlayerRef.current = null;
+      playNextAudio();
+    };
+    audio.onended = advance;
+    audio.onerror = advance;
+    audioPlayerRef.current = audio;
+    try {
+      await audio.play();
+    } catch (error) {
+      console.error('Error playing audio:', error);
+      advance();
+    }
+  };
+
+  const enqueueAudio = (url) => {
+    if (!voicePreferencesRef.current.enabled) return;
+    audioQueueRef.current.push(url);
+    playNextAudio();
+  };
+
+  // Segments can arrive out of order; queue them by index and attach them to their turn's message
+  const handleAudioSegment = (data) => {
+    const turn = audioSegmentsRef.current[data.turn_id] || { next: 0, pending: {} };
+    audioSegmentsRef.current[data.turn_id] = turn;
+    if (data.index !== undefined && data.index !== null) {
+      turn.pending[data.index] = data.audio_url ? `${process.env.REACT_APP_API_URL}${data.audio_url}` : null;
+    }
+
+    const ready = [];
+    while (turn.next in turn.pending) {
+      const url = turn.pending[turn.next];
+      delete turn.pending[turn.next];
+      turn.next += 1;
+      if (url) ready.push(url);
+    }
+
+    if (ready.length) {
+      setMessages(prev => prev.map(msg => msg.turnId !== data.turn_id ? msg : {
+        ...msg,
+        audio: msg.audio || ready[0],
+        audioSegments: [...(msg.audioSegments || []), ...ready]
+      }));
+      ready.forEach(enqueueAudio);
+    }
+    // The final frame may arrive before earlier segments; keep state until they are queued
+    if (data.final && (data.index === undefined || data.index === null || turn.next > data.index)) {
+      delete audioSegmentsRef.current[data.turn_id];
+    }
+  };
+
+  useEffect(() => {
+    // audio=segments: this client plays per-sentence audio_segment frames
+    const wsUrl = `${process.env.REACT_APP_WS_URL || 'ws://localhost:8000'}/ws/${consultationId}?audio=segments`;
     console.log('Connecting to WebSocket:', wsUrl);
     
     const ws = new WebSocket(wsUrl);
@@ -195,9 +265,32 @@ const ChatInterface = () => {
     ws.onmessage = async (event) => {
       try {
         const data = JSON.parse(event.data);
+
+        // Results of stages deferred past the turn deadline update their turn's message
+        if (data.type === 'follow_up') {
+          if (!data.result) return;
+          if (data.result.audio_url) {
+            enqueueAudio(`${process.env.REACT_APP_API_URL}${data.result.audio_url}`);
+          }
+          setMessages(prev => prev.map(msg => msg.turnId !== data.turn_id ? msg : {
+            ...msg,
+            audio: data.result.audio_url ? `${process.env.REACT_APP_API_URL}${data.result.audio_url}` : msg.audio,
+            analysis: {
+              ...msg.analysis,
+              recommendations: { ...msg.analysis.recommendations, ...data.result.recommendations }
+            }
+          }));
+          return;
+        }
+
+        if (data.type === 'audio_segment') {
+          handleAudioSegment(data);
+          return;
+        }
         
         setMessages(prev => [...prev, {
           type: data.type || 'bot',
+          turnId: data.turn_id,
           content: data.content,
           originalContent: data.original_message,
           translatedContent: data.translated_message,
@@ -208,7 +301,7 @@ const ChatInterface = () => {
             confidence: data.language?.confidence
           },
           timestamp: new Date(data.timestamp || Date.now()),
-          audio: data.audio,
+          audio: data.audio_url && `${process.env.REACT_APP_API_URL}${data.audio_url}`,
           analysis: {
             symptoms: data.symptoms || [],
             confidence: data.confidence_scores?.overall,
@@ -218,15 +311,8 @@ const ChatInterface = () => {
           }
         }]);
     
-        if (data.audio && voicePreferences.enabled) {
-          const audio = new Audio(`data:audio/mp3;base64,${data.audio}`);
-          audio.playbackRate = voicePreferences.speed;
-          audioPlayerRef.current = audio;
-          try {
-            await audio.play();
-          } catch (error) {
-            console.error('Error playing audio:', error);
-          }
+        if (data.audio_url) {
+          enqueueAudio(`${process.env.REACT_APP_API_URL}${data.audio_url}`);
         }
       } catch (error) {
         console.error('Error processing message:', error);
@@ -247,8 +333,11 @@ const ChatInterface = () => {
     setWsInstance(ws);
 
     return () => {
+      audioQueueRef.current = [];
+      audioSegmentsRef.current = {};
       if (audioPlayerRef.current) {
         audioPlayerRef.current.pause();
+        audioPlayerRef.current = null;
       }
       if (ws) {
         ws.close();
@@ -351,7 +440,7 @@ const ChatInterface = () => {
         confidence: data.language?.confidence || 1
       },
       timestamp: new Date(data.timestamp || Date.now()),
-      audio: data.audio,
+      audio: data.audio_url && `${process.env.REACT_APP_API_URL}${data.audio_url}`,
       analysis: {
         symptoms: data.symptoms || [],
         confidence: data.confidence_scores?.overall || 1,